@@ -0,0 +1,257 @@
+"""
+Helpers shared by the benchmark scripts.
+
+It provides:
+- Timing statistics over repeated calls
+- Peak memory of the current process
+- Isolated runs of a benchmark in a fresh interpreter
+- JSON results with the environment they were measured in
+- Comparison of results against a saved baseline
+
+A baseline is simply the JSON output of a previous run. The numeric
+values found at the same path in both files are compared, except counts,
+sizes and the noisier timing statistics (mean, min and max); times and
+memory regress when they grow, throughputs and accuracies when they shrink.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from statistics import mean, median
+from time import perf_counter
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+#: Root of the repository, used to run the benchmarks as modules.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#: Key fragments of the metrics for which a higher value is better.
+HIGHER_IS_BETTER = ("throughput", "accuracy", "per_second", "speedup")
+
+#: Prefix of the counts, which are recorded but never compared.
+COUNT_PREFIX = "n_"
+
+#: Other keys of values that are recorded but never compared.
+NOT_COMPARED = ("size_bytes", "cpu_count")
+
+#: Timing statistics too noisy to be compared; median and p95 are.
+NOISY_STATISTICS = ("mean", "min", "max")
+
+
+def peak_rss_mb():
+    """
+    Return the peak resident set size of the current process in MiB.
+
+    :return: Peak RSS, or None when the platform does not report it.
+    :rtype: float | None
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    if sys.platform == "darwin":
+        return peak / 1024 ** 2
+    return peak / 1024
+
+
+def summarize(samples):
+    """
+    Summarize timing samples, in seconds.
+
+    :return: Number of samples, mean, median, 95th percentile, min and max.
+    :rtype: dict
+    """
+    ordered = sorted(samples)
+    return {
+        "n_samples": len(ordered),
+        "mean": mean(ordered),
+        "median": median(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def time_calls(function, arguments):
+    """
+    Time one call of ``function`` per argument.
+
+    :return: Timing summary (see :func:`summarize`).
+    :rtype: dict
+    """
+    samples = []
+    for argument in arguments:
+        start = perf_counter()
+        function(argument)
+        samples.append(perf_counter() - start)
+    return summarize(samples)
+
+
+def run_isolated(module, *args):
+    """
+    Run a benchmark module in a fresh interpreter and return its JSON output.
+
+    The module must print a single JSON document on its last output line,
+    so measurements such as import time or peak memory are not affected by
+    the parent process.
+
+    :param module: Module name, e.g. ``"benchmarks.inference"``.
+    :type module: str
+    :return: Decoded JSON document.
+    :rtype: dict | list | float
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+
+    completed = subprocess.run(
+        [sys.executable, "-m", module, *map(str, args)],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def environment():
+    """
+    Describe the environment the benchmarks run in.
+
+    :rtype: dict
+    """
+    import numpy
+    import sklearn
+    import mlconjug3
+
+    return {
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "mlconjug3_version": mlconjug3.__version__,
+        "numpy_version": numpy.__version__,
+        "sklearn_version": sklearn.__version__,
+    }
+
+
+def write_results(path, results):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _flatten(results, prefix=""):
+    """
+    Yield the numeric values of nested results with their dotted path.
+    """
+    if isinstance(results, dict):
+        for key, value in results.items():
+            yield from _flatten(value, f"{prefix}{key}.")
+    elif isinstance(results, (int, float)) and not isinstance(results, bool):
+        yield prefix[:-1], results
+
+
+def compare(results, baseline, tolerance=0.1):
+    """
+    Compare results against a baseline.
+
+    :param results: Results of the current run.
+    :type results: dict
+    :param baseline: Results of the baseline run.
+    :type baseline: dict
+    :param tolerance: Relative change tolerated before a metric is
+        reported as a regression.
+    :type tolerance: float
+    :return: One entry per metric found in both runs, with the baseline
+        and current values, the relative change and a ``regression`` flag.
+    :rtype: list of dict
+    """
+    previous = dict(_flatten(baseline))
+    comparison = []
+
+    for path, value in _flatten(results):
+        name = path.rsplit(".", 1)[-1]
+        if (
+            path not in previous
+            or name in NOISY_STATISTICS
+            or name in NOT_COMPARED
+            or name.startswith(COUNT_PREFIX)
+        ):
+            continue
+
+        reference = previous[path]
+        change = (value - reference) / reference if reference else 0.0
+        higher_is_better = any(part in path for part in HIGHER_IS_BETTER)
+        regression = -change > tolerance if higher_is_better else change > tolerance
+
+        comparison.append({
+            "metric": path,
+            "baseline": reference,
+            "current": value,
+            "change": change,
+            "regression": regression,
+        })
+
+    return comparison
+
+
+def report_comparison(comparison):
+    """
+    Print a comparison and return the number of regressions.
+
+    :rtype: int
+    """
+    regressions = [entry for entry in comparison if entry["regression"]]
+
+    for entry in comparison:
+        flag = "REGRESSION" if entry["regression"] else ""
+        print(
+            f"{entry['metric']:<60} {entry['baseline']:>12.6g} -> "
+            f"{entry['current']:>12.6g} ({entry['change']:+.1%}) {flag}"
+        )
+
+    print(f"\n{len(regressions)} regression(s) out of {len(comparison)} metrics.")
+    return len(regressions)
+
+
+def add_output_arguments(parser):
+    """
+    Add the output and baseline options shared by the benchmarks.
+    """
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file.")
+    parser.add_argument(
+        "-b", "--baseline",
+        help="Compare the results with this JSON file and exit with status 1 on regression.",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1,
+        help="Relative change tolerated before a metric regresses (default: 0.1).",
+    )
+
+
+def finish(args, results):
+    """
+    Write the results and compare them with the baseline, if requested.
+
+    :return: Exit status, 1 if a metric regressed.
+    :rtype: int
+    """
+    if args.output:
+        write_results(args.output, results)
+
+    if args.baseline:
+        comparison = compare(results, load_results(args.baseline), args.tolerance)
+        if report_comparison(comparison):
+            return 1
+
+    return 0
@@ -0,0 +1,99 @@
+"""
+Benchmark the hashing vectorizer mode against the default vocabulary mode.
+
+For each language, a model is trained on the training split of the
+dataset with the default CountVectorizer and with a HashingVectorizer for
+several numbers of hashed features. The script reports, for each model:
+
+- The accuracy on the held-out split
+- The training time
+- The size of the pickled model and the time needed to load it
+
+Usage:
+
+    python benchmarks/hashing.py -l fr -l en -n 11 -n 12 -n 14 -o hashing.json
+"""
+
+import argparse
+import json
+import pickle
+import warnings
+from time import perf_counter
+
+import numpy as np
+from sklearn.exceptions import ConvergenceWarning
+
+from mlconjug3 import DataSet, Model, Verbiste
+
+
+def benchmark_model(model, dataset):
+    """
+    Train a model on the training split and measure it.
+
+    :return: Accuracy, training time, pickled size and load time.
+    :rtype: dict
+    """
+    start = perf_counter()
+    model.train(dataset.train_input, dataset.train_labels)
+    train_time = perf_counter() - start
+
+    predictions = model.predict(dataset.test_input)
+    accuracy = float(np.mean(predictions == dataset.test_labels))
+
+    payload = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+    start = perf_counter()
+    pickle.loads(payload)
+    load_time = perf_counter() - start
+
+    return {
+        "accuracy": accuracy,
+        "train_time": train_time,
+        "size_bytes": len(payload),
+        "load_time": load_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "-l", "--language", dest="languages", action="append",
+        help="Language to benchmark, can be repeated (default: fr).",
+    )
+    parser.add_argument(
+        "-n", "--bits", action="append", type=int,
+        help="log2 of the number of hashed features, can be repeated (default: 12).",
+    )
+    parser.add_argument("--split", type=float, default=0.8, help="Training proportion.")
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file.")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=ConvergenceWarning)
+
+    results = {}
+
+    for lang in args.languages or ["fr"]:
+        dataset = DataSet(Verbiste(language=lang).verbs)
+        dataset.split_data(proportion=args.split)
+
+        configurations = {"vocabulary": Model(language=lang)}
+        for bits in args.bits or [12]:
+            configurations[f"hashing-2^{bits}"] = Model(language=lang, n_features=2 ** bits)
+
+        results[lang] = {}
+        for name, model in configurations.items():
+            result = benchmark_model(model, dataset)
+            results[lang][name] = result
+            print(
+                f"{lang} {name:>16}: accuracy={result['accuracy']:.4f} "
+                f"train={result['train_time']:.2f}s "
+                f"size={result['size_bytes'] / 1024 ** 2:.1f}MiB "
+                f"load={result['load_time'] * 1000:.1f}ms"
+            )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
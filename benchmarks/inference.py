@@ -0,0 +1,195 @@
+"""
+Benchmark the inference path of the Conjugator.
+
+For each language, the following are measured in a fresh interpreter, so
+cold start figures and peak memory are not affected by other languages:
+
+- The time needed to construct ``Conjugator(lang)``
+- The time of the first conjugation, which loads the remaining lazy state
+- The latency of single verbs found in the dictionary
+- The latency of single unknown verbs, conjugated by the model
+- The throughput of ``Conjugator.conjugate`` on lists of several sizes
+- The peak RSS of the process
+
+The time needed to ``import mlconjug3`` is measured separately, also in
+fresh interpreters. The LRU cache of ``Conjugator._conjugate`` is bypassed
+for single verbs and cleared before each list, so every verb is actually
+conjugated.
+
+Usage:
+
+    python -m benchmarks.inference -l fr -l en -o inference.json
+    python -m benchmarks.inference -l fr -b inference.json
+"""
+
+import argparse
+import json
+import random
+import sys
+from time import perf_counter
+
+from benchmarks.common import (
+    add_output_arguments,
+    environment,
+    finish,
+    peak_rss_mb,
+    run_isolated,
+    summarize,
+    time_calls,
+)
+
+MODULE = "benchmarks.inference"
+
+
+def measure_import():
+    """
+    Return the time needed to import mlconjug3 in this interpreter.
+    """
+    start = perf_counter()
+    import mlconjug3  # noqa: F401
+
+    return perf_counter() - start
+
+
+def sample_verbs(conjugator, n_verbs, seed):
+    """
+    Sample verbs of the dictionary and unknown verbs with the same endings.
+
+    Unknown verbs are made by prefixing known verbs, so they keep the
+    ending the model relies on.
+
+    :return: Dictionary verbs and unknown verbs.
+    :rtype: tuple
+    """
+    known = sorted(conjugator.conjug_manager.verbs)
+    rng = random.Random(seed)
+    dictionary_verbs = rng.sample(known, min(n_verbs, len(known)))
+
+    unknown_verbs = []
+    for verb in rng.sample(known, min(n_verbs, len(known))):
+        candidate = "zz" + verb
+        if candidate not in conjugator.conjug_manager.verbs:
+            unknown_verbs.append(candidate)
+
+    return dictionary_verbs, unknown_verbs
+
+
+def measure_language(lang, n_verbs, batch_sizes, seed):
+    """
+    Measure the inference path of one language in this interpreter.
+
+    :return: Measurements of the language.
+    :rtype: dict
+    """
+    from mlconjug3 import Conjugator
+
+    start = perf_counter()
+    conjugator = Conjugator(lang)
+    construction_time = perf_counter() - start
+
+    dictionary_verbs, unknown_verbs = sample_verbs(conjugator, n_verbs, seed)
+
+    def conjugate(verb):
+        return Conjugator._conjugate.__wrapped__(conjugator, verb)
+
+    start = perf_counter()
+    conjugate(unknown_verbs[0])
+    first_call_time = perf_counter() - start
+
+    results = {
+        "construction_time": construction_time,
+        "first_call_time": first_call_time,
+        "dictionary_latency": time_calls(conjugate, dictionary_verbs),
+        "model_latency": time_calls(conjugate, unknown_verbs),
+        "batch": {},
+    }
+
+    # Lists mix dictionary and model verbs.
+    mixed = [verb for pair in zip(dictionary_verbs, unknown_verbs) for verb in pair]
+
+    for size in batch_sizes:
+        verbs = (mixed * (size // len(mixed) + 1))[:size]
+        Conjugator._conjugate.cache_clear()
+
+        start = perf_counter()
+        conjugator.conjugate(verbs)
+        elapsed = perf_counter() - start
+
+        results["batch"][str(size)] = {
+            "time": elapsed,
+            "throughput": size / elapsed,
+        }
+
+    results["n_dictionary_verbs"] = len(dictionary_verbs)
+    results["n_model_verbs"] = len(unknown_verbs)
+    results["peak_rss_mb"] = peak_rss_mb()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "-l", "--language", dest="languages", action="append",
+        help="Language to benchmark, can be repeated (default: all languages).",
+    )
+    parser.add_argument(
+        "-n", "--verbs", type=int, default=200,
+        help="Number of verbs timed on each single-verb path (default: 200).",
+    )
+    parser.add_argument(
+        "--batch-size", dest="batch_sizes", action="append", type=int,
+        help="Size of the lists conjugated at once, can be repeated (default: 10, 100, 1000).",
+    )
+    parser.add_argument(
+        "--imports", type=int, default=5,
+        help="Number of fresh interpreters used to time the import (default: 5).",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the verb sampling.")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    batch_sizes = args.batch_sizes or [10, 100, 1000]
+
+    # Worker mode: measure in this interpreter and print the JSON results.
+    if args.worker == "import":
+        print(json.dumps(measure_import()))
+        return 0
+    if args.worker:
+        print(json.dumps(measure_language(args.worker, args.verbs, batch_sizes, args.seed)))
+        return 0
+
+    results = {"environment": environment(), "languages": {}}
+
+    import_times = [run_isolated(MODULE, "--worker", "import") for _ in range(args.imports)]
+    results["import_time"] = summarize(import_times)
+    print(f"import mlconjug3: median={results['import_time']['median'] * 1000:.0f}ms")
+
+    from mlconjug3.constants import LANGUAGES
+
+    languages = args.languages or [lang for lang in LANGUAGES if lang != "default"]
+
+    for lang in languages:
+        worker_args = ["--worker", lang, "-n", args.verbs, "--seed", args.seed]
+        for size in batch_sizes:
+            worker_args += ["--batch-size", size]
+
+        result = run_isolated(MODULE, *worker_args)
+        results["languages"][lang] = result
+
+        batches = " ".join(
+            f"{size}:{batch['throughput']:.0f}/s" for size, batch in result["batch"].items()
+        )
+        print(
+            f"{lang}: construct={result['construction_time'] * 1000:.0f}ms "
+            f"dictionary={result['dictionary_latency']['median'] * 1e6:.0f}us "
+            f"model={result['model_latency']['median'] * 1e6:.0f}us "
+            f"lists={batches} rss={result['peak_rss_mb']:.0f}MiB"
+        )
+
+    return finish(args, results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
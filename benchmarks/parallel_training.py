@@ -0,0 +1,83 @@
+"""
+Benchmark class-parallel training of the default classifier.
+
+The verbs of each language are vectorized once, then the default
+classifier is fitted on the same feature matrix with an increasing
+number of threads. The one-vs-rest problems are shared out among the
+threads, which all read the same matrix.
+
+The speedup is bounded by the number of cores available and by the
+largest template classes, which are fitted by a single thread each.
+
+Usage:
+
+    python benchmarks/parallel_training.py -l es -j 1 -j 2 -j 4 -j 8 -o parallel.json
+"""
+
+import argparse
+import json
+import os
+import warnings
+from time import perf_counter
+
+from sklearn.exceptions import ConvergenceWarning
+
+from mlconjug3 import DataSet, Model, Verbiste
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "-l", "--language", dest="languages", action="append",
+        help="Language to benchmark, can be repeated (default: fr).",
+    )
+    parser.add_argument(
+        "-j", "--jobs", action="append", type=int,
+        help="Number of threads, can be repeated (default: 1, 2, 4, ... up to the core count).",
+    )
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file.")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=ConvergenceWarning)
+
+    jobs = args.jobs
+    if not jobs:
+        cores = os.cpu_count() or 1
+        jobs = [1]
+        while jobs[-1] * 2 <= cores:
+            jobs.append(jobs[-1] * 2)
+
+    results = {"cpu_count": os.cpu_count(), "languages": {}}
+
+    for lang in args.languages or ["fr"]:
+        dataset = DataSet(Verbiste(language=lang).verbs)
+        features = Model(language=lang).fit_features(dataset.verbs_list)
+        labels = dataset.templates_list
+
+        timings = {}
+        for n_jobs in jobs:
+            classifier = Model(language=lang, n_jobs=n_jobs).pipeline.steps[-1][1]
+            start = perf_counter()
+            classifier.fit(features, labels)
+            timings[n_jobs] = perf_counter() - start
+
+            print(
+                f"{lang} n_jobs={n_jobs:>3}: fit={timings[n_jobs]:.2f}s "
+                f"speedup={timings[jobs[0]] / timings[n_jobs]:.2f}x"
+            )
+
+        results["languages"][lang] = {
+            "n_samples": features.shape[0],
+            "n_features": features.shape[1],
+            "n_classes": len(set(labels)),
+            "fit_time": timings,
+            "speedup": {n_jobs: timings[jobs[0]] / time for n_jobs, time in timings.items()},
+        }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
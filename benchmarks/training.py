@@ -0,0 +1,205 @@
+"""
+Benchmark the stages of model training in isolation.
+
+For each language, the following stages are timed one after the other in
+a fresh interpreter:
+
+- Loading the Verbiste lexicon
+- Constructing the ``DataSet`` and splitting it with ``split_data``
+- Extracting the features of every verb with ``extract_verb_features``
+- Fitting the default ``CountVectorizer`` of ``Model`` on the training split
+- Fitting the default ``SGDClassifier`` of ``Model`` on the vectorized split
+
+The memory allocated while fitting the vectorizer and the classifier is
+measured with tracemalloc in an additional, untimed run, since tracing
+slows down the Python code of the feature extractor. The accuracy reached
+on the held-out split is recorded with the timings, so a change to the
+features or to the ``Model`` defaults shows both its speed and its
+accuracy.
+
+Usage:
+
+    python -m benchmarks.training -l fr -l es -o training.json
+    python -m benchmarks.training -l fr -b training.json
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+import warnings
+from time import perf_counter
+
+from benchmarks.common import (
+    add_output_arguments,
+    environment,
+    finish,
+    peak_rss_mb,
+    run_isolated,
+    summarize,
+)
+
+MODULE = "benchmarks.training"
+
+
+def repeat_timed(function, repeat):
+    """
+    Call ``function`` ``repeat`` times.
+
+    :return: Timing summary and the result of the last call.
+    :rtype: tuple
+    """
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function()
+        samples.append(perf_counter() - start)
+    return summarize(samples), result
+
+
+def traced_peak_mb(function):
+    """
+    Return the peak memory allocated by ``function``, in MiB.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024 ** 2
+
+
+def measure_language(lang, split, repeat, memory):
+    """
+    Measure the training stages of one language in this interpreter.
+
+    :return: Measurements of the language.
+    :rtype: dict
+    """
+    import numpy as np
+    from sklearn.base import clone
+    from sklearn.exceptions import ConvergenceWarning
+
+    from mlconjug3 import DataSet, Model, Verbiste
+    from mlconjug3.feature_extractor import extract_verb_features
+
+    warnings.filterwarnings("ignore", category=ConvergenceWarning)
+
+    results = {}
+
+    results["verbiste_time"], verbiste = repeat_timed(
+        lambda: Verbiste(language=lang), repeat
+    )
+    results["dataset_time"], dataset = repeat_timed(
+        lambda: DataSet(verbiste.verbs), repeat
+    )
+    results["split_time"], _ = repeat_timed(
+        lambda: dataset.split_data(proportion=split), repeat
+    )
+
+    verbs = list(dataset.verbs_list)
+    extraction, features = repeat_timed(
+        lambda: [extract_verb_features(verb, lang=lang) for verb in verbs], repeat
+    )
+    results["extraction_time"] = extraction
+    results["extraction_throughput"] = len(verbs) / extraction["median"]
+    results["n_features_per_verb"] = float(np.mean([len(feature) for feature in features]))
+
+    model = Model(language=lang)
+    vectorizer = model.pipeline.steps[0][1]
+    classifier = model.pipeline.steps[-1][1]
+    train_input = dataset.train_input
+    train_labels = dataset.train_labels
+
+    def fit_vectorizer():
+        fitted = clone(vectorizer)
+        return fitted, fitted.fit_transform(train_input)
+
+    results["vectorizer_time"], (vectorizer, train_features) = repeat_timed(
+        fit_vectorizer, repeat
+    )
+
+    def fit_classifier():
+        return clone(classifier).fit(train_features, train_labels)
+
+    results["classifier_time"], classifier = repeat_timed(fit_classifier, repeat)
+
+    if memory:
+        results["vectorizer_memory_mb"] = traced_peak_mb(fit_vectorizer)
+        results["classifier_memory_mb"] = traced_peak_mb(fit_classifier)
+
+    test_labels = np.asarray(dataset.test_labels)
+    if len(test_labels):
+        predictions = classifier.predict(vectorizer.transform(dataset.test_input))
+        results["accuracy"] = float(np.mean(predictions == test_labels))
+    else:
+        results["accuracy"] = None
+
+    results["n_verbs"] = len(verbs)
+    results["n_train"] = len(train_labels)
+    results["n_test"] = len(test_labels)
+    results["n_templates"] = len(dataset.templates)
+    results["n_vocabulary"] = len(vectorizer.vocabulary_)
+    results["peak_rss_mb"] = peak_rss_mb()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "-l", "--language", dest="languages", action="append",
+        help="Language to benchmark, can be repeated (default: all languages).",
+    )
+    parser.add_argument("--split", type=float, default=0.8, help="Training proportion.")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=1,
+        help="Number of timed runs of each stage (default: 1).",
+    )
+    parser.add_argument(
+        "--no-memory", dest="memory", action="store_false",
+        help="Skip the traced runs measuring the memory of the fits.",
+    )
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    # Worker mode: measure in this interpreter and print the JSON results.
+    if args.worker:
+        print(json.dumps(measure_language(args.worker, args.split, args.repeat, args.memory)))
+        return 0
+
+    from mlconjug3.constants import LANGUAGES
+
+    languages = args.languages or [lang for lang in LANGUAGES if lang != "default"]
+    results = {"environment": environment(), "split": args.split, "languages": {}}
+
+    for lang in languages:
+        worker_args = ["--worker", lang, "--split", args.split, "--repeat", args.repeat]
+        if not args.memory:
+            worker_args.append("--no-memory")
+
+        result = run_isolated(MODULE, *worker_args)
+        results["languages"][lang] = result
+
+        memory = ""
+        if args.memory:
+            memory = (
+                f" memory=({result['vectorizer_memory_mb']:.0f}MiB, "
+                f"{result['classifier_memory_mb']:.0f}MiB)"
+            )
+        print(
+            f"{lang}: dataset={result['dataset_time']['median']:.2f}s "
+            f"split={result['split_time']['median'] * 1000:.1f}ms "
+            f"extraction={result['extraction_throughput']:.0f} verbs/s "
+            f"vectorizer={result['vectorizer_time']['median']:.2f}s "
+            f"classifier={result['classifier_time']['median']:.2f}s"
+            f"{memory} accuracy={result['accuracy']:.4f}"
+        )
+
+    return finish(args, results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,9 @@ Features:
 - Optional output export (JSON/CSV)
 - Config file support (TOML/YAML)
 - Rich formatted terminal output
+- Parallel training of the pre-trained models (``mlconjug3-train``)
+- An HTTP conjugation server (``mlconjug3-serve``)
+- An NDJSON co-process over stdin/stdout (``mlconjug3-coprocess``)
 """
 
 import sys
@@ -35,7 +38,10 @@ except Exception:
         return s
 
 
-@click.command(context_settings=dict(help_option_names=["-h", "--help"]))
+CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
 @click.argument("verbs", nargs=-1)
 @click.option(
     "-l",
@@ -85,7 +91,15 @@ except Exception:
     ),
     type=click.Path(exists=True, dir_okay=False, resolve_path=True),
 )
-def main(verbs, language, output, subject, file_format, config):
+@click.option(
+    "--prediction-cache",
+    default=None,
+    help=_(
+        "SQLite file caching the templates predicted for unknown verbs across runs."
+    ),
+    type=click.Path(dir_okay=False),
+)
+def main(verbs, language, output, subject, file_format, config, prediction_cache):
     """
     CLI entry point for mlconjug3.
 
@@ -99,8 +113,12 @@ def main(verbs, language, output, subject, file_format, config):
 
     Save output:
         mlconjug3 -l es -o output.json 'hablar'
+
+    Reuse the predictions of earlier runs:
+        mlconjug3 -l fr --prediction-cache predictions.sqlite3 'blorpiner'
     """
     from .mlconjug import Conjugator
+    from .utils.prediction_cache import PredictionCache
 
     config_options = load_config(config)
 
@@ -108,6 +126,7 @@ def main(verbs, language, output, subject, file_format, config):
     subject = config_options.get("subject", subject)
     output = config_options.get("output", output)
     file_format = config_options.get("file_format", file_format)
+    prediction_cache = config_options.get("prediction_cache", prediction_cache)
     theme_settings = config_options.get("theme", {})
 
     try:
@@ -124,7 +143,10 @@ def main(verbs, language, output, subject, file_format, config):
         logger.addHandler(error_handler)
         logger.setLevel(logging.INFO)
 
-        conjugator = Conjugator(language)
+        conjugator = Conjugator(
+            language,
+            prediction_cache=PredictionCache(prediction_cache) if prediction_cache else None,
+        )
         conjugations = {}
         missing = []
 
@@ -233,6 +255,293 @@ def main(verbs, language, output, subject, file_format, config):
         sys.exit(1)
 
 
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "-l",
+    "--language",
+    "languages",
+    multiple=True,
+    help=_(
+        "Language to train, can be repeated."
+        " The default is to train all the supported languages."
+    ),
+    type=click.STRING,
+)
+@click.option(
+    "-o",
+    "--output",
+    default="trained_models",
+    show_default=True,
+    help=_("Folder receiving the packaged models and the training report."),
+    type=click.Path(file_okay=False),
+)
+@click.option(
+    "-j",
+    "--jobs",
+    default=None,
+    help=_(
+        "Number of languages trained in parallel."
+        " The default is chosen from the CPU count and the available memory."
+    ),
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--split",
+    default=0.8,
+    show_default=True,
+    help=_("Proportion of each template used for training, the rest is used for evaluation."),
+    type=click.FloatRange(min=0.0, max=1.0, min_open=True),
+)
+@click.option(
+    "--no-resume",
+    is_flag=True,
+    help=_("Retrain languages that are already packaged in the output folder."),
+)
+@click.option(
+    "--feature-cache",
+    default=None,
+    help=_("Folder caching the vectorized training data across runs."),
+    type=click.Path(file_okay=False),
+)
+@click.option(
+    "--hashing",
+    "n_features",
+    default=None,
+    help=_(
+        "Hash the features into this many columns instead of storing a vocabulary."
+        " 4096 gives fixed-size models with an accuracy close to the default ones."
+    ),
+    type=click.IntRange(min=1),
+)
+def train(languages, output, jobs, split, no_resume, feature_cache, n_features):
+    """
+    Train, evaluate and package the models of several languages in parallel.
+
+    Examples
+    --------
+    Train every language:
+        mlconjug3-train -o trained_models
+
+    Train French and Spanish on two workers:
+        mlconjug3-train -l fr -l es -j 2
+
+    Train hashing models:
+        mlconjug3-train --hashing 4096 -o hashing_models
+    """
+    from .utils.orchestrator import train_languages
+
+    console = Console()
+
+    try:
+        reports = train_languages(
+            languages or None,
+            output_folder=output,
+            split_proportion=split,
+            n_jobs=jobs,
+            resume=not no_resume,
+            feature_cache=feature_cache,
+            n_features=n_features,
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'-l' / '--language'")
+
+    table = Table(title="Training report", show_header=True, header_style="bold #0D47A1")
+    for column in ("Language", "Status", "Accuracy", "Time (s)", "Peak RSS (MiB)"):
+        table.add_column(column)
+
+    for lang, report in reports.items():
+        accuracy = report.get("accuracy")
+        total = report.get("times", {}).get("total")
+        peak = report.get("peak_rss_mb")
+        table.add_row(
+            lang,
+            report["status"],
+            "" if accuracy is None else f"{accuracy:.4f}",
+            "" if total is None else f"{total:.1f}",
+            "" if peak is None else f"{peak:.0f}",
+        )
+
+    console.print(table)
+
+    failed = [lang for lang, report in reports.items() if report["status"] == "failed"]
+    for lang in failed:
+        console.print(f"Training '{lang}' failed: {reports[lang]['error']}")
+
+    if failed:
+        sys.exit(1)
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "-l",
+    "--language",
+    "languages",
+    multiple=True,
+    help=_(
+        "Language to serve, can be repeated."
+        " The default is to serve all the supported languages."
+    ),
+    type=click.STRING,
+)
+@click.option("--host", default="127.0.0.1", show_default=True, help=_("Address to listen on."))
+@click.option(
+    "-p",
+    "--port",
+    default=8000,
+    show_default=True,
+    help=_("Port to listen on."),
+    type=click.IntRange(min=0, max=65535),
+)
+@click.option(
+    "-w",
+    "--workers",
+    default=1,
+    show_default=True,
+    help=_("Number of pre-forked worker processes."),
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "-t",
+    "--threads",
+    default=8,
+    show_default=True,
+    help=_("Maximum number of requests processed at the same time by each worker."),
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--max-body",
+    default=1024 ** 2,
+    show_default=True,
+    help=_("Maximum size of a request body in bytes, larger requests get a 413 response."),
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--max-batch",
+    default=1000,
+    show_default=True,
+    help=_("Maximum number of verbs of a batch request."),
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--keepalive",
+    default=15.0,
+    show_default=True,
+    help=_("Seconds an idle keep-alive connection is kept open."),
+    type=click.FloatRange(min=0.0, min_open=True),
+)
+@click.option(
+    "--prediction-cache",
+    default=None,
+    help=_(
+        "SQLite file caching the templates predicted for unknown verbs across runs."
+    ),
+    type=click.Path(dir_okay=False),
+)
+def serve(
+    languages, host, port, workers, threads, max_body, max_batch, keepalive, prediction_cache
+):
+    """
+    Serve conjugations over HTTP.
+
+    The models are loaded once, then the worker processes are forked.
+
+    Examples
+    --------
+    Serve French and English on 4 workers:
+        mlconjug3-serve -l fr -l en -w 4 -p 8000
+
+    Conjugate a verb:
+        curl 'http://127.0.0.1:8000/v1/conjugate?verb=manger&language=fr'
+    """
+    from .server import serve as run_server
+    from .utils.prediction_cache import PredictionCache
+
+    conjugator_options = {}
+    if prediction_cache:
+        conjugator_options["prediction_cache"] = PredictionCache(prediction_cache)
+
+    try:
+        run_server(
+            languages or None,
+            host=host,
+            port=port,
+            workers=workers,
+            threads=threads,
+            max_body=max_body,
+            max_batch=max_batch,
+            keepalive=keepalive,
+            conjugator_options=conjugator_options,
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'-l' / '--language'")
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "-l",
+    "--language",
+    "languages",
+    multiple=True,
+    help=_(
+        "Language to load, can be repeated."
+        " The default is to load all the supported languages."
+    ),
+    type=click.STRING,
+)
+@click.option(
+    "--max-batch",
+    default=1000,
+    show_default=True,
+    help=_("Maximum number of verbs of a 'verbs' request."),
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--max-pending",
+    default=256,
+    show_default=True,
+    help=_("Maximum number of pipelined requests answered together."),
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--prediction-cache",
+    default=None,
+    help=_(
+        "SQLite file caching the templates predicted for unknown verbs across runs."
+    ),
+    type=click.Path(dir_okay=False),
+)
+def coprocess(languages, max_batch, max_pending, prediction_cache):
+    """
+    Answer NDJSON conjugation requests on stdin until it is closed.
+
+    The models are loaded once. Each line of stdin is a JSON request, each
+    line of stdout the JSON response with the same id.
+
+    Examples
+    --------
+    Conjugate a verb:
+        echo '{"id": 1, "verb": "manger", "language": "fr"}' | mlconjug3-coprocess -l fr
+    """
+    from .coprocess import run_coprocess
+    from .utils.prediction_cache import PredictionCache
+
+    conjugator_options = {}
+    if prediction_cache:
+        conjugator_options["prediction_cache"] = PredictionCache(prediction_cache)
+
+    try:
+        run_coprocess(
+            languages or None,
+            max_batch=max_batch,
+            max_pending=max_pending,
+            conjugator_options=conjugator_options,
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'-l' / '--language'")
+
+
 def load_config(config):
     """
     Load configuration file (TOML or YAML).
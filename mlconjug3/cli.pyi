@@ -1,5 +1,42 @@
 # Stubs for mlconjug3.cli (Python 3)
 
-from typing import Text
+from typing import Any, Dict, Optional, Sequence, Text
 
-def main(verb: Text, language: Text, output: Text, subject: Text) -> None: ...
+CONTEXT_SETTINGS: Dict[str, Any]
+
+def main(
+    verbs: Sequence[Text],
+    language: Text,
+    output: Optional[Text],
+    subject: Text,
+    file_format: Text,
+    config: Optional[Text],
+    prediction_cache: Optional[Text],
+) -> None: ...
+def train(
+    languages: Sequence[Text],
+    output: Text,
+    jobs: Optional[int],
+    split: float,
+    no_resume: bool,
+    feature_cache: Optional[Text],
+    n_features: Optional[int],
+) -> None: ...
+def serve(
+    languages: Sequence[Text],
+    host: Text,
+    port: int,
+    workers: int,
+    threads: int,
+    max_body: int,
+    max_batch: int,
+    keepalive: float,
+    prediction_cache: Optional[Text],
+) -> None: ...
+def coprocess(
+    languages: Sequence[Text],
+    max_batch: int,
+    max_pending: int,
+    prediction_cache: Optional[Text],
+) -> None: ...
+def load_config(config: Optional[Text]) -> Dict[str, Any]: ...
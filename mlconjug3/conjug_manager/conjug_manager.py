@@ -16,10 +16,12 @@ import joblib
 import copy
 import json
 from collections import OrderedDict
+from functools import partial
 from importlib import resources
 
 from mlconjug3.constants import *
 from mlconjug3.verbs import *
+from mlconjug3.lexicon import Lexicon, FuzzyIndex, normalize_verb
 
 
 class ConjugManager:
@@ -44,8 +46,16 @@ class ConjugManager:
         Mapping of conjugation templates to tense structures.
     templates : list of str
         Sorted list of available conjugation templates.
+    lexicon : Lexicon
+        Trie-backed index of the verbs, built on first access.
+    fuzzy_index : FuzzyIndex
+        Edit-distance index of the verbs, built on first access.
+    fuzzy_max_distance : int
+        Largest edit distance supported by :meth:`fuzzy_lookup`.
     """
 
+    fuzzy_max_distance = 2
+
     def __init__(self, language="default"):
         if language not in LANGUAGES:
             raise ValueError(
@@ -59,9 +69,13 @@ class ConjugManager:
         self.conjugations = OrderedDict()
 
         verbs_file = VERBS_RESOURCE_PATH[self.language]
+        self._verbs_file = verbs_file
         self._load_verbs(verbs_file)
 
-        self._allowed_endings = self._detect_allowed_endings()
+        self._lexicon = None
+        self._fuzzy_index = None
+        self._normalized_indexes = {}
+        self._allowed_endings = None
 
         conjugations_file = CONJUGATIONS_RESOURCE_PATH[self.language]
         self._load_conjugations(conjugations_file)
@@ -216,10 +230,84 @@ class ConjugManager:
 
         self._save_cache(conjugations_file, self.conjugations)
 
+    def _load_index(self, verbs_file, extension, build):
+        """
+        Load a verb index from cache or build it from the verbs.
+
+        Indexes are cached next to the verbs resource when it lives on a
+        writable filesystem, so they are only built once per data release.
+
+        Parameters
+        ----------
+        verbs_file : str
+            Path to the verbs resource the index is derived from.
+        extension : str
+            Suffix of the cache file, e.g. ".lexicon.pkl".
+        build : callable
+            Function building the index from the verbs.
+
+        Returns
+        -------
+        object
+            Index built by ``build``, or its cached copy.
+        """
+        index_file = verbs_file + extension
+
+        if self._is_real_file(verbs_file) and os.path.isfile(index_file):
+            if os.path.getmtime(verbs_file) <= os.path.getmtime(index_file):
+                index = joblib.load(index_file)
+                if len(index) == len(self.verbs):
+                    return index
+
+        index = build(self.verbs)
+
+        if self._is_real_file(verbs_file):
+            try:
+                joblib.dump(index, index_file, compress=("gzip", 3))
+            except Exception:
+                pass  # safe fallback for read-only or zip environments
+
+        return index
+
     # ---------------------------
     # Logic
     # ---------------------------
 
+    @property
+    def lexicon(self):
+        """
+        Trie-backed index of the verbs of the language.
+
+        Returns
+        -------
+        Lexicon
+            Lexicon built (or loaded from cache) on first access.
+        """
+        if self._lexicon is None:
+            self._lexicon = self._load_index(
+                self._verbs_file, ".lexicon.pkl", Lexicon
+            )
+        return self._lexicon
+
+    @property
+    def fuzzy_index(self):
+        """
+        Symmetric-delete index of the verbs for approximate lookup.
+
+        Returns
+        -------
+        FuzzyIndex
+            Index built (or loaded from cache) on first access, supporting
+            edit distances up to ``fuzzy_max_distance``.
+        """
+        if self._fuzzy_index is None:
+            self._fuzzy_index = self._load_index(
+                self._verbs_file,
+                f".fuzzy{self.fuzzy_max_distance}.pkl",
+                partial(FuzzyIndex, max_distance=self.fuzzy_max_distance),
+            )
+        return self._fuzzy_index
+
     def _detect_allowed_endings(self):
         """
         Compute allowed verb endings for filtering.
@@ -232,11 +320,113 @@ class ConjugManager:
         if self.language == "en":
             return set()
 
-        return {
-            verb.split(" ")[0][-2:]
-            for verb in self.verbs
-            if len(verb) >= 2
-        }
+        # Only the first word of entries such as "sbiasciare tosc)" counts.
+        return self.lexicon.endings(2, key=lambda verb: verb.split(" ")[0])
+
+    def autocomplete(self, prefix, limit=10):
+        """
+        Suggest known verbs starting with a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            Beginning of the verb.
+        limit : int or None, default=10
+            Maximum number of suggestions.
+
+        Returns
+        -------
+        list of str
+            Known verbs starting with ``prefix``, in lexicographic order.
+        """
+        return self.lexicon.complete(prefix, limit)
+
+    def longest_known_suffix(self, verb, min_length=1):
+        """
+        Find the longest known verb that is a suffix of ``verb``.
+
+        Parameters
+        ----------
+        verb : str
+            Verb to analyse.
+        min_length : int, default=1
+            Minimum length of the returned verb.
+
+        Returns
+        -------
+        str or None
+            Longest known verb ending ``verb``, or None if there is none.
+        """
+        return self.lexicon.longest_known_suffix(verb, min_length)
+
+    def normalized_index(self, strip_accents=False):
+        """
+        Secondary index of the verbs keyed by their normalized form.
+
+        Parameters
+        ----------
+        strip_accents : bool, default=False
+            Whether the keys are diacritic-free.
+
+        Returns
+        -------
+        dict
+            Mapping of normalized keys (see
+            :func:`mlconjug3.lexicon.normalize_verb`) to the sorted tuple of
+            matching infinitives. Built on first use for each setting.
+        """
+        if strip_accents not in self._normalized_indexes:
+            index = {}
+            for verb in self.verbs:
+                index.setdefault(normalize_verb(verb, strip_accents), []).append(verb)
+            self._normalized_indexes[strip_accents] = {
+                key: tuple(sorted(verbs)) for key, verbs in index.items()
+            }
+        return self._normalized_indexes[strip_accents]
+
+    def resolve_normalized(self, verb, strip_accents=False):
+        """
+        Find the infinitives matching a verb up to normalization.
+
+        Parameters
+        ----------
+        verb : str
+            Verb as typed by the user, e.g. "Être" or "etre".
+        strip_accents : bool, default=False
+            Whether diacritics are ignored.
+
+        Returns
+        -------
+        tuple of str
+            Matching infinitives in lexicographic order, possibly empty.
+        """
+        return self.normalized_index(strip_accents).get(
+            normalize_verb(verb, strip_accents), ()
+        )
+
+    def fuzzy_lookup(self, verbs, max_distance=2, limit=5):
+        """
+        Find the known verbs closest to possibly misspelled input.
+
+        Parameters
+        ----------
+        verbs : str or sequence of str
+            Verb or verbs to look up.
+        max_distance : int, default=2
+            Maximum edit distance (insertions, deletions, substitutions and
+            adjacent transpositions), at most ``fuzzy_max_distance``.
+        limit : int or None, default=5
+            Maximum number of matches per verb.
+
+        Returns
+        -------
+        list of tuple or list of list of tuple
+            ``(verb, distance)`` pairs sorted by distance, then verb. A list
+            of such lists is returned when ``verbs`` is a sequence.
+        """
+        if isinstance(verbs, str):
+            return self.fuzzy_index.lookup(verbs, max_distance, limit)
+        return self.fuzzy_index.lookup_batch(list(verbs), max_distance, limit)
 
     def is_valid_verb(self, verb):
         """
@@ -254,6 +444,8 @@ class ConjugManager:
         """
         if self.language == "en":
             return True
+        if self._allowed_endings is None:
+            self._allowed_endings = self._detect_allowed_endings()
         return verb[-2:] in self._allowed_endings
 
     def get_verb_info(self, verb):
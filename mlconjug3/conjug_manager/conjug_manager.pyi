@@ -10,6 +10,8 @@ from typing import (
     Optional,
     Union,
     Set,
+    List,
+    Callable,
     TextIO,
     Any,
 )
@@ -17,6 +19,7 @@ from collections import OrderedDict
 import os
 
 from mlconjug3.verbs import VerbInfo
+from mlconjug3.lexicon import Lexicon, FuzzyIndex
 
 __author__: str
 __author_email__: str
@@ -47,7 +50,12 @@ class ConjugManager:
     language: str
     verbs: Mapping[str, Mapping[str, str]]
     conjugations: _Conjugations
-    _allowed_endings: Set[str]
+    _allowed_endings: Optional[Set[str]]
+    _lexicon: Optional[Lexicon]
+    _fuzzy_index: Optional[FuzzyIndex]
+    fuzzy_max_distance: int
+    _normalized_indexes: Dict[bool, Dict[str, Tuple[str, ...]]]
+    _verbs_file: str
     templates: Sequence[str]
 
     def __init__(self, language: str = ...) -> None: ...
@@ -58,8 +66,37 @@ class ConjugManager:
 
     def _load_conjugations(self, conjugations_file: _PathLike) -> None: ...
 
+    def _load_index(
+        self, verbs_file: str, extension: str, build: Callable[[Any], Any]
+    ) -> Any: ...
+
+    @property
+    def lexicon(self) -> Lexicon: ...
+
+    @property
+    def fuzzy_index(self) -> FuzzyIndex: ...
+
     def _detect_allowed_endings(self) -> Set[str]: ...
 
+    def autocomplete(self, prefix: str, limit: Optional[int] = ...) -> List[str]: ...
+
+    def longest_known_suffix(self, verb: str, min_length: int = ...) -> Optional[str]: ...
+
+    def normalized_index(
+        self, strip_accents: bool = ...
+    ) -> Dict[str, Tuple[str, ...]]: ...
+
+    def resolve_normalized(
+        self, verb: str, strip_accents: bool = ...
+    ) -> Tuple[str, ...]: ...
+
+    def fuzzy_lookup(
+        self,
+        verbs: Union[str, Sequence[str]],
+        max_distance: int = ...,
+        limit: Optional[int] = ...,
+    ) -> Union[List[Tuple[str, int]], List[List[Tuple[str, int]]]]: ...
+
     def is_valid_verb(self, verb: str) -> bool: ...
 
     def get_verb_info(self, verb: str) -> Optional[VerbInfo]: ...
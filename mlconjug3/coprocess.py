@@ -0,0 +1,251 @@
+"""
+coprocess.py
+
+Long-running stdio co-process for mlconjug3.
+
+Programs written in other languages can start ``mlconjug3-coprocess`` once
+and exchange newline-delimited JSON (NDJSON) with it, instead of starting
+the CLI for every verb. The models of every language are loaded once and
+stay warm.
+
+Requests are JSON objects, one per line on stdin::
+
+    {"id": 1, "verb": "manger", "language": "fr", "subject": "abbrev"}
+    {"id": 2, "verbs": ["walk", "blorp"], "language": "en", "options": {"conjugations": false}}
+    {"id": 3, "op": "ping"}
+
+Responses are written on stdout, one per line and in the order of the
+requests, with the ``id`` of their request::
+
+    {"id": 1, "result": {"verb": "manger", "template": "man:ger", ...}}
+    {"id": 2, "results": [{...}, {...}]}
+    {"id": 3, "ok": true, "languages": ["fr", "en", ...]}
+
+Errors are answered with ``{"id": ..., "status": 400, "error": "..."}``.
+A first line ``{"event": "ready", "languages": [...]}`` is written once
+the models are loaded.
+
+``language`` defaults to the first loaded language and ``subject`` to
+"abbrev". The ``conjugations`` option (default true) can be set to false
+to only return the template, source and confidence score of each verb.
+
+Clients can pipeline requests: every request already available on stdin
+is read before answering, and the verbs of single-verb requests sharing a
+language and subject are conjugated together, so the model predicts all
+their unknown verbs at once.
+"""
+
+import sys
+import json
+import queue
+import threading
+
+from .server import ConjugationService, RequestError, DEFAULT_MAX_BATCH
+from .utils import logger
+
+#: Default maximum number of requests read before answering.
+DEFAULT_MAX_PENDING = 256
+
+_EOF = object()
+
+
+class Coprocess:
+    """
+    NDJSON request loop over a pair of binary streams.
+
+    Parameters
+    ----------
+    service : ConjugationService
+        Service answering the requests.
+    input_stream : binary file, optional
+        Stream of requests. Defaults to stdin.
+    output_stream : binary file, optional
+        Stream of responses. Defaults to stdout.
+    max_pending : int, default=256
+        Maximum number of requests read before answering.
+    """
+
+    def __init__(
+        self, service, input_stream=None, output_stream=None, max_pending=DEFAULT_MAX_PENDING
+    ):
+        self.service = service
+        self.input_stream = input_stream if input_stream is not None else sys.stdin.buffer
+        self.output_stream = output_stream if output_stream is not None else sys.stdout.buffer
+        self.max_pending = max_pending
+        self._lines = queue.Queue(maxsize=max_pending * 4)
+
+    def _read(self):
+        for line in self.input_stream:
+            self._lines.put(line)
+        self._lines.put(_EOF)
+
+    def _next_lines(self):
+        """
+        Wait for a request, then take the other requests already read.
+
+        :return: Request lines, and whether the input is exhausted.
+        :rtype: tuple
+        """
+        lines = []
+        line = self._lines.get()
+
+        while line is not _EOF:
+            if line.strip():
+                lines.append(line)
+            if len(lines) >= self.max_pending:
+                break
+            try:
+                line = self._lines.get_nowait()
+            except queue.Empty:
+                break
+
+        return lines, line is _EOF
+
+    def _write(self, documents):
+        self.output_stream.write(
+            b"".join(
+                json.dumps(document, ensure_ascii=False).encode("utf-8") + b"\n"
+                for document in documents
+            )
+        )
+        self.output_stream.flush()
+
+    @staticmethod
+    def _error(request_id, status, message):
+        return {"id": request_id, "status": status, "error": message}
+
+    @staticmethod
+    def _shape(result, options):
+        if not options.get("conjugations", True):
+            result.pop("conjugations", None)
+        return result
+
+    def handle(self, lines):
+        """
+        Answer a list of request lines.
+
+        :param lines: NDJSON request lines.
+        :type lines: list of bytes | list of str
+        :return: One response per line, in the same order.
+        :rtype: list of dict
+        """
+        responses = [None] * len(lines)
+        default_language = self.service.languages[0]
+        # (language, subject) -> [(position, verb, options, request id)]
+        groups = {}
+
+        for position, line in enumerate(lines):
+            try:
+                request = json.loads(line)
+            except ValueError:
+                responses[position] = self._error(None, 400, "Invalid JSON.")
+                continue
+
+            request_id = request.get("id") if isinstance(request, dict) else None
+
+            try:
+                if not isinstance(request, dict):
+                    raise RequestError(400, "A request must be a JSON object.")
+
+                options = request.get("options") or {}
+                if not isinstance(options, dict):
+                    raise RequestError(400, "'options' must be a JSON object.")
+
+                language = request.get("language", default_language)
+                subject = request.get("subject", "abbrev")
+                if not isinstance(language, str) or not isinstance(subject, str):
+                    raise RequestError(400, "'language' and 'subject' must be strings.")
+
+                if request.get("op") is not None:
+                    if request["op"] != "ping":
+                        raise RequestError(400, f"Unknown operation {request['op']!r}.")
+                    responses[position] = {
+                        "id": request_id, "ok": True, "languages": self.service.languages
+                    }
+
+                elif "verbs" in request:
+                    if not isinstance(request["verbs"], list):
+                        raise RequestError(400, "'verbs' must be a list.")
+                    results = self.service.conjugate(request["verbs"], language, subject)
+                    responses[position] = {
+                        "id": request_id,
+                        "results": [self._shape(result, options) for result in results],
+                    }
+
+                elif isinstance(request.get("verb"), str) and request["verb"]:
+                    groups.setdefault((language, subject), []).append(
+                        (position, request["verb"], options, request_id)
+                    )
+
+                else:
+                    raise RequestError(400, "A request needs a 'verb', 'verbs' or 'op' field.")
+
+            except RequestError as error:
+                responses[position] = self._error(request_id, error.status, error.message)
+            except Exception as error:
+                logger.exception(f"Error while answering request {request_id!r}: {error!r}")
+                responses[position] = self._error(request_id, 500, "Internal error.")
+
+        for (language, subject), requests in groups.items():
+            for start in range(0, len(requests), self.service.max_batch):
+                chunk = requests[start:start + self.service.max_batch]
+                try:
+                    results = self.service.conjugate(
+                        [verb for _position, verb, _options, _id in chunk], language, subject
+                    )
+                except RequestError as error:
+                    for position, _verb, _options, request_id in chunk:
+                        responses[position] = self._error(request_id, error.status, error.message)
+                    continue
+                except Exception as error:
+                    logger.exception(f"Error while conjugating {language} verbs: {error!r}")
+                    for position, _verb, _options, request_id in chunk:
+                        responses[position] = self._error(request_id, 500, "Internal error.")
+                    continue
+
+                for (position, _verb, options, request_id), result in zip(chunk, results):
+                    responses[position] = {"id": request_id, "result": self._shape(result, options)}
+
+        return responses
+
+    def run(self):
+        """
+        Answer requests until the input stream is closed.
+        """
+        self._write([{"event": "ready", "languages": self.service.languages}])
+
+        reader = threading.Thread(target=self._read, daemon=True)
+        reader.start()
+
+        done = False
+        while not done:
+            lines, done = self._next_lines()
+            if lines:
+                self._write(self.handle(lines))
+
+
+def run_coprocess(
+    languages=None,
+    max_batch=DEFAULT_MAX_BATCH,
+    max_pending=DEFAULT_MAX_PENDING,
+    input_stream=None,
+    output_stream=None,
+    conjugator_options=None,
+):
+    """
+    Load the models, then answer NDJSON requests until the input is closed.
+
+    :param languages: Languages to load. Defaults to every supported language.
+    :type languages: sequence of str | None
+    :param max_batch: Maximum number of verbs of a 'verbs' request.
+    :type max_batch: int
+    :param max_pending: Maximum number of requests read before answering.
+    :type max_pending: int
+    :param input_stream: Binary stream of requests. Defaults to stdin.
+    :param output_stream: Binary stream of responses. Defaults to stdout.
+    :param conjugator_options: Keyword arguments passed to each Conjugator.
+    :type conjugator_options: dict | None
+    :raises ValueError: If a language is not supported.
+    """
+    service = ConjugationService(languages, conjugator_options, max_batch)
+    Coprocess(service, input_stream, output_stream, max_pending).run()
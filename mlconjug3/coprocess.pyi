@@ -0,0 +1,36 @@
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+
+from .server import ConjugationService
+
+DEFAULT_MAX_PENDING: int
+
+class Coprocess:
+    service: ConjugationService
+    input_stream: BinaryIO
+    output_stream: BinaryIO
+    max_pending: int
+    def __init__(
+        self,
+        service: ConjugationService,
+        input_stream: Optional[BinaryIO] = ...,
+        output_stream: Optional[BinaryIO] = ...,
+        max_pending: int = ...,
+    ) -> None: ...
+    def _read(self) -> None: ...
+    def _next_lines(self) -> Tuple[List[bytes], bool]: ...
+    def _write(self, documents: List[Dict[str, Any]]) -> None: ...
+    @staticmethod
+    def _error(request_id: Any, status: int, message: str) -> Dict[str, Any]: ...
+    @staticmethod
+    def _shape(result: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]: ...
+    def handle(self, lines: List[Union[bytes, str]]) -> List[Dict[str, Any]]: ...
+    def run(self) -> None: ...
+
+def run_coprocess(
+    languages: Optional[Sequence[str]] = ...,
+    max_batch: int = ...,
+    max_pending: int = ...,
+    input_stream: Optional[BinaryIO] = ...,
+    output_stream: Optional[BinaryIO] = ...,
+    conjugator_options: Optional[Dict[str, Any]] = ...,
+) -> None: ...
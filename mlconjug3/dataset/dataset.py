@@ -10,7 +10,9 @@ training and testing subsets.
 """
 
 from random import Random
-from collections import defaultdict
+
+import numpy as np
+
 from mlconjug3.constants import *
 
 
@@ -21,6 +23,11 @@ class DataSet:
     This class organizes verbs by their conjugation templates, shuffles
     the dataset, and prepares training and testing splits.
 
+    Labels are stored once as a numpy array of template ids, and the
+    train/test splits are computed as integer index arrays into the
+    shuffled verbs. The train/test lists are built once from them by
+    :meth:`split_data`.
+
     Parameters
     ----------
     verbs_dict : dict
@@ -34,16 +41,25 @@ class DataSet:
         All verb keys in the dataset.
     templates : list of str
         Sorted list of unique conjugation templates.
+    template_ids : dict
+        Mapping of each template to its index in `templates`.
     verbs_list : list of str
         Shuffled list of verbs.
-    templates_list : list of int
+    templates_list : numpy.ndarray of int
         Template index corresponding to each verb in `verbs_list`.
+    template_indices : dict
+        Mapping of template ids to the positions of their verbs in
+        `verbs_list`, in order of first appearance.
     dict_conjug : dict
         Mapping of templates to lists of verbs belonging to them.
     min_threshold : int
         Minimum number of verbs required to split a class into train/test.
     split_proportion : float
         Ratio used for splitting data into training and testing sets.
+    train_indices : numpy.ndarray of int
+        Positions of the training verbs in `verbs_list`.
+    test_indices : numpy.ndarray of int
+        Positions of the testing verbs in `verbs_list`.
     train_input : list of str
         Training verbs.
     train_labels : list of int
@@ -58,16 +74,23 @@ class DataSet:
         self.verbs_dict = verbs_dict
         self.verbs = self.verbs_dict.keys()
         self.templates = sorted({verb["template"] for verb in self.verbs_dict.values()})
+        self.template_ids = {
+            template: index for index, template in enumerate(self.templates)
+        }
 
         self.verbs_list = []
-        self.templates_list = []
+        self.templates_list = np.empty(0, dtype=np.intp)
+        self.template_indices = {}
         self.dict_conjug = None
         self.min_threshold = 8
         self.split_proportion = 0.5
+        self.train_indices = np.empty(0, dtype=np.intp)
+        self.test_indices = np.empty(0, dtype=np.intp)
         self.train_input = []
         self.train_labels = []
         self.test_input = []
         self.test_labels = []
+        self._verbs_array = np.empty(0, dtype=object)
 
         self.construct_dict_conjug()
 
@@ -82,23 +105,38 @@ class DataSet:
         Build internal dataset structures.
 
         This method:
-        - Groups verbs by conjugation template
-        - Creates shuffled verb and label lists
+        - Shuffles the verbs with a fixed seed
+        - Encodes their templates as an array of template ids
+        - Groups verb positions by template
         - Builds a mapping from templates to verbs
         """
-        conjug = defaultdict(list)
-
         verb_items = list(self.verbs_dict.items())
         Random(42).shuffle(verb_items)
 
-        for verb, info_verb in verb_items:
-            self.verbs_list.append(verb)
-            self.templates_list.append(
-                self.templates.index(info_verb["template"])
-            )
-            conjug[info_verb["template"]].append(verb)
-
-        self.dict_conjug = conjug
+        self.verbs_list = [verb for verb, _ in verb_items]
+        self._verbs_array = np.array(self.verbs_list, dtype=object)
+        self.templates_list = np.fromiter(
+            (self.template_ids[info_verb["template"]] for _, info_verb in verb_items),
+            dtype=np.intp,
+            count=len(verb_items),
+        )
+
+        labels = self.templates_list
+        order = np.argsort(labels, kind="stable")
+        bounds = np.cumsum(np.bincount(labels, minlength=len(self.templates)))
+        groups = np.split(order, bounds[:-1])
+
+        # Keep the templates in order of first appearance, as the split
+        # relies on it for reproducibility.
+        first_seen = np.unique(labels, return_index=True)
+        self.template_indices = {
+            int(label): groups[label]
+            for label in first_seen[0][np.argsort(first_seen[1])]
+        }
+        self.dict_conjug = {
+            self.templates[label]: self._verbs_array[positions].tolist()
+            for label, positions in self.template_indices.items()
+        }
 
     def split_data(self, threshold=8, proportion=0.5):
         """
@@ -123,6 +161,8 @@ class DataSet:
         -----
         - Classes below the threshold are not split.
         - Random seed is fixed for reproducibility.
+        - The splits are computed as `train_indices` and `test_indices`,
+          then the train/test lists are built from them.
         """
         if proportion <= 0 or proportion > 1:
             raise ValueError(_("The split proportion must be between 0 and 1."))
@@ -130,34 +170,91 @@ class DataSet:
         self.min_threshold = threshold
         self.split_proportion = proportion
 
-        train_set = []
-        test_set = []
+        train_parts = []
+        test_parts = []
 
-        for template, lverbs in self.dict_conjug.items():
-            if len(lverbs) <= threshold:
-                for verbe in lverbs:
-                    train_set.append((verbe, template))
+        for positions in self.template_indices.values():
+            if len(positions) <= threshold:
+                train_parts.append(positions)
             else:
-                index = round(len(lverbs) * proportion)
+                index = round(len(positions) * proportion)
+                train_parts.append(positions[:index])
+                test_parts.append(positions[index:])
+
+        self.train_indices = self._shuffled(train_parts)
+        self.test_indices = self._shuffled(test_parts)
+
+        self.train_input = self._verbs_array[self.train_indices].tolist()
+        self.train_labels = self.templates_list[self.train_indices].tolist()
+        self.test_input = self._verbs_array[self.test_indices].tolist()
+        self.test_labels = self.templates_list[self.test_indices].tolist()
+
+    def kfold_indices(self, n_splits=5, n_repeats=1, threshold=None, seed=42):
+        """
+        Generate stratified k-fold train/test index arrays.
+
+        The verbs of each template are shuffled and dealt round-robin into
+        ``n_splits`` folds, continuing the rotation across templates so fold
+        sizes stay balanced. Templates with too few verbs to appear in every
+        fold are kept in the training set of all folds, mirroring the
+        ``threshold`` behaviour of :meth:`split_data`.
+
+        Parameters
+        ----------
+        n_splits : int, default=5
+            Number of folds.
+        n_repeats : int, default=1
+            Number of times the k-fold procedure is repeated with a
+            different shuffle.
+        threshold : int, optional
+            Templates with at most ``threshold`` verbs are never tested.
+            Defaults to ``n_splits - 1``.
+        seed : int, default=42
+            Seed of the first repetition; repetition ``r`` uses ``seed + r``.
+
+        Yields
+        ------
+        tuple of numpy.ndarray
+            ``(train_indices, test_indices)`` positions in `verbs_list`.
 
-                for verbe in lverbs[:index]:
-                    train_set.append((verbe, template))
+        Raises
+        ------
+        ValueError
+            If ``n_splits`` is lower than 2 or ``n_repeats`` lower than 1.
+        """
+        if n_splits < 2:
+            raise ValueError("The number of folds must be at least 2.")
+        if n_repeats < 1:
+            raise ValueError("The number of repeats must be at least 1.")
+
+        if threshold is None:
+            threshold = n_splits - 1
+
+        for repeat in range(n_repeats):
+            rng = Random(seed + repeat)
+            folds = np.full(len(self.verbs_list), -1, dtype=np.intp)
+            offset = 0
 
-                for verbe in lverbs[index:]:
-                    test_set.append((verbe, template))
+            for positions in self.template_indices.values():
+                if len(positions) <= threshold:
+                    continue
 
-        Random(42).shuffle(train_set)
-        Random(42).shuffle(test_set)
+                members = positions.tolist()
+                rng.shuffle(members)
+                folds[members] = (np.arange(len(members)) + offset) % n_splits
+                offset += len(members)
 
-        self.train_input = [elmt[0] for elmt in train_set]
-        self.train_labels = [
-            self.templates.index(elmt[1]) for elmt in train_set
-        ]
+            for fold in range(n_splits):
+                yield np.flatnonzero(folds != fold), np.flatnonzero(folds == fold)
 
-        self.test_input = [elmt[0] for elmt in test_set]
-        self.test_labels = [
-            self.templates.index(elmt[1]) for elmt in test_set
-        ]
+    @staticmethod
+    def _shuffled(parts):
+        """
+        Concatenate index arrays and shuffle them with the fixed seed.
+        """
+        indices = np.concatenate(parts).tolist() if parts else []
+        Random(42).shuffle(indices)
+        return np.asarray(indices, dtype=np.intp)
 
 
 if __name__ == "__main__":
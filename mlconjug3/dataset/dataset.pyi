@@ -1,6 +1,7 @@
 from typing import (
     Optional,
     Mapping,
+    Dict,
     List,
     Sequence,
     DefaultDict,
@@ -9,24 +10,40 @@ from typing import (
     Type,
     AbstractSet,
     Union,
+    Iterator,
 )
+import numpy as np
 
 class DataSet:
     verbs_dict: Mapping[str, Mapping[str, str]] = ...
     verbs: AbstractSet[str] = ...
     templates: List[str] = ...
+    template_ids: Dict[str, int] = ...
     verbs_list: List[str] = ...
-    templates_list: List[int] = ...
-    dict_conjug: Optional[DefaultDict[str, Sequence[str]]] = ...
-    train_input: Sequence[str] = ...
-    train_labels: Sequence[int] = ...
-    test_input: Sequence[str] = ...
-    test_labels: Sequence[int] = ...
+    templates_list: np.ndarray = ...
+    template_indices: Dict[int, np.ndarray] = ...
+    train_indices: np.ndarray = ...
+    test_indices: np.ndarray = ...
     min_threshold: int = ...
     split_proportion: float = ...
+    dict_conjug: Optional[Dict[str, List[str]]] = ...
+    train_input: List[str] = ...
+    train_labels: List[int] = ...
+    test_input: List[str] = ...
+    test_labels: List[int] = ...
+    _verbs_array: np.ndarray = ...
     def __init__(self, verbs_dict: Mapping[str, Mapping[str, str]] = ...) -> None: ...
     def __repr__(self) -> str: ...
     def construct_dict_conjug(self) -> None: ...
     def split_data(
         self, threshold: int = ..., proportion: Union[float, int] = ...
     ) -> None: ...
+    def kfold_indices(
+        self,
+        n_splits: int = ...,
+        n_repeats: int = ...,
+        threshold: Optional[int] = ...,
+        seed: int = ...,
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]: ...
+    @staticmethod
+    def _shuffled(parts: Sequence[np.ndarray]) -> np.ndarray: ...
@@ -1,7 +1,8 @@
-from .feature_extractor import extract_verb_features
+from .feature_extractor import extract_verb_features, FEATURE_EXTRACTOR_VERSION
 
 from mlconjug3.constants import *
 
 __all__ = [
     "extract_verb_features",
+    "FEATURE_EXTRACTOR_VERSION",
 ]
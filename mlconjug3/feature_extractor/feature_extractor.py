@@ -12,6 +12,12 @@ import re
 from mlconjug3.constants import ALPHABET
 
 
+#: Version of the feature set produced by :func:`extract_verb_features`.
+#: Bump it whenever the extracted features change, so that cached feature
+#: matrices built with a previous version are not reused.
+FEATURE_EXTRACTOR_VERSION = "1"
+
+
 def extract_verb_features(verb, lang=None, ngram_range=None):
     """
     Extract feature representation from a verb for ML classification.
@@ -1,5 +1,7 @@
 from typing import Sequence, Mapping, Dict, Tuple, Optional, Union, Set, TextIO
 
+FEATURE_EXTRACTOR_VERSION: str
+
 def extract_verb_features(
     verb: str, lang: str, ngram_range: Tuple[int, int]
 ) -> Sequence[str]: ...
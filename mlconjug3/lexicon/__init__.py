@@ -0,0 +1,13 @@
+from .lexicon import VerbTrie, Lexicon
+from .fuzzy import FuzzyIndex, edit_distance
+from .normalization import NORMALIZATION_POLICIES, normalize_verb, strip_diacritics
+
+__all__ = [
+    "VerbTrie",
+    "Lexicon",
+    "FuzzyIndex",
+    "edit_distance",
+    "NORMALIZATION_POLICIES",
+    "normalize_verb",
+    "strip_diacritics",
+]
@@ -0,0 +1,258 @@
+"""
+Fuzzy lookup module for mlconjug3.
+
+This module provides a symmetric-delete index used to find the known verbs
+closest to a misspelled input in a few dictionary probes instead of a scan
+of the whole lexicon.
+
+Every verb is indexed under all the strings obtained by deleting up to
+``max_distance`` characters. Two words within edit distance ``k`` always
+share such a deletion variant, so candidates are gathered by looking up the
+variants of the query and then verified with an exact, bounded edit
+distance. Variants are stored as sorted CRC32 hashes in numpy arrays, which
+keeps the index compact and cheap to serialize.
+"""
+
+from itertools import combinations
+from zlib import crc32
+
+import numpy as np
+
+
+def _deletes(word, max_distance):
+    """
+    Generate the deletion variants of a word.
+
+    Parameters
+    ----------
+    word : str
+        Word to transform.
+    max_distance : int
+        Maximum number of deleted characters.
+
+    Returns
+    -------
+    set of str
+        Variants of ``word`` with 0 to ``max_distance`` characters removed.
+    """
+    variants = {word}
+    for distance in range(1, min(max_distance, len(word)) + 1):
+        for positions in combinations(range(len(word)), distance):
+            variant = list(word)
+            for position in reversed(positions):
+                del variant[position]
+            variants.add("".join(variant))
+    return variants
+
+
+def _hash(variant):
+    return crc32(variant.encode("utf-8"))
+
+
+def edit_distance(source, target, max_distance=None):
+    """
+    Compute the optimal string alignment distance between two strings.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each cost 1.
+
+    Parameters
+    ----------
+    source : str
+        First string.
+    target : str
+        Second string.
+    max_distance : int, optional
+        If given, computation stops as soon as the distance is known to
+        exceed this bound.
+
+    Returns
+    -------
+    int
+        Edit distance, or ``max_distance + 1`` if it exceeds ``max_distance``.
+    """
+    if max_distance is not None and abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    previous = None
+    current = list(range(len(target) + 1))
+
+    for i in range(1, len(source) + 1):
+        before, previous = previous, current
+        current = [i] + [0] * len(target)
+
+        for j in range(1, len(target) + 1):
+            cost = source[i - 1] != target[j - 1]
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + cost,
+            )
+            if (
+                before is not None
+                and j > 1
+                and source[i - 1] == target[j - 2]
+                and source[i - 2] == target[j - 1]
+            ):
+                current[j] = min(current[j], before[j - 2] + 1)
+
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+
+    return current[-1]
+
+
+class FuzzyIndex:
+    """
+    Symmetric-delete index for approximate verb lookup.
+
+    Parameters
+    ----------
+    words : iterable of str
+        Words to index.
+    max_distance : int, default=2
+        Largest edit distance supported by queries.
+
+    Attributes
+    ----------
+    words : tuple of str
+        Indexed words in lexicographic order.
+    max_distance : int
+        Largest edit distance supported by queries.
+    """
+
+    __slots__ = ("words", "max_distance", "_keys", "_ids")
+
+    def __init__(self, words, max_distance=2):
+        self.words = tuple(sorted(set(words)))
+        self.max_distance = max_distance
+
+        keys = []
+        ids = []
+
+        for word_id, word in enumerate(self.words):
+            variants = _deletes(word, max_distance)
+            keys.extend(_hash(variant) for variant in variants)
+            ids.extend([word_id] * len(variants))
+
+        keys = np.asarray(keys, dtype=np.uint32)
+        ids = np.asarray(ids, dtype=np.int32)
+        order = np.argsort(keys, kind="stable")
+
+        self._keys = keys[order]
+        self._ids = ids[order]
+
+    def __repr__(self):
+        return (
+            f"{__name__}.{self.__class__.__name__}"
+            f"(words={len(self.words)}, max_distance={self.max_distance})"
+        )
+
+    def __len__(self):
+        return len(self.words)
+
+    def _check_distance(self, max_distance):
+        if max_distance is None:
+            return self.max_distance
+        if max_distance > self.max_distance:
+            raise ValueError(
+                f"The index supports edit distances up to {self.max_distance}, "
+                f"got {max_distance}."
+            )
+        return max_distance
+
+    def _rank(self, word, candidate_ids, max_distance, limit):
+        """
+        Verify candidates and return the closest ones.
+        """
+        matches = []
+
+        for word_id in np.unique(candidate_ids):
+            candidate = self.words[word_id]
+            distance = edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                matches.append((candidate, distance))
+
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches if limit is None else matches[:limit]
+
+    def lookup(self, word, max_distance=None, limit=5):
+        """
+        Find the indexed words closest to ``word``.
+
+        Parameters
+        ----------
+        word : str
+            Possibly misspelled verb.
+        max_distance : int, optional
+            Maximum edit distance. Defaults to the index ``max_distance``.
+        limit : int or None, default=5
+            Maximum number of matches returned.
+
+        Returns
+        -------
+        list of tuple
+            ``(verb, distance)`` pairs sorted by distance, then verb.
+
+        Raises
+        ------
+        ValueError
+            If ``max_distance`` exceeds the distance the index was built for.
+        """
+        return self.lookup_batch([word], max_distance, limit)[0]
+
+    def lookup_batch(self, words, max_distance=None, limit=5):
+        """
+        Find the closest indexed words for several queries at once.
+
+        All the deletion variants of the queries are located in the index
+        with a single vectorized search.
+
+        Parameters
+        ----------
+        words : sequence of str
+            Possibly misspelled verbs.
+        max_distance : int, optional
+            Maximum edit distance. Defaults to the index ``max_distance``.
+        limit : int or None, default=5
+            Maximum number of matches returned per query.
+
+        Returns
+        -------
+        list of list of tuple
+            For each query, ``(verb, distance)`` pairs sorted by distance.
+        """
+        max_distance = self._check_distance(max_distance)
+
+        hashes = []
+        owners = []
+
+        for position, word in enumerate(words):
+            variants = _deletes(word, max_distance)
+            hashes.extend(_hash(variant) for variant in variants)
+            owners.extend([position] * len(variants))
+
+        hashes = np.asarray(hashes, dtype=np.uint32)
+        owners = np.asarray(owners, dtype=np.intp)
+
+        starts = np.searchsorted(self._keys, hashes, side="left")
+        stops = np.searchsorted(self._keys, hashes, side="right")
+
+        candidates = [[] for _ in words]
+        for owner, start, stop in zip(owners, starts, stops):
+            if start < stop:
+                candidates[owner].append(self._ids[start:stop])
+
+        return [
+            self._rank(
+                word,
+                np.concatenate(ids) if ids else np.empty(0, dtype=np.int32),
+                max_distance,
+                limit,
+            )
+            for word, ids in zip(words, candidates)
+        ]
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,36 @@
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+import numpy as np
+
+def _deletes(word: str, max_distance: int) -> Set[str]: ...
+def _hash(variant: str) -> int: ...
+def edit_distance(
+    source: str, target: str, max_distance: Optional[int] = ...
+) -> int: ...
+
+
+class FuzzyIndex:
+    words: Tuple[str, ...]
+    max_distance: int
+    _keys: np.ndarray
+    _ids: np.ndarray
+
+    def __init__(self, words: Iterable[str], max_distance: int = ...) -> None: ...
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    def _check_distance(self, max_distance: Optional[int]) -> int: ...
+    def _rank(
+        self,
+        word: str,
+        candidate_ids: np.ndarray,
+        max_distance: int,
+        limit: Optional[int],
+    ) -> List[Tuple[str, int]]: ...
+    def lookup(
+        self, word: str, max_distance: Optional[int] = ..., limit: Optional[int] = ...
+    ) -> List[Tuple[str, int]]: ...
+    def lookup_batch(
+        self,
+        words: Sequence[str],
+        max_distance: Optional[int] = ...,
+        limit: Optional[int] = ...,
+    ) -> List[List[Tuple[str, int]]]: ...
@@ -0,0 +1,348 @@
+"""
+Lexicon module for mlconjug3.
+
+This module provides a compact, immutable trie over the verb lexicon of a
+language, together with a :class:`Lexicon` wrapper exposing the queries
+used by the library:
+
+- Exact membership tests
+- Prefix autocomplete
+- Longest known verb that is a suffix of an arbitrary input
+- Fast verb ending checks
+
+The trie is stored in a flat CSR-like layout (one character and one word
+range per node) so it is cheap to build, to pickle and to keep in memory.
+"""
+
+from array import array
+
+
+class VerbTrie:
+    """
+    Compact trie over a sorted list of words.
+
+    Nodes are numbered in breadth-first order so that the children of every
+    node are stored contiguously. Each node keeps the character of its
+    incoming edge and the range of words (in sorted order) found below it,
+    which makes prefix enumeration a simple slice of the sorted word list.
+
+    Parameters
+    ----------
+    words : iterable of str
+        Words to index. Duplicates are ignored.
+
+    Attributes
+    ----------
+    words : tuple of str
+        Indexed words in lexicographic order.
+    """
+
+    __slots__ = ("words", "_labels", "_children", "_lo", "_hi")
+
+    def __init__(self, words):
+        self.words = tuple(sorted(set(words)))
+
+        # The root has no incoming edge, a NUL placeholder keeps labels aligned.
+        labels = ["\0"]
+        children = array("i")
+        lo = array("i", [0])
+        hi = array("i", [len(self.words)])
+        depths = [0]
+
+        node = 0
+        while node < len(lo):
+            start, end, depth = lo[node], hi[node], depths[node]
+            children.append(len(lo))
+
+            # The word equal to the node prefix, if any, always sorts first.
+            if start < end and len(self.words[start]) == depth:
+                start += 1
+
+            while start < end:
+                char = self.words[start][depth]
+                stop = start + 1
+                while stop < end and self.words[stop][depth] == char:
+                    stop += 1
+
+                labels.append(char)
+                lo.append(start)
+                hi.append(stop)
+                depths.append(depth + 1)
+                start = stop
+
+            node += 1
+
+        children.append(len(lo))
+
+        self._labels = "".join(labels)
+        self._children = children
+        self._lo = lo
+        self._hi = hi
+
+    def __repr__(self):
+        return f"{__name__}.{self.__class__.__name__}(words={len(self.words)})"
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __contains__(self, word):
+        node = self._walk(word)
+        return node >= 0 and len(self.words[self._lo[node]]) == len(word)
+
+    def _walk(self, prefix):
+        """
+        Follow ``prefix`` from the root.
+
+        Parameters
+        ----------
+        prefix : str
+            Characters to follow.
+
+        Returns
+        -------
+        int
+            Index of the node reached, or -1 if ``prefix`` leaves the trie.
+        """
+        node = 0
+        for char in prefix:
+            node = self._labels.find(
+                char, self._children[node], self._children[node + 1]
+            )
+            if node < 0:
+                return -1
+        return node
+
+    def count(self, prefix):
+        """
+        Count the words starting with ``prefix``.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix to look up.
+
+        Returns
+        -------
+        int
+            Number of indexed words starting with ``prefix``.
+        """
+        node = self._walk(prefix)
+        if node < 0:
+            return 0
+        return self._hi[node] - self._lo[node]
+
+    def complete(self, prefix, limit=10):
+        """
+        Return the words starting with ``prefix``.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix to complete.
+        limit : int or None, default=10
+            Maximum number of words returned. ``None`` returns all of them.
+
+        Returns
+        -------
+        list of str
+            Matching words in lexicographic order.
+        """
+        node = self._walk(prefix)
+        if node < 0:
+            return []
+
+        start, end = self._lo[node], self._hi[node]
+        if limit is not None:
+            end = min(end, start + limit)
+        return list(self.words[start:end])
+
+    def longest_prefix_of(self, text, min_length=1):
+        """
+        Find the longest indexed word that is a prefix of ``text``.
+
+        Parameters
+        ----------
+        text : str
+            Input string.
+        min_length : int, default=1
+            Minimum length of the returned word.
+
+        Returns
+        -------
+        str or None
+            Longest matching word, or None if no word of at least
+            ``min_length`` characters is a prefix of ``text``.
+        """
+        node = 0
+        match = None
+
+        for depth, char in enumerate(text, 1):
+            node = self._labels.find(
+                char, self._children[node], self._children[node + 1]
+            )
+            if node < 0:
+                break
+            if depth >= min_length and len(self.words[self._lo[node]]) == depth:
+                match = self.words[self._lo[node]]
+
+        return match
+
+    def prefixes(self, length):
+        """
+        Collect the distinct prefixes of exactly ``length`` characters.
+
+        Parameters
+        ----------
+        length : int
+            Prefix length.
+
+        Returns
+        -------
+        set of str
+            Prefixes of the indexed words with the requested length.
+        """
+        level = [(0, "")]
+        for _ in range(length):
+            level = [
+                (child, prefix + self._labels[child])
+                for node, prefix in level
+                for child in range(self._children[node], self._children[node + 1])
+            ]
+        return {prefix for _, prefix in level}
+
+
+class Lexicon:
+    """
+    Verb lexicon supporting prefix and suffix queries.
+
+    The lexicon keeps two :class:`VerbTrie` instances: one over the verbs and
+    one over the reversed verbs, so that both autocomplete and ending
+    queries are answered in time proportional to the query length.
+
+    Parameters
+    ----------
+    verbs : iterable of str
+        Verbs of the language, typically the keys of ``ConjugManager.verbs``.
+    """
+
+    __slots__ = ("_forward", "_backward")
+
+    def __init__(self, verbs):
+        verbs = set(verbs)
+        self._forward = VerbTrie(verbs)
+        self._backward = VerbTrie(verb[::-1] for verb in verbs)
+
+    def __repr__(self):
+        return f"{__name__}.{self.__class__.__name__}(verbs={len(self)})"
+
+    def __len__(self):
+        return len(self._forward)
+
+    def __iter__(self):
+        return iter(self._forward)
+
+    def __contains__(self, verb):
+        return verb in self._forward
+
+    def complete(self, prefix, limit=10):
+        """
+        Autocomplete a partially typed verb.
+
+        Parameters
+        ----------
+        prefix : str
+            Beginning of the verb.
+        limit : int or None, default=10
+            Maximum number of suggestions.
+
+        Returns
+        -------
+        list of str
+            Known verbs starting with ``prefix``, in lexicographic order.
+        """
+        return self._forward.complete(prefix, limit)
+
+    def count_prefix(self, prefix):
+        """
+        Count the known verbs starting with ``prefix``.
+        """
+        return self._forward.count(prefix)
+
+    def count_suffix(self, ending):
+        """
+        Count the known verbs ending with ``ending``.
+        """
+        return self._backward.count(ending[::-1])
+
+    def with_ending(self, ending, limit=10):
+        """
+        List known verbs ending with ``ending``.
+
+        Parameters
+        ----------
+        ending : str
+            Verb ending.
+        limit : int or None, default=10
+            Maximum number of verbs returned.
+
+        Returns
+        -------
+        list of str
+            Matching verbs, ordered by their reversed spelling.
+        """
+        return [verb[::-1] for verb in self._backward.complete(ending[::-1], limit)]
+
+    def has_ending(self, ending):
+        """
+        Check whether at least one known verb ends with ``ending``.
+        """
+        return self._backward._walk(ending[::-1]) >= 0
+
+    def longest_known_suffix(self, verb, min_length=1):
+        """
+        Find the longest known verb that is a suffix of ``verb``.
+
+        Parameters
+        ----------
+        verb : str
+            Input verb, usually absent from the lexicon.
+        min_length : int, default=1
+            Minimum length of the returned verb.
+
+        Returns
+        -------
+        str or None
+            Longest known verb ``v`` such that ``verb.endswith(v)``,
+            or None if there is none.
+        """
+        match = self._backward.longest_prefix_of(verb[::-1], min_length)
+        return None if match is None else match[::-1]
+
+    def endings(self, length, key=None):
+        """
+        Collect the distinct endings of ``length`` characters.
+
+        Parameters
+        ----------
+        length : int
+            Ending length.
+        key : callable, optional
+            Applied to each verb of at least ``length`` characters before
+            its ending is taken, e.g. to keep the first word of multi-word
+            entries. Without it, the endings are read from the reversed trie.
+
+        Returns
+        -------
+        set of str
+            Endings of the known verbs with the requested length.
+        """
+        if key is None:
+            return {ending[::-1] for ending in self._backward.prefixes(length)}
+        return {key(verb)[-length:] for verb in self if len(verb) >= length}
+
+
+if __name__ == "__main__":
+    pass
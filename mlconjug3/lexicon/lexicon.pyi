@@ -0,0 +1,41 @@
+from array import array
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class VerbTrie:
+    words: Tuple[str, ...]
+    _labels: str
+    _children: array
+    _lo: array
+    _hi: array
+
+    def __init__(self, words: Iterable[str]) -> None: ...
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __contains__(self, word: object) -> bool: ...
+    def _walk(self, prefix: str) -> int: ...
+    def count(self, prefix: str) -> int: ...
+    def complete(self, prefix: str, limit: Optional[int] = ...) -> List[str]: ...
+    def longest_prefix_of(self, text: str, min_length: int = ...) -> Optional[str]: ...
+    def prefixes(self, length: int) -> Set[str]: ...
+
+
+class Lexicon:
+    _forward: VerbTrie
+    _backward: VerbTrie
+
+    def __init__(self, verbs: Iterable[str]) -> None: ...
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __contains__(self, verb: object) -> bool: ...
+    def complete(self, prefix: str, limit: Optional[int] = ...) -> List[str]: ...
+    def count_prefix(self, prefix: str) -> int: ...
+    def count_suffix(self, ending: str) -> int: ...
+    def with_ending(self, ending: str, limit: Optional[int] = ...) -> List[str]: ...
+    def has_ending(self, ending: str) -> bool: ...
+    def longest_known_suffix(self, verb: str, min_length: int = ...) -> Optional[str]: ...
+    def endings(
+        self, length: int, key: Optional[Callable[[str], str]] = ...
+    ) -> Set[str]: ...
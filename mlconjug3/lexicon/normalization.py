@@ -0,0 +1,64 @@
+"""
+Normalization module for mlconjug3.
+
+This module defines how user input is normalized before it is matched
+against the verb lexicon, so that case variants, decomposed Unicode and,
+optionally, missing diacritics still resolve to a known infinitive.
+"""
+
+import unicodedata
+
+
+#: Supported normalization policies, from the strictest to the loosest.
+#:
+#: - "lower": lowercase only (historical behaviour)
+#: - "casefold": NFC composition and Unicode case folding
+#: - "accents": "casefold" plus removal of diacritics
+NORMALIZATION_POLICIES = ("lower", "casefold", "accents")
+
+
+def strip_diacritics(text):
+    """
+    Remove combining diacritical marks from a string.
+
+    Parameters
+    ----------
+    text : str
+        Input string.
+
+    Returns
+    -------
+    str
+        ``text`` without diacritics, in NFC form.
+    """
+    decomposed = unicodedata.normalize("NFD", text)
+    return unicodedata.normalize(
+        "NFC",
+        "".join(char for char in decomposed if not unicodedata.combining(char)),
+    )
+
+
+def normalize_verb(verb, strip_accents=False):
+    """
+    Compute the normalized lookup key of a verb.
+
+    Parameters
+    ----------
+    verb : str
+        Verb as typed by the user.
+    strip_accents : bool, default=False
+        Whether diacritics are removed.
+
+    Returns
+    -------
+    str
+        NFC, casefolded and optionally diacritic-free form of ``verb``.
+    """
+    verb = unicodedata.normalize("NFC", verb).casefold()
+    if strip_accents:
+        verb = strip_diacritics(verb)
+    return verb
+
+
+if __name__ == "__main__":
+    pass
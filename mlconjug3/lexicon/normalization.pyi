@@ -0,0 +1,6 @@
+from typing import Tuple
+
+NORMALIZATION_POLICIES: Tuple[str, ...]
+
+def strip_diacritics(text: str) -> str: ...
+def normalize_verb(verb: str, strip_accents: bool = ...) -> str: ...
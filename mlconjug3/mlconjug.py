@@ -15,14 +15,32 @@ from .verbs import *
 from .feature_extractor import extract_verb_features
 from .dataset import DataSet
 from .models import Model
+from .lexicon import NORMALIZATION_POLICIES
 from .utils import logger
+from .utils.prediction_cache import PredictionCache
 
 from functools import lru_cache
+import copy
+import weakref
+import unicodedata
+from time import perf_counter
 from concurrent.futures import ProcessPoolExecutor
 from zipfile import ZipFile
 import joblib
 from importlib import resources
 import numpy as np
+import threading
+from collections import OrderedDict
+
+#: Number of predictions kept in memory by each Conjugator.
+_PREDICTION_MEMO_SIZE = 4096
+
+#: Number of verbs whose predictions conjugate_batch requests at once.
+_BATCH_CHUNK_SIZE = 1024
+
+# Prediction cache hash of each model set on a Conjugator, with the model
+# version, constraint and templates it was computed for.
+_model_hashes = weakref.WeakKeyDictionary()
 
 
 VERBS = {
@@ -41,14 +59,85 @@ class Conjugator:
 
     Combines:
     - Verbiste dictionary-based conjugation
+    - Optional lexicon suffix matching for prefixed forms of known verbs
     - Machine learning fallback for unknown verbs
+
+    Parameters
+    ----------
+    language : str, default="fr"
+        Language of the conjugator.
+    model : Model, optional
+        Model used for unknown verbs. Defaults to the pre-trained model.
+    suffix_resolution : bool, default=False
+        If True, an unknown verb ending with a known verb of at least
+        ``min_suffix_length`` characters (e.g. "redéfaire" and "défaire")
+        reuses that verb's template instead of querying the model.
+    min_suffix_length : int, default=4
+        Minimum length of the known verb used for suffix resolution.
+    constrained_prediction : bool, default=False
+        If True, the model only scores templates whose ending is a suffix
+        of the verb (see :meth:`Model.constrain_to_templates`). The
+        constraint is applied to a copy of the model, so a model shared
+        with other Conjugators or a trainer is left unchanged.
+    normalization : str, default="lower"
+        How input is matched against the lexicon. "lower" only lowercases
+        it. "casefold" also applies NFC composition and case folding and
+        resolves the result through ``ConjugManager.normalized_index``, so
+        "Être" or a decomposed "être" find "être". "accents" additionally
+        ignores diacritics ("etre" finds "être"). When several infinitives
+        share a normalized form, the first in lexicographic order is used.
+    instrumentation : Instrumentation, optional
+        If set, records the duration of each stage of the calls, their
+        path, cache hits and batch sizes (see
+        :mod:`mlconjug3.utils.instrumentation`).
+    prediction_cache : PredictionCache, optional
+        If set, the templates predicted by the model are stored in this
+        persistent cache and reused by later calls, runs and processes
+        using the same model (see :mod:`mlconjug3.utils.prediction_cache`).
+
+    The path used to conjugate a verb is stored in the ``source`` attribute
+    of the returned Verb: "dictionary", "suffix" or "model". The time needed
+    to load the pre-trained model, in seconds, is stored in
+    ``model_load_time`` (None when a model is given).
     """
 
-    def __init__(self, language="fr", model=None):
+    instrumentation = None
+    model_load_time = None
+    prediction_cache = None
+    _model_hash = None
+    _model_source = None
+    _model_versions = None
+
+    def __init__(
+        self,
+        language="fr",
+        model=None,
+        suffix_resolution=False,
+        min_suffix_length=4,
+        constrained_prediction=False,
+        normalization="lower",
+        instrumentation=None,
+        prediction_cache=None,
+    ):
+        if normalization not in NORMALIZATION_POLICIES:
+            raise ValueError(
+                f"Unsupported normalization policy {normalization!r}, "
+                f"expected one of {', '.join(NORMALIZATION_POLICIES)}."
+            )
+
         self.language = language
+        self.normalization = normalization
         self.conjug_manager = Verbiste(language=language)
+        self.suffix_resolution = suffix_resolution
+        self.min_suffix_length = min_suffix_length
+        self.constrained_prediction = constrained_prediction
+        self.instrumentation = instrumentation
+        self.prediction_cache = prediction_cache
+        self._predictions = OrderedDict()
+        self._predictions_lock = threading.Lock()
 
         if model is None:
+            start = perf_counter()
             resource_path = resources.files(RESOURCE_PACKAGE).joinpath(
                 PRE_TRAINED_MODEL_PATH[language]
             )
@@ -60,6 +149,7 @@ class Conjugator:
                     ) as archive:
                         model = joblib.load(archive)
 
+            self.model_load_time = perf_counter() - start
             self.set_model(model)
         else:
             if isinstance(model, Model):
@@ -73,36 +163,133 @@ class Conjugator:
     def __repr__(self):
         return f"{__name__}.{self.__class__.__name__}(language={self.language})"
 
+    def __getstate__(self):
+        # Instrumentation stays in this process; lists are conjugated by
+        # worker processes receiving a pickled copy of the Conjugator.
+        self._refresh_model()
+        state = self.__dict__.copy()
+        state["instrumentation"] = None
+        state["_predictions"] = OrderedDict()
+        del state["_predictions_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._predictions_lock = threading.Lock()
+        # Model versions are not pickled; the unpickled models start over.
+        if self._model_source is not None:
+            self._model_versions = (self._model_source.version, self.model.version)
+
+    def _refresh_model(self):
+        """
+        Set the model again if it was changed in place since it was set.
+        """
+        source = self._model_source
+        if source is not None and self._model_versions != (source.version, self.model.version):
+            # The model was changed in place (e.g. by ConjugatorTrainer.update).
+            self.set_model(source)
+
     def conjugate(self, verbs, subject="abbrev"):
+        self._refresh_model()
+
+        instrumentation = self.instrumentation
+
         if isinstance(verbs, str):
-            return self._conjugate(verbs, subject)
+            if instrumentation is None:
+                return self._conjugate(verbs, subject)
+            return self._instrumented_conjugate(instrumentation, verbs, subject)
+
+        if instrumentation is None:
+            with ProcessPoolExecutor() as executor:
+                return list(
+                    executor.map(self._conjugate, verbs, [subject] * len(verbs))
+                )
 
-        with ProcessPoolExecutor() as executor:
-            return list(
-                executor.map(self._conjugate, verbs, [subject] * len(verbs))
-            )
+        start = perf_counter()
+        instrumentation.start_batch(len(verbs))
+        try:
+            with ProcessPoolExecutor() as executor:
+                return list(
+                    executor.map(self._conjugate, verbs, [subject] * len(verbs))
+                )
+        finally:
+            instrumentation.record_batch(len(verbs), perf_counter() - start)
+
+    def _instrumented_conjugate(self, instrumentation, verb, subject):
+        """
+        Conjugate a single verb while recording its timings.
+        """
+        timer = instrumentation.start(verb, self.language)
+        result = None
+
+        try:
+            result = self._conjugate(verb, subject)
+        except Exception:
+            instrumentation.stop(timer, error=True)
+            raise
+
+        # The body of _conjugate marks the timer of the current thread, so
+        # an unmarked timer means this call was answered by the LRU cache.
+        instrumentation.stop(timer, result, cache_hit=not timer.stages)
+        return result
 
     @lru_cache(maxsize=1024)
     def _conjugate(self, verb, subject="abbrev"):
-        verb = verb.lower()
+        timer = None
+        if self.instrumentation is not None:
+            timer = self.instrumentation.timer
+
+        verb = self._resolve_infinitive(verb)
+        if timer is not None:
+            timer.mark("resolve")
 
         # ---------------------------
         # RULE-BASED PATH
         # ---------------------------
         if verb in self.conjug_manager.verbs:
             verb_info = self.conjug_manager.get_verb_info(verb)
+            if timer is not None:
+                timer.mark("lookup")
 
             # guard against corrupted/empty Verbiste entries
             if verb_info is None:
                 return None
 
             conjug_info = self.conjug_manager.get_conjug_info(verb_info.template)
+            if timer is not None:
+                timer.mark("conjug_info")
 
             # prevent Verb(None) crash
             if verb_info is None or conjug_info is None:
                 return None
 
-            return VERBS[self.language](verb_info, conjug_info, subject)
+            verb_object = VERBS[self.language](verb_info, conjug_info, subject)
+            verb_object.source = "dictionary"
+            if timer is not None:
+                timer.mark("verb")
+            return verb_object
+
+        if timer is not None:
+            timer.mark("lookup")
+
+        # ---------------------------
+        # LEXICON SUFFIX PATH
+        # ---------------------------
+        if self.suffix_resolution:
+            known_verb = self.conjug_manager.longest_known_suffix(
+                verb, self.min_suffix_length
+            )
+            if known_verb is not None:
+                template = self.conjug_manager.verbs[known_verb]["template"]
+                verb_object = self._build_verb(verb, template, subject)
+                if verb_object is not None:
+                    verb_object.source = "suffix"
+                    if timer is not None:
+                        timer.mark("suffix")
+                    return verb_object
+
+            if timer is not None:
+                timer.mark("suffix")
 
         # ---------------------------
         # ML FALLBACK PATH
@@ -113,38 +300,175 @@ class Conjugator:
             )
             return None
 
-        prediction = self.model.predict([verb])[0]
+        [(template, confidence_score)] = self._predict_templates([verb], timer)
+
+        if template is None:
+            return None
+
+        verb_object = self._build_verb(verb, template, subject, predicted=True)
 
-        template = None
-        confidence_score = None
+        if verb_object is None:
+            return None
+
+        verb_object.source = "model"
+
+        if confidence_score is not None:
+            verb_object.confidence_score = confidence_score
+
+        if timer is not None:
+            timer.mark("verb")
+
+        return verb_object
+
+    def _predict_templates(self, verbs, timer=None):
+        """
+        Predict the templates of verbs absent from the lexicon.
+
+        Recent predictions are kept in memory, so that verbs predicted
+        together by :meth:`conjugate_batch` are not predicted again when
+        they are conjugated one by one.
+
+        Parameters
+        ----------
+        verbs : list of str
+            Resolved infinitives.
+        timer : CallTimer, optional
+            Timer receiving the prediction_cache, predict, template and
+            predict_proba stages.
+
+        Returns
+        -------
+        list of tuple
+            ``(template, confidence_score)`` for each verb.
+        """
+        memo = self._predictions
+        predictions = {}
+
+        with self._predictions_lock:
+            for verb in verbs:
+                if verb in memo:
+                    memo.move_to_end(verb)
+                    predictions[verb] = memo[verb]
+
+        missing = [verb for verb in dict.fromkeys(verbs) if verb not in predictions]
+        if missing:
+            predicted = self._predict_missing(missing, timer)
+            predictions.update(zip(missing, predicted))
+
+            with self._predictions_lock:
+                memo.update(zip(missing, predicted))
+                while len(memo) > _PREDICTION_MEMO_SIZE:
+                    memo.popitem(last=False)
+
+        return [predictions[verb] for verb in verbs]
+
+    def _predict_missing(self, verbs, timer=None):
+        """
+        Predict templates through the prediction cache if there is one.
+        """
+        cache = self.prediction_cache
+        if cache is None:
+            return self._predict_with_model(verbs, timer)
+
+        model_hash = self._hash_model()
+        predictions = cache.get_many(model_hash, self.language, verbs)
+        if timer is not None:
+            timer.mark("prediction_cache")
+
+        missing = [verb for verb in dict.fromkeys(verbs) if verb not in predictions]
+        if missing:
+            predicted = self._predict_with_model(missing, timer)
+            cache.put_many(
+                model_hash,
+                self.language,
+                [
+                    (verb, template, confidence_score)
+                    for verb, (template, confidence_score) in zip(missing, predicted)
+                ],
+            )
+            predictions.update(zip(missing, predicted))
+
+        return [predictions[verb] for verb in verbs]
+
+    def _hash_model(self):
+        """
+        Return the hash of the model keying the prediction cache.
+
+        Hashing pickles the whole model, so hashes are shared by the
+        Conjugators using the same model and only recomputed when its
+        version changes.
+        """
+        if self._model_hash is not None:
+            return self._model_hash
+
+        templates = self.conjug_manager.templates
+        source = self._model_source
+        if source is None:
+            self._model_hash = PredictionCache.model_hash(self.model, templates)
+            return self._model_hash
+
+        key = (source.version, self.model is not source, tuple(templates))
+        entry = _model_hashes.get(source)
+        if entry is None or entry[0] != key:
+            entry = (key, PredictionCache.model_hash(self.model, templates))
+            _model_hashes[source] = entry
+
+        self._model_hash = entry[1]
+        return self._model_hash
+
+    def _predict_with_model(self, verbs, timer=None):
+        """
+        Predict the templates of verbs absent from the lexicon with the model.
+
+        Parameters
+        ----------
+        verbs : list of str
+            Resolved infinitives.
+        timer : CallTimer, optional
+            Timer receiving the predict, template and predict_proba stages.
+
+        Returns
+        -------
+        list of tuple
+            ``(template, confidence_score)`` for each verb. The template is
+            None when the prediction cannot be resolved, the confidence
+            score when the model does not provide probabilities.
+        """
+        predictions = self.model.predict(verbs)
+        if timer is not None:
+            timer.mark("predict")
 
         # ---------------------------
         # TEMPLATE RESOLUTION
         # ---------------------------
-        if isinstance(prediction, (int, np.integer)):
-            try:
-                templates = self.conjug_manager.templates
+        templates = []
+        for prediction in predictions:
+            template = None
 
-                # guard empty / corrupted templates
-                if not templates:
-                    return None
+            if isinstance(prediction, (int, np.integer)):
+                try:
+                    # guard empty / corrupted templates
+                    if self.conjug_manager.templates:
+                        template = self.conjug_manager.templates[int(prediction)]
+                except Exception:
+                    template = None
 
-                template = templates[int(prediction)]
-            except Exception:
-                return None
+            elif isinstance(prediction, str):
+                template = prediction
 
-        elif isinstance(prediction, str):
-            template = prediction
+            templates.append(template)
 
-        else:
-            return None
+        if timer is not None:
+            timer.mark("template")
 
         # ---------------------------
         # PROBABILITY HANDLING
         # ---------------------------
+        confidence_scores = [None] * len(templates)
+
         try:
-            if hasattr(self.model, "predict_proba"):
-                proba = self.model.predict_proba([verb])[0]
+            if hasattr(self.model, "predict_proba") and any(templates):
+                proba = self.model.predict_proba(verbs)
 
                 if hasattr(self.model, "pipeline"):
                     classes = self.model.pipeline.classes_
@@ -153,16 +477,141 @@ class Conjugator:
                 else:
                     classes = None
 
-                if classes is not None and prediction in classes:
-                    class_index = list(classes).index(prediction)
-                    confidence_score = round(float(proba[class_index]), 3)
+                if classes is not None:
+                    class_indices = {label: index for index, label in enumerate(classes)}
 
-        except Exception:
-            confidence_score = None
+                    for row, (prediction, template) in enumerate(zip(predictions, templates)):
+                        class_index = class_indices.get(prediction)
+                        if template is not None and class_index is not None:
+                            confidence_scores[row] = round(float(proba[row][class_index]), 3)
 
-        # ---------------------------
-        # FINAL VERB BUILD (SAFE)
-        # ---------------------------
+        except Exception:
+            confidence_scores = [None] * len(templates)
+
+        if timer is not None:
+            timer.mark("predict_proba")
+
+        return list(zip(templates, confidence_scores))
+
+    def conjugate_batch(self, verbs, subject="abbrev"):
+        """
+        Conjugate a list of verbs in the current process.
+
+        The templates of the verbs absent from the lexicon are first
+        predicted together, with a single call to the model, which is much
+        faster than one call per verb. Every verb is then conjugated as with
+        :meth:`conjugate`, so results are served from the LRU cache and
+        recorded by the instrumentation as usual. Unlike :meth:`conjugate`
+        with a list, no worker process is started, so this suits
+        long-running services and small lists.
+
+        Parameters
+        ----------
+        verbs : list of str
+            Verbs to conjugate.
+        subject : str, default="abbrev"
+            Subject format ('abbrev' or 'pronoun').
+
+        Returns
+        -------
+        list of Verb or None
+            Conjugated verbs, None for the verbs that cannot be conjugated.
+        """
+        results = []
+
+        for start in range(0, len(verbs), _BATCH_CHUNK_SIZE):
+            chunk = verbs[start:start + _BATCH_CHUNK_SIZE]
+            unknown = []
+
+            for verb in chunk:
+                infinitive = self._resolve_infinitive(verb)
+                if infinitive not in self.conjug_manager.verbs and not (
+                    self.suffix_resolution
+                    and self.conjug_manager.longest_known_suffix(
+                        infinitive, self.min_suffix_length
+                    )
+                    is not None
+                ):
+                    unknown.append(infinitive)
+
+            if unknown and self.model is not None:
+                self._prefetch_predictions(unknown)
+
+            results.extend(self.conjugate(verb, subject) for verb in chunk)
+
+        return results
+
+    def _prefetch_predictions(self, verbs):
+        """
+        Predict the templates of unknown verbs at once into the prediction memo.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            self._predict_templates(verbs)
+            return
+
+        start = perf_counter()
+        instrumentation.start_batch(len(verbs))
+        try:
+            self._predict_templates(verbs)
+        finally:
+            instrumentation.record_batch(len(verbs), perf_counter() - start)
+
+    def _resolve_infinitive(self, verb):
+        """
+        Map user input to a lexicon key according to the normalization policy.
+
+        Parameters
+        ----------
+        verb : str
+            Verb as typed by the user.
+
+        Returns
+        -------
+        str
+            Matching infinitive of the lexicon, or the normalized input if
+            none matches.
+        """
+        if self.normalization == "lower":
+            return verb.lower()
+
+        verbs = self.conjug_manager.verbs
+        strip_accents = self.normalization == "accents"
+
+        verb = unicodedata.normalize("NFC", verb)
+        if verb in verbs:
+            return verb
+
+        lowered = verb.lower()
+        if lowered in verbs:
+            return lowered
+
+        matches = self.conjug_manager.resolve_normalized(verb, strip_accents)
+        if matches:
+            return matches[0]
+
+        return lowered
+
+    def _build_verb(self, verb, template, subject, predicted=False):
+        """
+        Conjugate a verb absent from the lexicon with a given template.
+
+        Parameters
+        ----------
+        verb : str
+            Infinitive to conjugate.
+        template : str
+            Conjugation template, e.g. "aim:er".
+        subject : str
+            Subject format ('abbrev' or 'pronoun').
+        predicted : bool, default=False
+            Whether the template was predicted by the model.
+
+        Returns
+        -------
+        Verb or None
+            Conjugated verb, or None if the template cannot be applied.
+        """
         try:
             colon_index = template.index(":")
             index = -len(template[colon_index + 1:])
@@ -177,12 +626,32 @@ class Conjugator:
         if verb_info is None or conjug_info is None:
             return None
 
-        verb_object = VERBS[self.language](verb_info, conjug_info, subject)
-
-        if confidence_score is not None:
-            verb_object.confidence_score = confidence_score
+        return VERBS[self.language](verb_info, conjug_info, subject, predicted)
+
+    def suggest(self, verbs, max_distance=2, limit=5):
+        """
+        Suggest known verbs close to possibly misspelled input.
+
+        Parameters
+        ----------
+        verbs : str or list of str
+            Verb or verbs to look up.
+        max_distance : int, default=2
+            Maximum edit distance.
+        limit : int or None, default=5
+            Maximum number of suggestions per verb.
+
+        Returns
+        -------
+        list of tuple or list of list of tuple
+            ``(verb, distance)`` pairs sorted by distance, then verb.
+        """
+        if isinstance(verbs, str):
+            verbs = verbs.lower()
+        else:
+            verbs = [verb.lower() for verb in verbs]
 
-        return verb_object
+        return self.conjug_manager.fuzzy_lookup(verbs, max_distance, limit)
 
     def set_model(self, model):
         if not isinstance(model, Model):
@@ -191,4 +660,23 @@ class Conjugator:
             )
             raise ValueError("Invalid model type")
 
+        if "model" in self.__dict__:
+            # Conjugations cached with the previous model are stale.
+            Conjugator._conjugate.cache_clear()
+
+        source = model
+        if self.constrained_prediction:
+            # Constrain a shallow copy sharing the pipeline, so that other
+            # users of the model keep unconstrained predictions.
+            model = copy.copy(model).constrain_to_templates(self.conjug_manager.templates)
+
         self.model = model
+        self._model_source = source
+        # In-place changes of either model make conjugate call set_model again.
+        self._model_versions = (source.version, model.version)
+        self._model_hash = None
+        with self._predictions_lock:
+            self._predictions.clear()
+
+        if self.prediction_cache is not None:
+            self._hash_model()
@@ -5,7 +5,12 @@ from .verbs import Verb
 from .conjug_manager import ConjugManager
 from .models import Model
 from .feature_extractor import extract_verb_features
+from .utils.instrumentation import CallTimer, Instrumentation
+from .utils.prediction_cache import PredictionCache
 from sklearn.pipeline import Pipeline
+from collections import OrderedDict
+from threading import Lock
+from weakref import WeakKeyDictionary
 
 # I am commenting out the sklearn imports because they have yet no stub files.
 # from sklearn.feature_extraction.text import CountVectorizer
@@ -23,14 +28,68 @@ from typing import (
     Union,
 )
 
+_model_hashes: WeakKeyDictionary[Model, Tuple[Tuple[int, bool, Tuple[str, ...]], str]]
+
 class Conjugator:
     language: str = ...
     conjug_manager: ConjugManager = ...
     model: Model = ...
-    def __init__(self, language: str = ..., model: Optional[Model] = ...) -> None: ...
+    suffix_resolution: bool = ...
+    min_suffix_length: int = ...
+    constrained_prediction: bool = ...
+    normalization: str = ...
+    instrumentation: Optional[Instrumentation] = ...
+    model_load_time: Optional[float] = ...
+    prediction_cache: Optional[PredictionCache] = ...
+    _model_hash: Optional[str] = ...
+    _model_source: Optional[Model] = ...
+    _model_versions: Optional[Tuple[int, int]] = ...
+    _predictions: OrderedDict[str, Tuple[Optional[str], Optional[float]]] = ...
+    _predictions_lock: Lock = ...
+    def __init__(
+        self,
+        language: str = ...,
+        model: Optional[Model] = ...,
+        suffix_resolution: bool = ...,
+        min_suffix_length: int = ...,
+        constrained_prediction: bool = ...,
+        normalization: str = ...,
+        instrumentation: Optional[Instrumentation] = ...,
+        prediction_cache: Optional[PredictionCache] = ...,
+    ) -> None: ...
     def __repr__(self) -> str: ...
+    def __getstate__(self) -> dict: ...
+    def __setstate__(self, state: dict) -> None: ...
+    def _refresh_model(self) -> None: ...
     def conjugate(
         self, verb: Union[str, List[str]], subject: str = ...
     ) -> Union[Optional[Verb], List[Optional[Verb]]]: ...
+    def _instrumented_conjugate(
+        self, instrumentation: Instrumentation, verb: str, subject: str
+    ) -> Optional[Verb]: ...
     def _conjugate(self, verb: str, subject: str = ...) -> Optional[Verb]: ...
+    def _predict_templates(
+        self, verbs: List[str], timer: Optional[CallTimer] = ...
+    ) -> List[Tuple[Optional[str], Optional[float]]]: ...
+    def _predict_missing(
+        self, verbs: List[str], timer: Optional[CallTimer] = ...
+    ) -> List[Tuple[Optional[str], Optional[float]]]: ...
+    def _hash_model(self) -> str: ...
+    def _predict_with_model(
+        self, verbs: List[str], timer: Optional[CallTimer] = ...
+    ) -> List[Tuple[Optional[str], Optional[float]]]: ...
+    def conjugate_batch(
+        self, verbs: List[str], subject: str = ...
+    ) -> List[Optional[Verb]]: ...
+    def _prefetch_predictions(self, verbs: List[str]) -> None: ...
+    def _resolve_infinitive(self, verb: str) -> str: ...
+    def _build_verb(
+        self, verb: str, template: str, subject: str, predicted: bool = ...
+    ) -> Optional[Verb]: ...
+    def suggest(
+        self,
+        verbs: Union[str, List[str]],
+        max_distance: int = ...,
+        limit: Optional[int] = ...,
+    ) -> Union[List[Tuple[str, int]], List[List[Tuple[str, int]]]]: ...
     def set_model(self, model: Model) -> None: ...
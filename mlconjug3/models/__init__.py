@@ -1,5 +1,7 @@
 from .models import Model
+from .hierarchical import HierarchicalClassifier
 
 __all__ = [
     "Model",
+    "HierarchicalClassifier",
 ]
@@ -0,0 +1,262 @@
+"""
+hierarchical.py
+
+Defines a two-level template classifier.
+
+Templates are grouped into families sharing the same ending (``aim:er``
+and ``pl:eurer`` both belong to the ``er`` family, ``man:ger`` to the
+``ger`` family). A first classifier predicts the family of a verb, then
+a classifier dedicated to that family predicts the template among its
+members only.
+
+Each member classifier is trained on the verbs of its family, so the
+total one-vs-rest training work drops from ``n_classes * n_samples`` to
+roughly ``n_families * n_samples + n_classes * n_samples / n_families``,
+and a prediction scores the families plus the members of one family
+instead of every template.
+"""
+
+from typing import Optional, Sequence, Any
+
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin, clone
+
+from .models import default_classifier
+
+
+class HierarchicalClassifier(ClassifierMixin, BaseEstimator):
+    """
+    Two-level classifier predicting a template family, then a template.
+
+    The family of a template is its ending, i.e. the part after the colon
+    (``"aim:er"`` → ``"er"``). The classifier can be used as the
+    ``classifier`` of a :class:`Model`::
+
+        Model(language="es", classifier=HierarchicalClassifier(templates))
+
+    Parameters
+    ----------
+    templates : Sequence[str], optional
+        Template names indexed by the integer labels (e.g.
+        ``DataSet.templates``). Not needed for string labels.
+        ``ConjugatorTrainer`` fills it from its dataset when missing.
+    group_classifier : sklearn-compatible classifier, optional
+        Classifier predicting the family. Defaults to the default
+        ``Model`` classifier.
+    member_classifier : sklearn-compatible classifier, optional
+        Classifier predicting the template within a family, cloned once
+        per family. Defaults to the default ``Model`` classifier.
+    ending_length : int, optional
+        If set, families only keep the last ``ending_length`` characters
+        of the template ending, which makes them coarser.
+    min_group_proba : float, default=1e-3
+        In :meth:`predict_proba`, families whose probability is below this
+        value are not scored by their member classifier; their probability
+        is spread evenly over their templates.
+    n_jobs : int, optional
+        Number of threads used by each classifier to fit its one-vs-rest
+        problems, for classifiers supporting it.
+
+    Attributes
+    ----------
+    classes_ : ndarray
+        Template labels.
+    group_names_ : ndarray of str
+        Family of each group id.
+    class_groups_ : ndarray of int
+        Group id of each class in ``classes_``.
+    group_members_ : list of ndarray
+        Positions in ``classes_`` of the templates of each family.
+    group_estimator_ : classifier or None
+        Fitted family classifier, None when there is a single family.
+    estimators_ : list
+        Fitted member classifier of each family, None for families with a
+        single template.
+    """
+
+    def __init__(
+        self,
+        templates: Optional[Sequence[str]] = None,
+        group_classifier: Optional[Any] = None,
+        member_classifier: Optional[Any] = None,
+        ending_length: Optional[int] = None,
+        min_group_proba: float = 1e-3,
+        n_jobs: Optional[int] = None,
+    ) -> None:
+        self.templates = templates
+        self.group_classifier = group_classifier
+        self.member_classifier = member_classifier
+        self.ending_length = ending_length
+        self.min_group_proba = min_group_proba
+        self.n_jobs = n_jobs
+
+    def _make_estimator(self, estimator):
+        """
+        Return an unfitted copy of ``estimator``, or of the default classifier.
+        """
+        estimator = clone(estimator) if estimator is not None else default_classifier()
+        if self.n_jobs is not None and "n_jobs" in estimator.get_params():
+            estimator.set_params(n_jobs=self.n_jobs)
+        return estimator
+
+    def _family(self, label) -> str:
+        """
+        Return the family of a class label.
+        """
+        if isinstance(label, str):
+            template = label
+        elif self.templates is None:
+            raise ValueError(
+                "HierarchicalClassifier needs the template names for integer labels."
+            )
+        else:
+            template = self.templates[int(label)]
+
+        ending = template[template.index(":") + 1:] if ":" in template else template
+
+        if self.ending_length is not None:
+            ending = ending[-self.ending_length:] if self.ending_length else ""
+
+        return ending
+
+    def fit(self, X, y, sample_weight=None) -> "HierarchicalClassifier":
+        """
+        Fit the family classifier and one classifier per family.
+
+        Parameters
+        ----------
+        X : sparse matrix of shape (n_samples, n_features)
+            Feature matrix.
+        y : array-like of shape (n_samples,)
+            Template labels.
+        sample_weight : array-like, optional
+            Optional weights for each sample.
+
+        Returns
+        -------
+        HierarchicalClassifier
+            Fitted classifier.
+        """
+        y = np.asarray(y)
+        self.classes_, positions = np.unique(y, return_inverse=True)
+
+        families = [self._family(label) for label in self.classes_]
+        self.group_names_, self.class_groups_ = np.unique(families, return_inverse=True)
+        sample_groups = self.class_groups_[positions]
+
+        if sample_weight is not None:
+            sample_weight = np.asarray(sample_weight)
+
+        def fit_params(rows=slice(None)):
+            if sample_weight is None:
+                return {}
+            return {"sample_weight": sample_weight[rows]}
+
+        if len(self.group_names_) > 1:
+            self.group_estimator_ = self._make_estimator(
+                self.group_classifier
+            ).fit(X, sample_groups, **fit_params())
+        else:
+            self.group_estimator_ = None
+
+        self.group_members_ = []
+        self.estimators_ = []
+
+        for group in range(len(self.group_names_)):
+            members = np.flatnonzero(self.class_groups_ == group)
+            self.group_members_.append(members)
+
+            if len(members) == 1:
+                self.estimators_.append(None)
+                continue
+
+            rows = np.flatnonzero(sample_groups == group)
+            self.estimators_.append(
+                self._make_estimator(self.member_classifier).fit(
+                    X[rows], positions[rows], **fit_params(rows)
+                )
+            )
+
+        return self
+
+    def _predict_groups(self, X):
+        if self.group_estimator_ is None:
+            return np.zeros(X.shape[0], dtype=np.intp)
+        return self.group_estimator_.predict(X)
+
+    def predict(self, X):
+        """
+        Predict the template of each sample.
+
+        Parameters
+        ----------
+        X : sparse matrix of shape (n_samples, n_features)
+            Feature matrix.
+
+        Returns
+        -------
+        ndarray
+            Predicted template labels.
+        """
+        groups = self._predict_groups(X)
+        positions = np.empty(X.shape[0], dtype=np.intp)
+
+        for group in np.unique(groups):
+            rows = np.flatnonzero(groups == group)
+            estimator = self.estimators_[group]
+
+            if estimator is None:
+                positions[rows] = self.group_members_[group][0]
+            else:
+                positions[rows] = estimator.predict(X[rows])
+
+        return self.classes_[positions]
+
+    def predict_proba(self, X):
+        """
+        Predict template probabilities.
+
+        The probability of a template is the probability of its family
+        times its probability within the family.
+
+        Parameters
+        ----------
+        X : sparse matrix of shape (n_samples, n_features)
+            Feature matrix.
+
+        Returns
+        -------
+        ndarray
+            Probability matrix of shape (n_samples, n_classes).
+        """
+        n_samples = X.shape[0]
+
+        if self.group_estimator_ is None:
+            group_proba = np.ones((n_samples, 1))
+        else:
+            group_proba = self.group_estimator_.predict_proba(X)
+
+        proba = np.zeros((n_samples, len(self.classes_)))
+
+        for group, (members, estimator) in enumerate(
+            zip(self.group_members_, self.estimators_)
+        ):
+            weight = group_proba[:, group]
+
+            if estimator is None:
+                proba[:, members[0]] = weight
+                continue
+
+            proba[:, members] = (weight / len(members))[:, None]
+
+            rows = np.flatnonzero(weight >= self.min_group_proba)
+            if len(rows):
+                proba[np.ix_(rows, estimator.classes_)] = (
+                    weight[rows, None] * estimator.predict_proba(X[rows])
+                )
+
+        return proba
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,42 @@
+from typing import Optional, Sequence, Any, List
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+
+
+class HierarchicalClassifier(ClassifierMixin, BaseEstimator):
+    templates: Optional[Sequence[str]]
+    group_classifier: Optional[Any]
+    member_classifier: Optional[Any]
+    ending_length: Optional[int]
+    min_group_proba: float
+    n_jobs: Optional[int]
+    classes_: np.ndarray
+    group_names_: np.ndarray
+    class_groups_: np.ndarray
+    group_members_: List[np.ndarray]
+    group_estimator_: Optional[Any]
+    estimators_: List[Optional[Any]]
+
+    def __init__(
+        self,
+        templates: Optional[Sequence[str]] = ...,
+        group_classifier: Optional[Any] = ...,
+        member_classifier: Optional[Any] = ...,
+        ending_length: Optional[int] = ...,
+        min_group_proba: float = ...,
+        n_jobs: Optional[int] = ...,
+    ) -> None: ...
+
+    def _make_estimator(self, estimator: Optional[Any]) -> Any: ...
+
+    def _family(self, label: Any) -> str: ...
+
+    def fit(
+        self, X: Any, y: Sequence[Any], sample_weight: Optional[Sequence[float]] = ...
+    ) -> "HierarchicalClassifier": ...
+
+    def _predict_groups(self, X: Any) -> np.ndarray: ...
+
+    def predict(self, X: Any) -> np.ndarray: ...
+
+    def predict_proba(self, X: Any) -> np.ndarray: ...
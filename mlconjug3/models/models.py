@@ -4,30 +4,124 @@ models.py
 Defines the core machine learning model used for verb conjugation.
 """
 
+from collections import defaultdict
 from functools import partial
 from typing import Optional, Sequence, Any
 
-from sklearn.feature_extraction.text import CountVectorizer
+import numpy as np
+from scipy.special import expit
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
 from sklearn.linear_model import SGDClassifier
 from sklearn.pipeline import Pipeline
 
 from mlconjug3.feature_extractor import extract_verb_features
 
 
+# Fitted parameters of SGD-style linear classifiers, grouped by shape.
+_COEF_ATTRIBUTES = ("coef_", "_standard_coef", "_average_coef")
+_INTERCEPT_ATTRIBUTES = ("intercept_", "_standard_intercept", "_average_intercept")
+
+
+def default_classifier(n_jobs=None):
+    """
+    Build the default template classifier.
+
+    Parameters
+    ----------
+    n_jobs : int, optional
+        Number of threads fitting the one-vs-rest problems in parallel.
+
+    Returns
+    -------
+    SGDClassifier
+        Unfitted elasticnet logistic regression trained by SGD.
+    """
+    return SGDClassifier(
+        loss="log_loss",
+        penalty="elasticnet",
+        l1_ratio=0.15,
+        alpha=3e-6,
+        max_iter=4000,
+        tol=1e-4,
+        early_stopping=False,
+        n_iter_no_change=10,
+        random_state=42,
+        n_jobs=n_jobs,
+    )
+
+
+def _resize_linear(classifier, rows, n_classes, n_features):
+    """
+    Reallocate the fitted parameters of a linear classifier.
+
+    Existing classes are moved to ``rows`` and existing features keep their
+    columns. New classes start with zero weights and the mean intercept of
+    the known classes, so they neither dominate nor are ignored before
+    being trained; new features start with zero weights.
+
+    Parameters
+    ----------
+    classifier : sklearn linear classifier
+        Fitted classifier, modified in place.
+    rows : ndarray of int
+        New row of each existing class.
+    n_classes : int
+        New number of classes.
+    n_features : int
+        New number of features.
+    """
+    for name in _COEF_ATTRIBUTES:
+        coef = getattr(classifier, name, None)
+        if coef is None:
+            continue
+        resized = np.zeros((n_classes, n_features), dtype=coef.dtype)
+        resized[rows, :coef.shape[1]] = coef
+        setattr(classifier, name, resized)
+
+    for name in _INTERCEPT_ATTRIBUTES:
+        intercept = getattr(classifier, name, None)
+        if intercept is None:
+            continue
+        intercept = np.atleast_1d(intercept)
+        resized = np.full(n_classes, intercept.mean(), dtype=intercept.dtype)
+        resized[rows] = intercept
+        setattr(classifier, name, resized)
+
+    classifier.n_features_in_ = n_features
+
+
 class Model:
     """
     Machine learning model for verb template classification.
 
     This class wraps a scikit-learn Pipeline composed of:
-    - A feature extractor (CountVectorizer with custom analyzer)
+    - A feature extractor (CountVectorizer with custom analyzer, or
+      HashingVectorizer when ``n_features`` is set)
     - A classifier (SGDClassifier by default)
+
+    Optionally, predictions can be restricted to the templates whose ending
+    is compatible with the input verb (see :meth:`constrain_to_templates`).
     """
 
+    # Class-level defaults keep models pickled by older versions usable.
+    _ending_index = None
+    _ending_lengths = ()
+    _templates = None
+    feature_cache = None
+
+    #: Number of in-place changes of the model in this process (training,
+    #: relabeling, pruning, template constraints). Conjugators compare it
+    #: to detect that their model changed. It is not pickled.
+    version = 0
+
     def __init__(
         self,
         vectorizer: Optional[Any] = None,
         classifier: Optional[Any] = None,
         language: Optional[str] = None,
+        feature_cache: Optional[Any] = None,
+        n_features: Optional[int] = None,
+        n_jobs: Optional[int] = None,
     ) -> None:
         """
         Initialize the Model.
@@ -40,14 +134,38 @@ class Model:
             Classification model used to predict verb templates.
         language : str, optional
             Language code used for feature extraction rules.
+        feature_cache : FeatureCache, optional
+            On-disk cache of vectorized training data, reused by
+            :meth:`train` when the same verbs are vectorized again.
+        n_features : int, optional
+            If set and no vectorizer is given, features are hashed into
+            ``n_features`` columns instead of being stored in a vocabulary.
+            The model then has a fixed size and no vocabulary to pickle,
+            at the cost of occasional feature collisions.
+        n_jobs : int, optional
+            Number of threads used to fit the one-vs-rest problems of the
+            classifier in parallel (see :attr:`n_jobs`).
         """
 
         self.language = language
+        self.feature_cache = feature_cache
 
         # --------------------------
         # VECTORISER
         # --------------------------
-        if vectorizer is None:
+        if vectorizer is None and n_features is not None:
+            vectorizer = HashingVectorizer(
+                analyzer=partial(
+                    extract_verb_features,
+                    lang=language,
+                ),
+                n_features=n_features,
+                binary=True,
+                norm=None,
+                alternate_sign=False,
+                lowercase=False,
+            )
+        elif vectorizer is None:
             vectorizer = CountVectorizer(
                 analyzer=partial(
                     extract_verb_features,
@@ -61,17 +179,7 @@ class Model:
         # CLASSIFIER
         # --------------------------
         if classifier is None:
-            classifier = SGDClassifier(
-                loss="log_loss",
-                penalty="elasticnet",
-                l1_ratio=0.15,
-                alpha=3e-6,
-                max_iter=4000,
-                tol=1e-4,
-                early_stopping=False,
-                n_iter_no_change=10,
-                random_state=42,
-            )
+            classifier = default_classifier()
 
         # --------------------------
         # PIPELINE
@@ -81,6 +189,9 @@ class Model:
             ("classifier", classifier),
         ])
 
+        if n_jobs is not None:
+            self.n_jobs = n_jobs
+
     def __repr__(self) -> str:
         """
         Return string representation of the Model.
@@ -92,6 +203,34 @@ class Model:
         """
         return f"{self.__class__.__name__}(language={self.language})"
 
+    def __getstate__(self):
+        # Models with the same content must pickle, and hash, identically.
+        state = self.__dict__.copy()
+        state.pop("version", None)
+        return state
+
+    @property
+    def n_jobs(self) -> Optional[int]:
+        """
+        Number of parallel jobs used to train the classifier.
+
+        ``SGDClassifier`` fits one binary problem per template; with
+        ``n_jobs`` they are fitted by a pool of threads sharing the same
+        feature matrix, so it is never copied per worker. -1 uses all the
+        cores. None when the classifier has no ``n_jobs`` parameter.
+        """
+        classifier = self.pipeline.steps[-1][1]
+        return classifier.get_params().get("n_jobs")
+
+    @n_jobs.setter
+    def n_jobs(self, n_jobs: Optional[int]) -> None:
+        classifier = self.pipeline.steps[-1][1]
+        if "n_jobs" not in classifier.get_params():
+            raise ValueError(
+                f"{type(classifier).__name__} does not support parallel training."
+            )
+        classifier.set_params(n_jobs=n_jobs)
+
     def train(
         self,
         samples: Sequence[str],
@@ -115,17 +254,421 @@ class Model:
         Model
             Trained model instance.
         """
+        X = self.fit_features(samples)
+        classifier = self.pipeline.steps[-1][1]
+
         if sample_weight is not None:
-            self.pipeline.fit(
-                samples,
-                labels,
-                classifier__sample_weight=sample_weight
+            classifier.fit(X, labels, sample_weight=sample_weight)
+        else:
+            classifier.fit(X, labels)
+
+        self.version += 1
+        return self
+
+    def fit_features(self, samples: Sequence[str]):
+        """
+        Fit the vectorizer and return the feature matrix of the samples.
+
+        When a ``feature_cache`` is set and holds an entry for the same
+        samples, language, feature extractor version and vectorizer
+        parameters, the vocabulary and matrix are restored from it instead
+        of being recomputed.
+
+        Parameters
+        ----------
+        samples : Sequence[str]
+            Input verb strings.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Feature matrix of shape (n_samples, n_features).
+        """
+        self.version += 1
+        vectorizer = self.pipeline.steps[0][1]
+        cache = self.feature_cache
+
+        if cache is None or not cache.supports(vectorizer):
+            return vectorizer.fit_transform(samples)
+
+        key = cache.key(samples, self.language, vectorizer)
+        entry = cache.load(key)
+
+        if entry is not None:
+            vectorizer.vocabulary_, features = entry
+            vectorizer.fixed_vocabulary_ = False
+            return features
+
+        features = vectorizer.fit_transform(samples)
+        cache.save(key, vectorizer.vocabulary_, features)
+        return features
+
+    def _extend_vocabulary(self, samples: Sequence[str]) -> int:
+        """
+        Add the unseen features of ``samples`` to the fitted vocabulary.
+
+        New features get the next free columns and zero weights.
+
+        Returns
+        -------
+        int
+            Number of features added.
+        """
+        vectorizer = self.pipeline.steps[0][1]
+        classifier = self.pipeline.steps[-1][1]
+
+        vocabulary = getattr(vectorizer, "vocabulary_", None)
+        if vocabulary is None:
+            return 0
+
+        analyze = vectorizer.build_analyzer()
+        n_features = classifier.coef_.shape[1]
+        new_terms = {}
+
+        for sample in samples:
+            for term in analyze(sample):
+                if term not in vocabulary and term not in new_terms:
+                    new_terms[term] = n_features + len(new_terms)
+
+        if new_terms:
+            vectorizer.vocabulary_ = {**vocabulary, **new_terms}
+            _resize_linear(
+                classifier,
+                np.arange(len(classifier.classes_)),
+                len(classifier.classes_),
+                n_features + len(new_terms),
             )
+
+        return len(new_terms)
+
+    def _register_classes(self, labels) -> int:
+        """
+        Add the unseen ``labels`` to the classes of the classifier.
+
+        Classes stay sorted, as after a regular fit.
+
+        Returns
+        -------
+        int
+            Number of classes added.
+        """
+        classifier = self.pipeline.steps[-1][1]
+        classes = classifier.classes_
+        merged = np.union1d(classes, labels)
+
+        if len(merged) == len(classes):
+            return 0
+
+        _resize_linear(
+            classifier,
+            np.searchsorted(merged, classes),
+            len(merged),
+            classifier.coef_.shape[1],
+        )
+        classifier.classes_ = merged.astype(classes.dtype, copy=False)
+
+        return len(merged) - len(classes)
+
+    def relabel(self, mapping) -> "Model":
+        """
+        Renumber the classes of a trained model.
+
+        Used when templates are added to a language: template ids are
+        positions in the sorted template list, so existing ids shift.
+
+        Parameters
+        ----------
+        mapping : array-like of int or dict
+            New label of each existing label.
+
+        Returns
+        -------
+        Model
+            The model itself. The template constraint, if any, is disabled
+            and must be set again with the new template list (as done by
+            ``Conjugator.set_model``).
+        """
+        classifier = self.pipeline.steps[-1][1]
+        classes = classifier.classes_
+
+        if isinstance(mapping, dict):
+            relabeled = np.array([mapping[label] for label in classes])
+        else:
+            relabeled = np.asarray(mapping)[classes]
+
+        order = np.argsort(relabeled, kind="stable")
+        rows = np.empty_like(order)
+        rows[order] = np.arange(len(order))
+
+        _resize_linear(classifier, rows, len(classes), classifier.coef_.shape[1])
+        classifier.classes_ = relabeled[order].astype(classes.dtype, copy=False)
+
+        return self.constrain_to_templates(None)
+
+    def partial_fit(
+        self,
+        samples: Sequence[str],
+        labels: Sequence[int],
+        extend_vocabulary: bool = True,
+        sample_weight=None,
+        n_epochs: int = 1,
+    ) -> "Model":
+        """
+        Update a trained model with new samples, without retraining.
+
+        The classifier must support ``partial_fit`` (as ``SGDClassifier``
+        does). Unseen labels are registered as new classes, and unseen
+        features are either added to the vocabulary or ignored.
+
+        On an untrained model, the vectorizer is fitted on ``samples`` and
+        the classifier is initialized with their labels.
+
+        Parameters
+        ----------
+        samples : Sequence[str]
+            New verbs.
+        labels : Sequence[int]
+            Template indices of the new verbs.
+        extend_vocabulary : bool, default=True
+            Add the features of ``samples`` missing from the fitted
+            vocabulary. If False the vocabulary is frozen and those features
+            are dropped.
+        sample_weight : array-like, optional
+            Optional weights for each sample.
+        n_epochs : int, default=1
+            Number of passes over the samples, shuffled at each pass.
+
+        Returns
+        -------
+        Model
+            Updated model instance.
+
+        Raises
+        ------
+        ValueError
+            If ``n_epochs`` is lower than 1.
+        """
+        if n_epochs < 1:
+            raise ValueError("n_epochs must be at least 1.")
+
+        vectorizer = self.pipeline.steps[0][1]
+        classifier = self.pipeline.steps[-1][1]
+        labels = np.asarray(labels)
+
+        if hasattr(classifier, "classes_"):
+            if extend_vocabulary:
+                self._extend_vocabulary(samples)
+            self._register_classes(labels)
+            X = vectorizer.transform(samples)
+            classes = None
         else:
-            self.pipeline.fit(samples, labels)
+            X = self.fit_features(samples)
+            classes = np.unique(labels)
+
+        X = X.tocsr()
+        if sample_weight is not None:
+            sample_weight = np.asarray(sample_weight)
+
+        random_state = np.random.RandomState(
+            getattr(classifier, "random_state", None)
+        )
+
+        for _ in range(n_epochs):
+            order = random_state.permutation(len(labels))
+            classifier.partial_fit(
+                X[order],
+                labels[order],
+                classes=classes,
+                sample_weight=None if sample_weight is None else sample_weight[order],
+            )
+            classes = None
+
+        if self._ending_index is not None:
+            self.constrain_to_templates(self._templates)
+
+        self.version += 1
+        return self
+
+    def prune(self, threshold: float = 0.0) -> "Model":
+        """
+        Drop the features with negligible weight for every class.
+
+        The elasticnet penalty leaves many vocabulary columns with zero (or
+        near-zero) weight for all classes. Pruning removes them from both
+        the vocabulary and the coefficient matrix, which shrinks the model
+        and speeds up feature lookup. Pruned features are ignored at
+        prediction time, so with ``threshold=0`` predictions are unchanged.
+
+        Parameters
+        ----------
+        threshold : float, default=0.0
+            Features whose largest absolute weight over all classes is at
+            most ``threshold`` are removed.
+
+        Returns
+        -------
+        Model
+            The pruned model.
+
+        Raises
+        ------
+        ValueError
+            If the model has no fitted vocabulary (e.g. hashing mode) or no
+            fitted linear classifier, or if no feature would be left.
+        """
+        vectorizer = self.pipeline.steps[0][1]
+        classifier = self.pipeline.steps[-1][1]
+        vocabulary = getattr(vectorizer, "vocabulary_", None)
+
+        if vocabulary is None or not hasattr(classifier, "coef_"):
+            raise ValueError(
+                "Pruning requires a fitted vocabulary and a fitted linear classifier."
+            )
+
+        weights = np.abs(classifier.coef_).max(axis=0)
+        keep = np.flatnonzero(weights > threshold)
+
+        if not len(keep):
+            raise ValueError(f"A threshold of {threshold} would remove every feature.")
+
+        columns = np.full(len(weights), -1, dtype=np.intp)
+        columns[keep] = np.arange(len(keep))
+
+        vectorizer.vocabulary_ = {
+            term: int(columns[index])
+            for term, index in vocabulary.items()
+            if columns[index] >= 0
+        }
+
+        for name in _COEF_ATTRIBUTES:
+            coef = getattr(classifier, name, None)
+            if coef is not None:
+                setattr(classifier, name, np.ascontiguousarray(coef[:, keep]))
+
+        classifier.n_features_in_ = len(keep)
+        self.version += 1
+
+        return self
+
+    def constrain_to_templates(self, templates: Optional[Sequence[str]]) -> "Model":
+        """
+        Restrict predictions to templates compatible with the input verb.
+
+        A template such as ``aim:er`` only applies to verbs ending with
+        ``er``. Once constrained, the model scores each verb against the
+        classes whose template ending is a suffix of the verb, using an
+        ending → class index built here once and a sub-matrix of
+        ``coef_``. Verbs matching no template ending are scored against
+        all classes.
+
+        Parameters
+        ----------
+        templates : Sequence[str] or None
+            Template names indexed by the integer class labels (e.g.
+            ``ConjugManager.templates``). Ignored for string labels.
+            ``None`` disables the constraint.
+
+        Returns
+        -------
+        Model
+            The model itself.
+
+        Raises
+        ------
+        ValueError
+            If the classifier is not a fitted linear model.
+        """
+        self.version += 1
+
+        if templates is None:
+            self._ending_index = None
+            self._ending_lengths = ()
+            self._templates = None
+            return self
+
+        classifier = self.pipeline.steps[-1][1]
+
+        if not hasattr(classifier, "coef_") or not hasattr(classifier, "classes_"):
+            raise ValueError(
+                "Template constraints require a fitted linear classifier."
+            )
+
+        index = defaultdict(list)
+
+        for position, label in enumerate(classifier.classes_):
+            if isinstance(label, str):
+                template = label
+            elif 0 <= int(label) < len(templates):
+                template = templates[int(label)]
+            else:
+                continue
+
+            if ":" not in template:
+                continue
+
+            index[template[template.index(":") + 1:]].append(position)
+
+        self._ending_index = {
+            ending: np.asarray(positions, dtype=np.intp)
+            for ending, positions in index.items()
+        }
+        self._ending_lengths = sorted({len(ending) for ending in index})
+        self._templates = list(templates)
 
         return self
 
+    def _candidate_classes(self, verb: str):
+        """
+        Return the positions of the classes whose ending matches ``verb``.
+        """
+        candidates = [
+            self._ending_index[verb[len(verb) - length:]]
+            for length in self._ending_lengths
+            if length <= len(verb) and verb[len(verb) - length:] in self._ending_index
+        ]
+
+        if not candidates:
+            return None
+
+        return np.concatenate(candidates)
+
+    def _constrained_scores(self, verbs: Sequence[str]):
+        """
+        Compute decision scores restricted to compatible classes.
+
+        Yields
+        ------
+        tuple
+            ``(candidates, scores)`` for each verb. ``candidates`` is None
+            when all classes were scored.
+        """
+        vectorizer = self.pipeline.steps[0][1]
+        classifier = self.pipeline.steps[-1][1]
+
+        X = vectorizer.transform(verbs).tocsr()
+        coef = classifier.coef_
+        intercept = classifier.intercept_
+        # A binary classifier has a single row of weights, scoring the
+        # second class; the first class is scored with the opposite sign.
+        binary = coef.shape[0] == 1 and len(classifier.classes_) == 2
+
+        for row, verb in enumerate(verbs):
+            start, end = X.indptr[row], X.indptr[row + 1]
+            columns = X.indices[start:end]
+            values = X.data[start:end]
+
+            candidates = self._candidate_classes(verb.lower())
+
+            if binary:
+                decision = coef[0, columns] @ values + intercept[0]
+                scores = np.array([-decision, decision])
+                yield candidates, scores if candidates is None else scores[candidates]
+            elif candidates is None:
+                yield None, classifier.decision_function(X[row]).ravel()
+            else:
+                scores = coef[np.ix_(candidates, columns)] @ values
+                yield candidates, scores + intercept[candidates]
+
     def predict(self, verbs: Sequence[str]):
         """
         Predict conjugation template indices for input verbs.
@@ -140,7 +683,17 @@ class Model:
         ndarray
             Predicted template indices (shape: [n_samples]).
         """
-        return self.pipeline.predict(verbs)
+        if self._ending_index is None:
+            return self.pipeline.predict(verbs)
+
+        classes = self.pipeline.steps[-1][1].classes_
+        predictions = [
+            classes[np.argmax(scores) if candidates is None
+                    else candidates[np.argmax(scores)]]
+            for candidates, scores in self._constrained_scores(verbs)
+        ]
+
+        return np.asarray(predictions, dtype=classes.dtype)
 
     def predict_proba(self, verbs: Sequence[str]):
         """
@@ -161,6 +714,23 @@ class Model:
         AttributeError
             If the classifier does not support probability prediction.
         """
-        if hasattr(self.pipeline, "predict_proba"):
+        if not hasattr(self.pipeline, "predict_proba"):
+            raise AttributeError("Classifier does not support predict_proba")
+
+        if self._ending_index is None:
             return self.pipeline.predict_proba(verbs)
-        raise AttributeError("Classifier does not support predict_proba")
+
+        n_classes = len(self.pipeline.steps[-1][1].classes_)
+        proba = np.zeros((len(verbs), n_classes))
+
+        # Same one-vs-rest normalisation as SGDClassifier, over the candidates.
+        for row, (candidates, scores) in enumerate(self._constrained_scores(verbs)):
+            scores = expit(scores)
+            scores /= scores.sum() or 1.0
+
+            if candidates is None:
+                proba[row] = scores
+            else:
+                proba[row, candidates] = scores
+
+        return proba
@@ -1,20 +1,46 @@
-from typing import Optional, Sequence, Any
+from typing import Optional, Sequence, Any, Dict, Iterator, List, Tuple
+import numpy as np
+from sklearn.linear_model import SGDClassifier
 from sklearn.pipeline import Pipeline
 
 
+def default_classifier(n_jobs: Optional[int] = ...) -> SGDClassifier: ...
+
+
+def _resize_linear(
+    classifier: Any, rows: np.ndarray, n_classes: int, n_features: int
+) -> None: ...
+
+
 class Model:
     pipeline: Pipeline
     language: Optional[str]
+    _ending_index: Optional[Dict[str, np.ndarray]]
+    _ending_lengths: Sequence[int]
+    _templates: Optional[List[str]]
+    feature_cache: Optional[Any]
+    version: int
 
     def __init__(
         self,
         vectorizer: Optional[Any] = ...,
         classifier: Optional[Any] = ...,
         language: Optional[str] = ...,
+        feature_cache: Optional[Any] = ...,
+        n_features: Optional[int] = ...,
+        n_jobs: Optional[int] = ...,
     ) -> None: ...
 
     def __repr__(self) -> str: ...
 
+    def __getstate__(self) -> Dict[str, Any]: ...
+
+    @property
+    def n_jobs(self) -> Optional[int]: ...
+
+    @n_jobs.setter
+    def n_jobs(self, n_jobs: Optional[int]) -> None: ...
+
     def train(
         self,
         samples: Sequence[str],
@@ -22,6 +48,33 @@ class Model:
         sample_weight: Optional[Sequence[float]] = ...,
     ) -> "Model": ...
 
+    def fit_features(self, samples: Sequence[str]) -> Any: ...
+
+    def _extend_vocabulary(self, samples: Sequence[str]) -> int: ...
+
+    def _register_classes(self, labels: Sequence[int]) -> int: ...
+
+    def relabel(self, mapping: Any) -> "Model": ...
+
+    def partial_fit(
+        self,
+        samples: Sequence[str],
+        labels: Sequence[int],
+        extend_vocabulary: bool = ...,
+        sample_weight: Optional[Sequence[float]] = ...,
+        n_epochs: int = ...,
+    ) -> "Model": ...
+
+    def prune(self, threshold: float = ...) -> "Model": ...
+
+    def constrain_to_templates(self, templates: Optional[Sequence[str]]) -> "Model": ...
+
+    def _candidate_classes(self, verb: str) -> Optional[np.ndarray]: ...
+
+    def _constrained_scores(
+        self, verbs: Sequence[str]
+    ) -> Iterator[Tuple[Optional[np.ndarray], np.ndarray]]: ...
+
     def predict(self, verbs: Sequence[str]) -> Sequence[int]: ...
 
     def predict_proba(self, verbs: Sequence[str]) -> Any: ...
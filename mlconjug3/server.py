@@ -0,0 +1,702 @@
+"""
+server.py
+
+HTTP conjugation server for mlconjug3.
+
+This module serves the Conjugator over HTTP with the standard library
+only. It provides:
+- A :class:`ConjugationService` loading the Conjugators of the chosen
+  languages once and turning their results into JSON documents
+- Single and batch JSON endpoints
+- Pre-forked worker processes sharing the listening socket and the
+  Conjugators loaded before the fork (copy-on-write)
+- Configurable concurrency per worker, HTTP/1.1 keep-alive and request
+  size limits; idle keep-alive connections wait in a selector and do not
+  hold a thread
+- Health (``/healthz``) and readiness (``/readyz``) probes
+
+Endpoints:
+
+``GET /v1/conjugate?verb=manger&language=fr&subject=abbrev``
+    Conjugate one verb.
+``POST /v1/conjugate``
+    Conjugate one verb: ``{"verb": "manger", "language": "fr", "subject": "abbrev"}``.
+``POST /v1/conjugate/batch``
+    Conjugate several verbs: ``{"verbs": ["manger", "finir"], "language": "fr"}``.
+``GET /healthz``, ``GET /readyz``
+    Liveness and readiness probes.
+
+The server is started with ``mlconjug3-serve`` or :func:`serve`.
+"""
+
+import os
+import json
+import signal
+import socket
+import selectors
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from time import monotonic
+from urllib.parse import urlsplit, parse_qs
+
+from .constants import LANGUAGES
+from .utils import logger
+
+#: Default maximum size of a request body, in bytes.
+DEFAULT_MAX_BODY = 1024 ** 2
+
+#: Default maximum number of verbs of a batch request.
+DEFAULT_MAX_BATCH = 1000
+
+#: Default number of seconds an idle keep-alive connection is kept open.
+DEFAULT_KEEPALIVE = 15
+
+#: Supported subject formats.
+SUBJECTS = ("abbrev", "pronoun")
+
+#: A worker exiting less than this many seconds after it was forked failed
+#: to start.
+FAILED_START_TIME = 10.0
+
+#: Number of consecutive failed worker starts after which :func:`serve` gives up.
+MAX_FAILED_STARTS = 5
+
+# Delay before the first restart after a failed start, doubled on each
+# consecutive failure up to _MAX_RESTART_DELAY seconds.
+_RESTART_DELAY = 0.1
+_MAX_RESTART_DELAY = 10.0
+
+
+class RequestError(Exception):
+    """
+    Invalid request, answered with ``status`` and ``message``.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def verb_to_dict(verb, conjugated):
+    """
+    Describe the result of a conjugation as a JSON-serializable dict.
+
+    :param verb: Verb as requested.
+    :type verb: str
+    :param conjugated: Conjugated verb, or None if it could not be conjugated.
+    :type conjugated: mlconjug3.verbs.Verb | None
+    :return: The requested verb with the infinitive, template, source,
+        predicted flag, confidence score and conjugation table, or with an
+        ``error`` message.
+    :rtype: dict
+    """
+    if conjugated is None:
+        return {"verb": verb, "error": "The verb could not be conjugated."}
+
+    return {
+        "verb": verb,
+        "infinitive": conjugated.name,
+        "template": conjugated.verb_info.template,
+        "source": conjugated.source,
+        "predicted": conjugated.predicted,
+        "confidence_score": conjugated.confidence_score,
+        "conjugations": conjugated.conjug_info,
+    }
+
+
+class ConjugationService:
+    """
+    Conjugators of several languages, loaded once.
+
+    Parameters
+    ----------
+    languages : sequence of str, optional
+        Languages to load. Defaults to every supported language.
+    conjugator_options : dict, optional
+        Keyword arguments passed to each :class:`Conjugator`.
+    max_batch : int, default=1000
+        Maximum number of verbs of a batch.
+
+    Attributes
+    ----------
+    conjugators : dict
+        Conjugator of each language.
+    """
+
+    def __init__(self, languages=None, conjugator_options=None, max_batch=DEFAULT_MAX_BATCH):
+        from .mlconjug import Conjugator
+
+        if not languages:
+            languages = [lang for lang in LANGUAGES if lang != "default"]
+
+        for lang in languages:
+            if lang not in LANGUAGES or lang == "default":
+                raise ValueError(
+                    _(
+                        "Unsupported language.\nThe allowed languages are fr, en, es, it, pt, ro."
+                    )
+                )
+
+        self.max_batch = max_batch
+        self.conjugators = {
+            lang: Conjugator(lang, **(conjugator_options or {})) for lang in languages
+        }
+
+    @property
+    def languages(self):
+        return list(self.conjugators)
+
+    def _conjugator(self, language):
+        if language not in self.conjugators:
+            raise RequestError(
+                400,
+                f"Unsupported language {language!r}, expected one of {', '.join(self.conjugators)}.",
+            )
+        return self.conjugators[language]
+
+    def conjugate(self, verbs, language, subject="abbrev"):
+        """
+        Conjugate verbs in the calling thread.
+
+        Verbs absent from the lexicon are predicted together (see
+        ``Conjugator.conjugate_batch``). Unlike ``Conjugator.conjugate``
+        with a list, no process pool is started; the calling server
+        already provides the parallelism.
+
+        :param verbs: Verbs to conjugate.
+        :type verbs: sequence of str
+        :param language: Language of the verbs.
+        :type language: str
+        :param subject: 'abbrev' or 'pronoun'.
+        :type subject: str
+        :return: One dict per verb (see :func:`verb_to_dict`).
+        :rtype: list of dict
+        :raises RequestError: If the request is invalid.
+        """
+        conjugator = self._conjugator(language)
+
+        if subject not in SUBJECTS:
+            raise RequestError(400, f"Unsupported subject {subject!r}, expected abbrev or pronoun.")
+        if len(verbs) > self.max_batch:
+            raise RequestError(413, f"Too many verbs, the limit is {self.max_batch}.")
+        if not all(isinstance(verb, str) and verb for verb in verbs):
+            raise RequestError(400, "Verbs must be non-empty strings.")
+
+        return [
+            verb_to_dict(verb, conjugated)
+            for verb, conjugated in zip(verbs, conjugator.conjugate_batch(verbs, subject))
+        ]
+
+
+class ConjugationRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of the conjugation server.
+
+    HTTP/1.1 is used, so connections are kept alive between requests until
+    the client closes them or they stay idle for ``server.keepalive``
+    seconds.
+
+    A handler lives as long as its connection. Creating it only sets the
+    connection up; the server then calls :meth:`handle_one_request` each
+    time a request is ready to be read.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "mlconjug3"
+    # Headers and body are written separately; without TCP_NODELAY, delayed
+    # ACKs add ~40 ms to every response on a kept-alive connection.
+    disable_nagle_algorithm = True
+
+    def __init__(self, request, client_address, server):
+        self.request = request
+        self.client_address = client_address
+        self.server = server
+        self.close_connection = True
+        self.setup()
+
+    def setup(self):
+        self.timeout = self.server.keepalive
+        super().setup()
+
+    def has_buffered_request(self):
+        """
+        Whether the client already sent (part of) another request.
+
+        Pipelined requests may already sit in the read buffer, where the
+        server's selector cannot see them.
+        """
+        self.connection.settimeout(0.0)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status, document):
+        body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_error(self, error):
+        self._send_json(error.status, {"error": error.message})
+
+    def _read_json(self):
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.close_connection = True
+            raise RequestError(411, "A Content-Length header is required.")
+
+        try:
+            length = int(length)
+        except ValueError:
+            self.close_connection = True
+            raise RequestError(400, "Invalid Content-Length header.")
+
+        if length > self.server.max_body:
+            # The body is not read, so the connection cannot be reused.
+            self.close_connection = True
+            raise RequestError(
+                413, f"Request body too large, the limit is {self.server.max_body} bytes."
+            )
+
+        try:
+            document = json.loads(self.rfile.read(length) or b"null")
+        except ValueError:
+            raise RequestError(400, "The request body is not valid JSON.")
+
+        if not isinstance(document, dict):
+            raise RequestError(400, "The request body must be a JSON object.")
+        return document
+
+    def _handle(self, respond):
+        try:
+            respond()
+        except RequestError as error:
+            self._send_error(error)
+        except Exception as error:
+            logger.exception(f"Error while serving {self.path}: {error!r}")
+            self._send_json(500, {"error": "Internal server error."})
+
+    def do_GET(self):
+        self._handle(self._get)
+
+    def do_HEAD(self):
+        self._handle(self._get)
+
+    def do_POST(self):
+        self._handle(self._post)
+
+    def _get(self):
+        url = urlsplit(self.path)
+        service = self.server.service
+
+        if url.path == "/healthz":
+            self._send_json(200, {"status": "ok"})
+
+        elif url.path == "/readyz":
+            if self.server.ready.is_set():
+                self._send_json(200, {"status": "ready", "languages": service.languages})
+            else:
+                self._send_json(503, {"status": "unavailable"})
+
+        elif url.path == "/v1/conjugate":
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            if "verb" not in query:
+                raise RequestError(400, "Missing 'verb' parameter.")
+            self._conjugate_one(query)
+
+        elif url.path == "/v1/conjugate/batch":
+            raise RequestError(405, "Use POST for batch requests.")
+
+        else:
+            raise RequestError(404, "Not found.")
+
+    def _post(self):
+        path = urlsplit(self.path).path
+
+        if path not in ("/v1/conjugate", "/v1/conjugate/batch"):
+            if self.headers.get("Content-Length") is not None:
+                self.close_connection = True
+            raise RequestError(404, "Not found.")
+
+        document = self._read_json()
+
+        for field in ("language", "subject"):
+            if not isinstance(document.get(field, ""), str):
+                raise RequestError(400, f"The {field!r} field must be a string.")
+
+        if path == "/v1/conjugate":
+            if not isinstance(document.get("verb"), str):
+                raise RequestError(400, "Missing 'verb' string.")
+            self._conjugate_one(document)
+            return
+
+        verbs = document.get("verbs")
+        if not isinstance(verbs, list):
+            raise RequestError(400, "Missing 'verbs' list.")
+
+        results = self.server.service.conjugate(
+            verbs,
+            document.get("language", self.server.default_language),
+            document.get("subject", "abbrev"),
+        )
+        self._send_json(200, {"results": results})
+
+    def _conjugate_one(self, request):
+        result = self.server.service.conjugate(
+            [request["verb"]],
+            request.get("language", self.server.default_language),
+            request.get("subject", "abbrev"),
+        )[0]
+        self._send_json(200 if "error" not in result else 422, result)
+
+
+class ConjugationServer(HTTPServer):
+    """
+    HTTP server answering the requests with a bounded pool of threads.
+
+    Idle connections are watched by a selector in a single thread. A
+    connection is handed to the pool only once a request can be read, and
+    goes back to the selector after the response if it is kept alive. So
+    ``threads`` bounds the number of requests processed at the same time,
+    not the number of open connections. When every thread is busy, ready
+    requests wait in their socket buffers.
+
+    Parameters
+    ----------
+    address : tuple
+        (host, port) to listen on. Port 0 picks a free port.
+    service : ConjugationService
+        Service answering the requests.
+    threads : int, default=8
+        Maximum number of requests processed at the same time.
+    max_body : int
+        Maximum size of a request body, in bytes.
+    keepalive : float
+        Seconds an idle keep-alive connection is kept open.
+    bind_and_activate : bool, default=True
+        Whether to bind and listen immediately.
+    """
+
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address,
+        service,
+        threads=8,
+        max_body=DEFAULT_MAX_BODY,
+        keepalive=DEFAULT_KEEPALIVE,
+        bind_and_activate=True,
+    ):
+        super().__init__(address, ConjugationRequestHandler, bind_and_activate)
+        self.service = service
+        self.default_language = service.languages[0]
+        self.max_body = max_body
+        self.keepalive = keepalive
+        self.ready = threading.Event()
+        self.ready.set()
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="mlconjug3-http")
+
+        self._slots = threading.BoundedSemaphore(threads)
+        self._lock = threading.Lock()
+        self._parked = []
+        self._stopping = False
+        # Created by serve_forever, in the process that serves: an epoll
+        # selector must not be shared by pre-forked workers.
+        self._selector = None
+        self._wakeup = None
+        self._watcher = None
+
+    def serve_forever(self, poll_interval=0.5):
+        self._start_watcher()
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self._stop_watcher()
+
+    def process_request(self, request, client_address):
+        self._park(self.RequestHandlerClass(request, client_address, self))
+
+    def _park(self, handler):
+        """
+        Hand a connection waiting for its next request to the selector.
+        """
+        with self._lock:
+            stopping = self._stopping
+            if not stopping:
+                self._parked.append(handler)
+
+        if stopping:
+            self._close(handler)
+            return
+
+        try:
+            self._wakeup[1].send(b"\0")
+        except OSError:
+            # The wake-up socket is full: the selector is already woken up.
+            pass
+
+    def _start_watcher(self):
+        self._stopping = False
+        self._selector = selectors.DefaultSelector()
+        self._wakeup = socket.socketpair()
+        for end in self._wakeup:
+            end.setblocking(False)
+        self._selector.register(self._wakeup[0], selectors.EVENT_READ)
+        self._watcher = threading.Thread(
+            target=self._watch, name="mlconjug3-http-selector", daemon=True
+        )
+        self._watcher.start()
+
+    def _stop_watcher(self):
+        with self._lock:
+            self._stopping = True
+        if self._watcher is None:
+            return
+        self._wakeup[1].send(b"\0")
+        self._watcher.join()
+        self._selector.close()
+        for end in self._wakeup:
+            end.close()
+        self._watcher = self._selector = self._wakeup = None
+
+    def _watch(self):
+        """
+        Dispatch the connections with a readable request and close the
+        connections idle for longer than ``keepalive``.
+        """
+        selector = self._selector
+        deadlines = {}
+
+        while not self._stopping:
+            timeout = max(0.0, min(deadlines.values()) - monotonic()) if deadlines else None
+            for key, _events in selector.select(timeout):
+                if key.fileobj is self._wakeup[0]:
+                    try:
+                        while key.fileobj.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+
+                handler = key.data
+                selector.unregister(key.fileobj)
+                del deadlines[handler]
+                # Wait for a free thread rather than queueing the request.
+                self._slots.acquire()
+                self.executor.submit(self._serve, handler)
+
+            with self._lock:
+                parked, self._parked = self._parked, []
+
+            now = monotonic()
+            for handler in parked:
+                selector.register(handler.connection, selectors.EVENT_READ, handler)
+                deadlines[handler] = now + self.keepalive
+
+            for handler, deadline in list(deadlines.items()):
+                if deadline <= now:
+                    selector.unregister(handler.connection)
+                    del deadlines[handler]
+                    self._close(handler)
+
+        with self._lock:
+            parked, self._parked = self._parked, []
+        for handler in [*deadlines, *parked]:
+            self._close(handler)
+
+    def _serve(self, handler):
+        """
+        Answer the request of a connection, and the requests pipelined after it.
+        """
+        keep_alive = False
+        try:
+            while True:
+                handler.close_connection = True
+                handler.handle_one_request()
+                if handler.close_connection or not handler.has_buffered_request():
+                    break
+            keep_alive = not handler.close_connection
+        except Exception:
+            self.handle_error(handler.request, handler.client_address)
+        finally:
+            self._slots.release()
+
+        if keep_alive:
+            self._park(handler)
+        else:
+            self._close(handler)
+
+    def _close(self, handler):
+        try:
+            handler.finish()
+        except OSError:
+            pass
+        self.shutdown_request(handler.request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False)
+
+
+def _run_worker(server):
+    """
+    Serve requests in a forked worker until SIGTERM or SIGINT.
+    """
+
+    def stop(signum, frame):
+        server.ready.clear()
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def serve(
+    languages=None,
+    host="127.0.0.1",
+    port=8000,
+    workers=1,
+    threads=8,
+    max_body=DEFAULT_MAX_BODY,
+    max_batch=DEFAULT_MAX_BATCH,
+    keepalive=DEFAULT_KEEPALIVE,
+    conjugator_options=None,
+):
+    """
+    Run the conjugation server until it is interrupted.
+
+    The Conjugators are loaded once, then ``workers`` processes are forked.
+    They share the listening socket and, copy-on-write, the loaded models
+    and lexicons. A worker that dies is replaced. Workers failing right after
+    their start are restarted with an exponential backoff, and the server
+    gives up after ``MAX_FAILED_STARTS`` consecutive failed starts. On
+    platforms without ``fork``, a single process serves the requests.
+
+    :param languages: Languages to serve. Defaults to every supported language.
+    :type languages: sequence of str | None
+    :param host: Address to listen on.
+    :type host: str
+    :param port: Port to listen on.
+    :type port: int
+    :param workers: Number of worker processes.
+    :type workers: int
+    :param threads: Maximum number of concurrent requests per worker.
+    :type threads: int
+    :param max_body: Maximum size of a request body, in bytes.
+    :type max_body: int
+    :param max_batch: Maximum number of verbs of a batch request.
+    :type max_batch: int
+    :param keepalive: Seconds an idle keep-alive connection is kept open.
+    :type keepalive: float
+    :param conjugator_options: Keyword arguments passed to each Conjugator.
+    :type conjugator_options: dict | None
+    :raises ValueError: If a language is not supported.
+    :raises RuntimeError: If the workers keep failing right after their start.
+    """
+    service = ConjugationService(languages, conjugator_options, max_batch)
+    server = ConjugationServer(
+        (host, port), service, threads=threads, max_body=max_body, keepalive=keepalive
+    )
+    logger.info(
+        f"Serving {', '.join(service.languages)} on http://{host}:{server.server_address[1]} "
+        f"with {workers} worker(s)."
+    )
+
+    if workers <= 1 or not hasattr(os, "fork"):
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
+    # Start time of each worker.
+    children = {}
+    stopping = threading.Event()
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(server)
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        children[pid] = monotonic()
+
+    def stop(signum, frame):
+        stopping.set()
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _worker in range(workers):
+        spawn()
+
+    failed_starts = 0
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+
+        started = children.pop(pid, None)
+        if stopping.is_set() or started is None:
+            continue
+
+        if monotonic() - started < FAILED_START_TIME:
+            failed_starts += 1
+        else:
+            failed_starts = 0
+
+        if failed_starts >= MAX_FAILED_STARTS:
+            logger.error(f"Worker {pid} exited with status {status}, giving up.")
+            stop(None, None)
+            continue
+
+        delay = 0.0
+        if failed_starts:
+            delay = min(_RESTART_DELAY * 2 ** (failed_starts - 1), _MAX_RESTART_DELAY)
+        logger.warning(
+            f"Worker {pid} exited with status {status}, restarting it in {delay:.1f}s."
+        )
+        if not stopping.wait(delay):
+            spawn()
+
+    server.socket.close()
+
+    if failed_starts >= MAX_FAILED_STARTS:
+        raise RuntimeError(
+            f"The workers failed {failed_starts} times in a row right after their start."
+        )
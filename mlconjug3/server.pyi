@@ -0,0 +1,105 @@
+import selectors
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import BoundedSemaphore, Event, Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .mlconjug import Conjugator
+from .verbs import Verb
+
+DEFAULT_MAX_BODY: int
+DEFAULT_MAX_BATCH: int
+DEFAULT_KEEPALIVE: int
+SUBJECTS: Tuple[str, ...]
+FAILED_START_TIME: float
+MAX_FAILED_STARTS: int
+_RESTART_DELAY: float
+_MAX_RESTART_DELAY: float
+
+class RequestError(Exception):
+    status: int
+    message: str
+    def __init__(self, status: int, message: str) -> None: ...
+
+def verb_to_dict(verb: str, conjugated: Optional[Verb]) -> Dict[str, Any]: ...
+
+class ConjugationService:
+    max_batch: int
+    conjugators: Dict[str, Conjugator]
+    def __init__(
+        self,
+        languages: Optional[Sequence[str]] = ...,
+        conjugator_options: Optional[Dict[str, Any]] = ...,
+        max_batch: int = ...,
+    ) -> None: ...
+    @property
+    def languages(self) -> List[str]: ...
+    def _conjugator(self, language: str) -> Conjugator: ...
+    def conjugate(
+        self, verbs: Sequence[str], language: str, subject: str = ...
+    ) -> List[Dict[str, Any]]: ...
+
+class ConjugationRequestHandler(BaseHTTPRequestHandler):
+    server: "ConjugationServer"
+    def __init__(
+        self, request: socket.socket, client_address: Any, server: "ConjugationServer"
+    ) -> None: ...
+    def setup(self) -> None: ...
+    def has_buffered_request(self) -> bool: ...
+    def _send_json(self, status: int, document: Any) -> None: ...
+    def _send_error(self, error: RequestError) -> None: ...
+    def _read_json(self) -> Dict[str, Any]: ...
+    def _handle(self, respond: Callable[[], None]) -> None: ...
+    def do_GET(self) -> None: ...
+    def do_HEAD(self) -> None: ...
+    def do_POST(self) -> None: ...
+    def _get(self) -> None: ...
+    def _post(self) -> None: ...
+    def _conjugate_one(self, request: Dict[str, Any]) -> None: ...
+
+class ConjugationServer(HTTPServer):
+    service: ConjugationService
+    default_language: str
+    max_body: int
+    keepalive: float
+    ready: Event
+    executor: ThreadPoolExecutor
+    _slots: BoundedSemaphore
+    _lock: Lock
+    _parked: List[ConjugationRequestHandler]
+    _stopping: bool
+    _selector: Optional[selectors.BaseSelector]
+    _wakeup: Optional[Tuple[socket.socket, socket.socket]]
+    _watcher: Optional[Thread]
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        service: ConjugationService,
+        threads: int = ...,
+        max_body: int = ...,
+        keepalive: float = ...,
+        bind_and_activate: bool = ...,
+    ) -> None: ...
+    def serve_forever(self, poll_interval: float = ...) -> None: ...
+    def process_request(self, request: socket.socket, client_address: Any) -> None: ...
+    def _park(self, handler: ConjugationRequestHandler) -> None: ...
+    def _start_watcher(self) -> None: ...
+    def _stop_watcher(self) -> None: ...
+    def _watch(self) -> None: ...
+    def _serve(self, handler: ConjugationRequestHandler) -> None: ...
+    def _close(self, handler: ConjugationRequestHandler) -> None: ...
+    def server_close(self) -> None: ...
+
+def _run_worker(server: ConjugationServer) -> None: ...
+def serve(
+    languages: Optional[Sequence[str]] = ...,
+    host: str = ...,
+    port: int = ...,
+    workers: int = ...,
+    threads: int = ...,
+    max_body: int = ...,
+    max_batch: int = ...,
+    keepalive: float = ...,
+    conjugator_options: Optional[Dict[str, Any]] = ...,
+) -> None: ...
@@ -1,7 +1,21 @@
 from .logger import logger
 from .model_trainer import ConjugatorTrainer
+from .feature_cache import FeatureCache
+from .orchestrator import train_languages
+from .instrumentation import Instrumentation, instrument
+from .metrics import ConjugatorMetrics
+from .profiling import SlowCallLog, CallProfiler
+from .prediction_cache import PredictionCache
 
 __all__ = [
     "logger",
     "ConjugatorTrainer",
+    "FeatureCache",
+    "train_languages",
+    "Instrumentation",
+    "instrument",
+    "ConjugatorMetrics",
+    "SlowCallLog",
+    "CallProfiler",
+    "PredictionCache",
 ]
@@ -4,14 +4,220 @@ Error analysis utilities for mlconjug3 models.
 This module provides diagnostic tools to evaluate model performance,
 including:
 - Overall accuracy computation
-- Confusion pair analysis
+- Sparse confusion matrices
+- Confusion pair analysis and per-class error rates
 - Inspection of misclassified verb samples
+- Export of the analysis to disk for large runs
+
+Everything is computed with numpy on integer label codes, and the
+confusion matrix is a scipy sparse matrix, so languages with thousands
+of templates are analysed without building a dense matrix.
 
 It is intended for debugging and model improvement rather than production use.
 """
 
+import os
+import csv
+import json
+
 import numpy as np
-from collections import defaultdict, Counter
+from scipy import sparse
+
+
+def _encode(y_true, y_pred, labels=None):
+    """
+    Encode true and predicted labels as integer codes.
+
+    :return: Labels, true codes and predicted codes.
+    :rtype: tuple
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+
+    if labels is None:
+        labels, codes = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+        return labels, codes[:len(y_true)], codes[len(y_true):]
+
+    labels = np.asarray(labels)
+    order = np.argsort(labels, kind="stable")
+    sorted_labels = labels[order]
+
+    def encode(values):
+        positions = np.searchsorted(sorted_labels, values)
+        positions = np.minimum(positions, len(labels) - 1)
+        if not np.array_equal(sorted_labels[positions], values):
+            raise ValueError("y_true and y_pred contain labels missing from labels.")
+        return order[positions]
+
+    return labels, encode(y_true), encode(y_pred)
+
+
+def confusion_matrix(y_true, y_pred, labels=None):
+    """
+    Build a sparse confusion matrix.
+
+    :param y_true: Ground-truth template labels.
+    :type y_true: sequence of int | sequence of str
+    :param y_pred: Predicted template labels.
+    :type y_pred: sequence of int | sequence of str
+    :param labels: Labels indexing the rows and columns. Defaults to the
+        sorted labels found in ``y_true`` or ``y_pred``.
+    :type labels: sequence | None
+    :return: Labels and a CSR matrix whose entry (i, j) counts the samples
+        of label i predicted as label j.
+    :rtype: tuple
+    """
+    labels, true_codes, pred_codes = _encode(y_true, y_pred, labels)
+    n_labels = len(labels)
+
+    pairs, counts = np.unique(
+        true_codes.astype(np.int64) * n_labels + pred_codes, return_counts=True
+    )
+    matrix = sparse.csr_matrix(
+        (counts, (pairs // n_labels, pairs % n_labels)),
+        shape=(n_labels, n_labels),
+        dtype=np.int64,
+    )
+
+    return labels, matrix
+
+
+def _plain(value):
+    """
+    Convert numpy scalars to Python values for serialization.
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def error_report(y_true, y_pred, inputs, top_k=15, n_examples=10, labels=None, seed=42):
+    """
+    Analyse the errors of a model as data structures.
+
+    :param y_true: Ground-truth template labels.
+    :type y_true: sequence of int | sequence of str
+    :param y_pred: Predicted template labels.
+    :type y_pred: sequence of int | sequence of str
+    :param inputs: Input verb samples corresponding to predictions.
+    :type inputs: sequence of str
+    :param top_k: Number of confusion pairs returned. None returns all.
+    :type top_k: int | None
+    :param n_examples: Maximum number of misclassified verbs sampled per pair.
+    :type n_examples: int
+    :param labels: Labels indexing the confusion matrix.
+    :type labels: sequence | None
+    :param seed: Seed of the example sampling.
+    :type seed: int
+    :return: ``accuracy``, ``n_samples``, ``n_errors``, ``labels``, the
+        sparse ``confusion`` matrix, ``top_pairs`` (true label, predicted
+        label, count and sampled verbs, most frequent first) and
+        ``per_class`` (support, errors, error rate and false positives,
+        for each label with support or false positives).
+    :rtype: dict
+    """
+    inputs = np.asarray(inputs, dtype=object)
+    labels, true_codes, pred_codes = _encode(y_true, y_pred, labels)
+    n_labels = len(labels)
+
+    _, confusion = confusion_matrix(true_codes, pred_codes, np.arange(n_labels))
+
+    wrong = np.flatnonzero(true_codes != pred_codes)
+    pair_codes = true_codes[wrong].astype(np.int64) * n_labels + pred_codes[wrong]
+    pairs, pair_index, counts = np.unique(pair_codes, return_inverse=True, return_counts=True)
+
+    # Most frequent first, ties broken by label order.
+    ranking = np.lexsort((pairs, -counts))
+    if top_k is not None:
+        ranking = ranking[:top_k]
+
+    samples = np.argsort(pair_index, kind="stable")
+    starts = np.concatenate([[0], np.cumsum(counts)])
+    random_state = np.random.RandomState(seed)
+
+    top_pairs = []
+    for rank in ranking:
+        members = wrong[samples[starts[rank]:starts[rank + 1]]]
+        if len(members) > n_examples:
+            members = np.sort(random_state.choice(members, n_examples, replace=False))
+        top_pairs.append({
+            "true": _plain(labels[pairs[rank] // n_labels]),
+            "predicted": _plain(labels[pairs[rank] % n_labels]),
+            "count": int(counts[rank]),
+            "examples": inputs[members].tolist(),
+        })
+
+    support = np.bincount(true_codes, minlength=n_labels)
+    errors = np.bincount(true_codes[wrong], minlength=n_labels)
+    false_positives = np.bincount(pred_codes[wrong], minlength=n_labels)
+
+    per_class = {
+        _plain(labels[code]): {
+            "support": int(support[code]),
+            "errors": int(errors[code]),
+            "error_rate": float(errors[code] / support[code]) if support[code] else None,
+            "false_positives": int(false_positives[code]),
+        }
+        for code in np.flatnonzero(support + false_positives)
+    }
+
+    n_samples = len(true_codes)
+
+    return {
+        "accuracy": 1 - len(wrong) / n_samples if n_samples else float("nan"),
+        "n_samples": n_samples,
+        "n_errors": len(wrong),
+        "labels": labels,
+        "confusion": confusion,
+        "top_pairs": top_pairs,
+        "per_class": per_class,
+    }
+
+
+def export_error_report(report, folder):
+    """
+    Write an error report to disk.
+
+    Files written in ``folder``:
+    - ``confusion.npz``: sparse confusion matrix (``scipy.sparse.load_npz``)
+    - ``labels.json``: labels indexing the confusion matrix
+    - ``summary.json``: accuracy, counts and top confusion pairs
+    - ``per_class.csv``: per-class support, errors and error rate
+
+    :param report: Report returned by :func:`error_report`.
+    :type report: dict
+    :param folder: Output directory, created if needed.
+    :type folder: str
+    :return: Paths of the written files.
+    :rtype: dict
+    """
+    os.makedirs(folder, exist_ok=True)
+
+    paths = {
+        name: os.path.join(folder, name)
+        for name in ("confusion.npz", "labels.json", "summary.json", "per_class.csv")
+    }
+
+    sparse.save_npz(paths["confusion.npz"], report["confusion"])
+
+    with open(paths["labels.json"], "w", encoding="utf-8") as file:
+        json.dump([_plain(label) for label in report["labels"]], file, ensure_ascii=False)
+
+    summary = {
+        key: report[key] for key in ("accuracy", "n_samples", "n_errors", "top_pairs")
+    }
+    with open(paths["summary.json"], "w", encoding="utf-8") as file:
+        json.dump(summary, file, ensure_ascii=False, indent=2)
+
+    with open(paths["per_class.csv"], "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["label", "support", "errors", "error_rate", "false_positives"])
+        for label, stats in report["per_class"].items():
+            writer.writerow([
+                label, stats["support"], stats["errors"],
+                "" if stats["error_rate"] is None else stats["error_rate"],
+                stats["false_positives"],
+            ])
+
+    return paths
 
 
 def analyze_errors(lang, y_true, y_pred, inputs, top_k=15):
@@ -23,6 +229,8 @@ def analyze_errors(lang, y_true, y_pred, inputs, top_k=15):
     - Most frequent confusion pairs (true label → predicted label)
     - Example misclassified inputs grouped by error type
 
+    See :func:`error_report` for the same analysis as data.
+
     :param lang: Language code (e.g., 'fr', 'en', 'es').
     :type lang: str
     :param y_true: Ground-truth template labels.
@@ -41,37 +249,23 @@ def analyze_errors(lang, y_true, y_pred, inputs, top_k=15):
     print(f" ERROR ANALYSIS: {lang.upper()}")
     print("=" * 30 + "\n")
 
-    y_true = list(y_true)
-    y_pred = list(y_pred)
+    report = error_report(y_true, y_pred, inputs, top_k=top_k)
 
-    acc = np.mean(np.array(y_true) == np.array(y_pred))
-    print(f"Accuracy: {acc:.4f}\n")
+    print(f"Accuracy: {report['accuracy']:.4f}\n")
 
     # -------------------------
     # CONFUSION PAIRS
     # -------------------------
-    pairs = Counter()
-
-    for t, p in zip(y_true, y_pred):
-        if t != p:
-            pairs[(t, p)] += 1
-
     print("Top confusion pairs:\n")
 
-    for (t, p), c in pairs.most_common(top_k):
-        print(f"{t} → {p} : {c}")
+    for pair in report["top_pairs"]:
+        print(f"{pair['true']} → {pair['predicted']} : {pair['count']}")
 
     # -------------------------
     # SAMPLE ERRORS
     # -------------------------
     print("\nSample misclassified verbs:\n")
 
-    grouped = defaultdict(list)
-
-    for x, t, p in zip(inputs, y_true, y_pred):
-        if t != p:
-            grouped[(t, p)].append(x)
-
-    for (t, p), items in list(grouped.items())[:5]:
-        print(f"\n{t} → {p} ({len(items)} cases)")
-        print("Examples:", items[:10])
+    for pair in report["top_pairs"][:5]:
+        print(f"\n{pair['true']} → {pair['predicted']} ({pair['count']} cases)")
+        print("Examples:", pair["examples"])
@@ -1,4 +1,38 @@
-from typing import Sequence, Any
+from typing import Sequence, Any, Dict, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+def _encode(
+    y_true: Sequence[Any],
+    y_pred: Sequence[Any],
+    labels: Optional[Sequence[Any]] = ...,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: ...
+
+
+def confusion_matrix(
+    y_true: Sequence[Any],
+    y_pred: Sequence[Any],
+    labels: Optional[Sequence[Any]] = ...,
+) -> Tuple[np.ndarray, sparse.csr_matrix]: ...
+
+
+def _plain(value: Any) -> Any: ...
+
+
+def error_report(
+    y_true: Sequence[Any],
+    y_pred: Sequence[Any],
+    inputs: Sequence[str],
+    top_k: Optional[int] = ...,
+    n_examples: int = ...,
+    labels: Optional[Sequence[Any]] = ...,
+    seed: int = ...,
+) -> Dict[str, Any]: ...
+
+
+def export_error_report(report: Dict[str, Any], folder: str) -> Dict[str, str]: ...
 
 
 def analyze_errors(
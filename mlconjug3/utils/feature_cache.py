@@ -0,0 +1,177 @@
+"""
+Feature cache utilities for mlconjug3.
+
+This module provides an on-disk cache of vectorized training data, so that
+repeated training runs on the same verbs (e.g. hyperparameter sweeps) skip
+the feature extraction pass.
+
+Entries are keyed by the training samples, the language, the version of
+the feature extractor and the vectorizer parameters. Each entry stores the
+fitted vocabulary and the CSR arrays of the feature matrix in a single
+``.npz`` file.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from functools import partial
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import CountVectorizer
+
+from mlconjug3.feature_extractor import FEATURE_EXTRACTOR_VERSION
+
+
+def _describe(value):
+    """
+    Build a stable, JSON-serializable description of a vectorizer parameter.
+
+    Callables are described by their qualified name (and the arguments of
+    ``functools.partial`` objects) rather than by their address in memory.
+    """
+    if isinstance(value, partial):
+        return {
+            "function": _describe(value.func),
+            "args": [_describe(arg) for arg in value.args],
+            "keywords": {key: _describe(arg) for key, arg in value.keywords.items()},
+        }
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_describe(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _describe(item) for key, item in value.items()}
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+    return repr(value)
+
+
+class FeatureCache:
+    """
+    Keyed on-disk cache of vectorized training data.
+
+    :param directory: Folder holding the cache entries. Created if missing.
+    :type directory: str
+
+    :ivar directory: Folder holding the cache entries.
+    :vartype directory: str
+    """
+
+    def __init__(self, directory):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self):
+        return f"{__name__}.{self.__class__.__name__}(directory={self.directory!r})"
+
+    @staticmethod
+    def supports(vectorizer):
+        """
+        Check whether a vectorizer can be restored from a cache entry.
+
+        Only vectorizers whose fitted state is entirely described by a
+        vocabulary are supported.
+
+        :param vectorizer: Feature extraction component of a Model.
+        :return: True if the vectorizer is a plain ``CountVectorizer``.
+        :rtype: bool
+        """
+        return type(vectorizer) is CountVectorizer
+
+    def key(self, samples, language, vectorizer):
+        """
+        Compute the cache key of a training run.
+
+        :param samples: Training verbs, in order.
+        :type samples: sequence of str
+        :param language: Language of the model.
+        :type language: str | None
+        :param vectorizer: Vectorizer used to extract the features.
+        :return: Hexadecimal SHA-256 digest.
+        :rtype: str
+        """
+        digest = hashlib.sha256()
+
+        header = {
+            "language": language,
+            "feature_extractor": FEATURE_EXTRACTOR_VERSION,
+            "vectorizer": type(vectorizer).__name__,
+            "params": _describe(vectorizer.get_params()),
+        }
+        digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+
+        for sample in samples:
+            digest.update(sample.encode("utf-8"))
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def __contains__(self, key):
+        return os.path.isfile(self._path(key))
+
+    def load(self, key):
+        """
+        Load a cache entry.
+
+        :param key: Cache key from :meth:`key`.
+        :type key: str
+        :return: ``(vocabulary, matrix)`` or None if the entry is missing.
+        :rtype: tuple | None
+        """
+        path = self._path(key)
+
+        if not os.path.isfile(path):
+            return None
+
+        with np.load(path, allow_pickle=False) as entry:
+            matrix = csr_matrix(
+                (entry["data"], entry["indices"], entry["indptr"]),
+                shape=tuple(entry["shape"]),
+            )
+            terms = entry["terms"].tolist()
+
+        return {term: index for index, term in enumerate(terms)}, matrix
+
+    def save(self, key, vocabulary, matrix):
+        """
+        Store a cache entry atomically.
+
+        :param key: Cache key from :meth:`key`.
+        :type key: str
+        :param vocabulary: Mapping of features to column indices.
+        :type vocabulary: dict
+        :param matrix: Feature matrix.
+        :type matrix: scipy.sparse matrix
+        """
+        matrix = csr_matrix(matrix)
+        terms = sorted(vocabulary, key=vocabulary.get)
+
+        handle, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".npz")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                np.savez(
+                    file,
+                    data=matrix.data,
+                    indices=matrix.indices,
+                    indptr=matrix.indptr,
+                    shape=np.asarray(matrix.shape),
+                    terms=np.asarray(terms, dtype=str),
+                )
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def clear(self):
+        """
+        Remove every cache entry.
+        """
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.directory, name))
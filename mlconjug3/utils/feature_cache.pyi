@@ -0,0 +1,20 @@
+from typing import Any, Dict, Optional, Sequence, Tuple
+from scipy.sparse import csr_matrix
+
+def _describe(value: Any) -> Any: ...
+
+class FeatureCache:
+    directory: str
+
+    def __init__(self, directory: str) -> None: ...
+    def __repr__(self) -> str: ...
+    @staticmethod
+    def supports(vectorizer: Any) -> bool: ...
+    def key(
+        self, samples: Sequence[str], language: Optional[str], vectorizer: Any
+    ) -> str: ...
+    def _path(self, key: str) -> str: ...
+    def __contains__(self, key: object) -> bool: ...
+    def load(self, key: str) -> Optional[Tuple[Dict[str, int], csr_matrix]]: ...
+    def save(self, key: str, vocabulary: Dict[str, int], matrix: Any) -> None: ...
+    def clear(self) -> None: ...
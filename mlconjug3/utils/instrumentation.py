@@ -0,0 +1,380 @@
+"""
+Opt-in timing instrumentation for the Conjugator.
+
+This module records where the time of ``Conjugator.conjugate`` calls goes.
+It provides:
+- A per-call timer splitting a conjugation into stages (infinitive
+  resolution, lexicon lookup, conjugation tables, prediction cache lookup,
+  prediction, template resolution, Verb construction)
+- The path taken by each call (dictionary, suffix or model) and whether
+  it was answered by the LRU cache of ``Conjugator._conjugate``
+- Histograms of call durations, stage durations and batch sizes
+- Pluggable callbacks run at the start and the end of each call
+- A context manager enabling instrumentation on an existing Conjugator
+
+Instrumentation is disabled by default. A Conjugator without
+instrumentation only pays for one attribute check per call.
+
+Example::
+
+    with instrument(conjugator) as instrumentation:
+        conjugator.conjugate("manger")
+    instrumentation.summary()
+"""
+
+import threading
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+
+#: Upper bounds of the duration histogram buckets, in seconds.
+DURATION_BUCKETS = (
+    1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+#: Upper bounds of the batch size histogram buckets.
+BATCH_BUCKETS = (1, 10, 100, 1000, 10000, 100000)
+
+#: Stages recorded by the Conjugator, in the order they can occur.
+STAGES = (
+    "resolve",
+    "lookup",
+    "conjug_info",
+    "suffix",
+    "prediction_cache",
+    "predict",
+    "template",
+    "predict_proba",
+    "verb",
+)
+
+
+class Histogram:
+    """
+    Histogram with fixed bucket boundaries.
+
+    Parameters
+    ----------
+    buckets : sequence of float
+        Sorted upper bounds of the buckets. Values above the last bound
+        are counted in an overflow bucket.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        """
+        Record one value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+
+        :param q: Quantile between 0 and 1.
+        :type q: float
+        :return: Estimated quantile, capped by the maximum observed value,
+            or None if the histogram is empty.
+        :rtype: float | None
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        """
+        :return: Count, sum, mean, min, max and estimated p50, p90 and p99.
+        :rtype: dict
+        """
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class CallTimer:
+    """
+    Timing of one ``Conjugator.conjugate`` call on a single verb.
+
+    Attributes
+    ----------
+    verb : str
+        Verb as passed by the user.
+    language : str
+        Language of the Conjugator.
+    stages : dict
+        Duration of each stage reached, in seconds.
+    path : str or None
+        "dictionary", "suffix", "model", "none" when no Verb was returned,
+        or "error" when the call raised. Set when the call ends.
+    cache_hit : bool or None
+        Whether the call was answered by the LRU cache. Set when the call ends.
+    duration : float or None
+        Total duration of the call, in seconds. Set when the call ends.
+    result : Verb or None
+        Verb returned by the call. Set when the call ends.
+    """
+
+    __slots__ = (
+        "verb", "language", "start", "last", "stages", "path", "cache_hit", "duration", "result"
+    )
+
+    def __init__(self, verb, language):
+        self.verb = verb
+        self.language = language
+        self.stages = {}
+        self.path = None
+        self.cache_hit = None
+        self.duration = None
+        self.result = None
+        self.start = self.last = perf_counter()
+
+    def mark(self, stage):
+        """
+        End a stage: its duration is the time elapsed since the previous mark.
+        """
+        now = perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self.last
+        self.last = now
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(verb={self.verb!r}, language={self.language!r}, "
+            f"path={self.path!r}, duration={self.duration!r})"
+        )
+
+
+class Instrumentation:
+    """
+    Collects the timings of the calls of one or several Conjugators.
+
+    Pass it as the ``instrumentation`` parameter of :class:`Conjugator`, or
+    enable it temporarily with :func:`instrument`. Aggregates are updated
+    under a lock, so a single instance can be shared between threads.
+    Lists conjugated in worker processes are only recorded as batches.
+
+    Parameters
+    ----------
+    on_start : callable, optional
+        Called with the :class:`CallTimer` when a call starts.
+    on_end : callable, optional
+        Called with the :class:`CallTimer` when a call ends.
+
+    Attributes
+    ----------
+    durations : Histogram
+        Total duration of the calls.
+    stages : dict
+        Histogram of the duration of each stage.
+    batch_sizes : Histogram
+        Number of verbs of the lists passed to ``conjugate``.
+    batch_durations : Histogram
+        Duration of the lists passed to ``conjugate``.
+    paths : Counter
+        Number of calls per path.
+    languages : Counter
+        Number of calls per language.
+    cache_hits, cache_misses : int
+        Calls answered, or not, by the LRU cache.
+    queue_depth : int
+        Verbs of the lists currently waiting for, or being conjugated by,
+        the worker processes.
+    """
+
+    def __init__(self, on_start=None, on_end=None):
+        self.start_callbacks = []
+        self.end_callbacks = []
+        self.add_callback(on_start=on_start, on_end=on_end)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.queue_depth = 0
+        self.reset()
+
+    def add_callback(self, on_start=None, on_end=None):
+        """
+        Register callbacks run with the :class:`CallTimer` of each call.
+        """
+        if on_start is not None:
+            self.start_callbacks.append(on_start)
+        if on_end is not None:
+            self.end_callbacks.append(on_end)
+
+    def remove_callback(self, callback):
+        """
+        Unregister a callback passed to :meth:`add_callback`.
+        """
+        for callbacks in (self.start_callbacks, self.end_callbacks):
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def reset(self):
+        """
+        Clear the aggregated measurements.
+        """
+        with self._lock:
+            self.durations = Histogram()
+            self.stages = {}
+            self.batch_sizes = Histogram(BATCH_BUCKETS)
+            self.batch_durations = Histogram()
+            self.paths = Counter()
+            self.languages = Counter()
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    @property
+    def timer(self):
+        """
+        Timer of the call running in the current thread, or None.
+        """
+        return getattr(self._local, "timer", None)
+
+    def start(self, verb, language):
+        """
+        Start timing a call in the current thread.
+
+        :return: The timer of the call.
+        :rtype: CallTimer
+        """
+        timer = CallTimer(verb, language)
+        self._local.timer = timer
+        for callback in self.start_callbacks:
+            callback(timer)
+        return timer
+
+    def stop(self, timer, result=None, cache_hit=False, error=False):
+        """
+        End a call started with :meth:`start` and aggregate its timings.
+
+        :param timer: Timer returned by :meth:`start`.
+        :type timer: CallTimer
+        :param result: Verb returned by the call, used to find its path.
+        :param cache_hit: Whether the LRU cache answered the call.
+        :type cache_hit: bool
+        :param error: Whether the call raised.
+        :type error: bool
+        """
+        timer.duration = perf_counter() - timer.start
+        timer.cache_hit = cache_hit
+        timer.result = result
+        if error:
+            timer.path = "error"
+        else:
+            timer.path = getattr(result, "source", None) or "none"
+        self._local.timer = None
+
+        with self._lock:
+            self.durations.observe(timer.duration)
+            for stage, duration in timer.stages.items():
+                if stage not in self.stages:
+                    self.stages[stage] = Histogram()
+                self.stages[stage].observe(duration)
+            self.paths[timer.path] += 1
+            self.languages[timer.language] += 1
+            if cache_hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+        for callback in self.end_callbacks:
+            callback(timer)
+
+    def start_batch(self, size):
+        """
+        Record that a list of ``size`` verbs is sent to the worker processes.
+        """
+        with self._lock:
+            self.queue_depth += size
+
+    def record_batch(self, size, duration):
+        """
+        Record a list of ``size`` verbs conjugated in ``duration`` seconds.
+        """
+        with self._lock:
+            self.queue_depth -= size
+            self.batch_sizes.observe(size)
+            self.batch_durations.observe(duration)
+
+    def summary(self):
+        """
+        Return the aggregated measurements.
+
+        :return: Number of calls, calls per path and language, cache hit
+            ratio, and histogram summaries of the calls, of each stage and
+            of the batches.
+        :rtype: dict
+        """
+        with self._lock:
+            calls = self.cache_hits + self.cache_misses
+            return {
+                "calls": calls,
+                "paths": dict(self.paths),
+                "languages": dict(self.languages),
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "cache_hit_ratio": self.cache_hits / calls if calls else None,
+                "queue_depth": self.queue_depth,
+                "duration": self.durations.summary(),
+                "stages": {
+                    stage: self.stages[stage].summary()
+                    for stage in sorted(self.stages, key=_stage_order)
+                },
+                "batch_size": self.batch_sizes.summary(),
+                "batch_duration": self.batch_durations.summary(),
+            }
+
+
+def _stage_order(stage):
+    return STAGES.index(stage) if stage in STAGES else len(STAGES)
+
+
+@contextmanager
+def instrument(conjugator, instrumentation=None):
+    """
+    Enable instrumentation on a Conjugator for the duration of a block.
+
+    :param conjugator: Conjugator to instrument.
+    :type conjugator: mlconjug3.Conjugator
+    :param instrumentation: Instrumentation to use. Defaults to a new one.
+    :type instrumentation: Instrumentation | None
+    :return: The instrumentation, usable after the block.
+    :rtype: Instrumentation
+    """
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+
+    previous = conjugator.instrumentation
+    conjugator.instrumentation = instrumentation
+    try:
+        yield instrumentation
+    finally:
+        conjugator.instrumentation = previous
@@ -0,0 +1,75 @@
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Sequence, Tuple
+from collections import Counter
+
+DURATION_BUCKETS: Tuple[float, ...]
+BATCH_BUCKETS: Tuple[int, ...]
+STAGES: Tuple[str, ...]
+
+class Histogram:
+    buckets: Tuple[float, ...]
+    counts: List[int]
+    count: int
+    sum: float
+    min: Optional[float]
+    max: Optional[float]
+    def __init__(self, buckets: Sequence[float] = ...) -> None: ...
+    def observe(self, value: float) -> None: ...
+    def quantile(self, q: float) -> Optional[float]: ...
+    def summary(self) -> Dict[str, Any]: ...
+
+class CallTimer:
+    verb: str
+    language: str
+    start: float
+    last: float
+    stages: Dict[str, float]
+    path: Optional[str]
+    cache_hit: Optional[bool]
+    duration: Optional[float]
+    result: Any
+    def __init__(self, verb: str, language: str) -> None: ...
+    def mark(self, stage: str) -> None: ...
+    def __repr__(self) -> str: ...
+
+class Instrumentation:
+    start_callbacks: List[Callable[[CallTimer], Any]]
+    end_callbacks: List[Callable[[CallTimer], Any]]
+    durations: Histogram
+    stages: Dict[str, Histogram]
+    batch_sizes: Histogram
+    batch_durations: Histogram
+    paths: Counter
+    languages: Counter
+    cache_hits: int
+    cache_misses: int
+    queue_depth: int
+    def __init__(
+        self,
+        on_start: Optional[Callable[[CallTimer], Any]] = ...,
+        on_end: Optional[Callable[[CallTimer], Any]] = ...,
+    ) -> None: ...
+    def add_callback(
+        self,
+        on_start: Optional[Callable[[CallTimer], Any]] = ...,
+        on_end: Optional[Callable[[CallTimer], Any]] = ...,
+    ) -> None: ...
+    def remove_callback(self, callback: Callable[[CallTimer], Any]) -> None: ...
+    def reset(self) -> None: ...
+    @property
+    def timer(self) -> Optional[CallTimer]: ...
+    def start(self, verb: str, language: str) -> CallTimer: ...
+    def stop(
+        self,
+        timer: CallTimer,
+        result: Any = ...,
+        cache_hit: bool = ...,
+        error: bool = ...,
+    ) -> None: ...
+    def start_batch(self, size: int) -> None: ...
+    def record_batch(self, size: int, duration: float) -> None: ...
+    def summary(self) -> Dict[str, Any]: ...
+
+def _stage_order(stage: str) -> int: ...
+def instrument(
+    conjugator: Any, instrumentation: Optional[Instrumentation] = ...
+) -> ContextManager[Instrumentation]: ...
@@ -0,0 +1,289 @@
+"""
+Prometheus metrics for services embedding the Conjugator.
+
+This module exposes the runtime behaviour of one or several Conjugators
+in the Prometheus text exposition format, without any external
+dependency. It provides:
+- Conjugations by language and path (dictionary, suffix or model)
+- The ML fallback rate, i.e. the share of calls answered by the model
+- The distribution of the model confidence scores
+- The hit ratio of the LRU cache of ``Conjugator._conjugate``
+- Call latency, list sizes and the worker-pool queue depth
+- The time needed to load each pre-trained model
+- A local HTTP endpoint serving the metrics
+
+The metrics are collected through :mod:`mlconjug3.utils.instrumentation`.
+
+Example::
+
+    metrics = ConjugatorMetrics()
+    metrics.attach(conjugator)
+    metrics.start_http_server(9464)  # http://127.0.0.1:9464/metrics
+    print(metrics.render())
+"""
+
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .instrumentation import DURATION_BUCKETS, Histogram, Instrumentation
+
+#: Content type of the Prometheus text exposition format.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+#: Upper bounds of the confidence score histogram buckets.
+CONFIDENCE_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99, 1.0)
+
+#: Prefix of every metric name.
+PREFIX = "mlconjug3"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class ConjugatorMetrics:
+    """
+    Prometheus metrics of the Conjugators attached to it.
+
+    Parameters
+    ----------
+    instrumentation : Instrumentation, optional
+        Instrumentation given to the attached Conjugators. Defaults to a
+        new one.
+
+    Metrics
+    -------
+    ``mlconjug3_conjugations_total{language, path}``
+        Conjugated verbs, per path.
+    ``mlconjug3_model_fallback_ratio{language}``
+        Share of the conjugations answered by the model.
+    ``mlconjug3_confidence_score{language}``
+        Histogram of the confidence scores of the model.
+    ``mlconjug3_cache_hits_total{language}``, ``mlconjug3_cache_misses_total{language}``
+        Calls answered, or not, by the LRU cache.
+    ``mlconjug3_cache_hit_ratio{language}``
+        Share of the calls answered by the LRU cache.
+    ``mlconjug3_conjugation_duration_seconds{language}``
+        Histogram of the duration of single-verb calls.
+    ``mlconjug3_batch_size``, ``mlconjug3_batch_duration_seconds``
+        Histograms of the lists conjugated by the worker processes.
+    ``mlconjug3_queue_depth``
+        Verbs of the lists waiting for, or being conjugated by, the workers.
+    ``mlconjug3_model_load_seconds{language}``
+        Time needed to load the pre-trained model.
+    """
+
+    def __init__(self, instrumentation=None):
+        if instrumentation is None:
+            instrumentation = Instrumentation()
+
+        self.instrumentation = instrumentation
+        self.instrumentation.add_callback(on_end=self._observe)
+
+        self._lock = threading.Lock()
+        self._conjugations = Counter()
+        self._cache_hits = Counter()
+        self._cache_misses = Counter()
+        self._durations = {}
+        self._confidence = {}
+        self._load_times = {}
+
+    def attach(self, conjugator):
+        """
+        Collect the metrics of a Conjugator.
+
+        :param conjugator: Conjugator to monitor. Its instrumentation is
+            replaced by the one of these metrics.
+        :type conjugator: mlconjug3.Conjugator
+        :return: The conjugator.
+        :rtype: mlconjug3.Conjugator
+        """
+        conjugator.instrumentation = self.instrumentation
+        if conjugator.model_load_time is not None:
+            with self._lock:
+                self._load_times[conjugator.language] = conjugator.model_load_time
+        return conjugator
+
+    def _observe(self, timer):
+        language = timer.language
+        confidence = getattr(timer.result, "confidence_score", None)
+
+        with self._lock:
+            self._conjugations[language, timer.path] += 1
+
+            if timer.cache_hit:
+                self._cache_hits[language] += 1
+            else:
+                self._cache_misses[language] += 1
+
+            if language not in self._durations:
+                self._durations[language] = Histogram(DURATION_BUCKETS)
+            self._durations[language].observe(timer.duration)
+
+            if confidence is not None:
+                if language not in self._confidence:
+                    self._confidence[language] = Histogram(CONFIDENCE_BUCKETS)
+                self._confidence[language].observe(confidence)
+
+    def fallback_ratio(self, language):
+        """
+        Share of the conjugations of ``language`` answered by the model.
+
+        :return: The ratio, or None before the first conjugation.
+        :rtype: float | None
+        """
+        with self._lock:
+            total = sum(
+                count for (lang, _), count in self._conjugations.items() if lang == language
+            )
+            return self._conjugations[language, "model"] / total if total else None
+
+    def render(self):
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        :rtype: str
+        """
+        lines = []
+
+        def header(name, kind, description):
+            lines.append(f"# HELP {PREFIX}_{name} {description}")
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+
+        def sample(name, value, **labels):
+            lines.append(f"{PREFIX}_{name}{_labels(**labels)} {_number(value)}")
+
+        def histogram(name, values, **labels):
+            cumulative = 0
+            for bound, count in zip(values.buckets, values.counts):
+                cumulative += count
+                sample(f"{name}_bucket", cumulative, **labels, le=_number(float(bound)))
+            sample(f"{name}_bucket", values.count, **labels, le="+Inf")
+            sample(f"{name}_sum", values.sum, **labels)
+            sample(f"{name}_count", values.count, **labels)
+
+        instrumentation = self.instrumentation
+
+        with self._lock:
+            languages = sorted(
+                {lang for lang, _ in self._conjugations} | set(self._load_times)
+            )
+
+            header("conjugations_total", "counter", "Conjugated verbs by language and path.")
+            for (lang, path), count in sorted(self._conjugations.items()):
+                sample("conjugations_total", count, language=lang, path=path)
+
+            header(
+                "model_fallback_ratio", "gauge",
+                "Share of the conjugations answered by the model.",
+            )
+            for lang in languages:
+                total = sum(
+                    count for (other, _), count in self._conjugations.items() if other == lang
+                )
+                if total:
+                    sample(
+                        "model_fallback_ratio",
+                        self._conjugations[lang, "model"] / total,
+                        language=lang,
+                    )
+
+            header("confidence_score", "histogram", "Confidence scores of the model.")
+            for lang in sorted(self._confidence):
+                histogram("confidence_score", self._confidence[lang], language=lang)
+
+            header("cache_hits_total", "counter", "Calls answered by the LRU cache.")
+            for lang in languages:
+                sample("cache_hits_total", self._cache_hits[lang], language=lang)
+
+            header("cache_misses_total", "counter", "Calls not answered by the LRU cache.")
+            for lang in languages:
+                sample("cache_misses_total", self._cache_misses[lang], language=lang)
+
+            header("cache_hit_ratio", "gauge", "Share of the calls answered by the LRU cache.")
+            for lang in languages:
+                calls = self._cache_hits[lang] + self._cache_misses[lang]
+                if calls:
+                    sample("cache_hit_ratio", self._cache_hits[lang] / calls, language=lang)
+
+            header(
+                "conjugation_duration_seconds", "histogram",
+                "Duration of single-verb conjugations.",
+            )
+            for lang in sorted(self._durations):
+                histogram("conjugation_duration_seconds", self._durations[lang], language=lang)
+
+            header("model_load_seconds", "gauge", "Time needed to load the pre-trained model.")
+            for lang, load_time in sorted(self._load_times.items()):
+                sample("model_load_seconds", load_time, language=lang)
+
+        with instrumentation._lock:
+            header("batch_size", "histogram", "Verbs of the lists conjugated by the workers.")
+            histogram("batch_size", instrumentation.batch_sizes)
+
+            header(
+                "batch_duration_seconds", "histogram",
+                "Duration of the lists conjugated by the workers.",
+            )
+            histogram("batch_duration_seconds", instrumentation.batch_durations)
+
+            header(
+                "queue_depth", "gauge",
+                "Verbs waiting for, or being conjugated by, the worker processes.",
+            )
+            sample("queue_depth", instrumentation.queue_depth)
+
+        return "\n".join(lines) + "\n"
+
+    def __call__(self):
+        return self.render()
+
+    def start_http_server(self, port=9464, host="127.0.0.1"):
+        """
+        Serve the metrics at ``http://{host}:{port}/metrics`` in a daemon thread.
+
+        :param port: Port to listen on. 0 picks a free port.
+        :type port: int
+        :param host: Address to listen on.
+        :type host: str
+        :return: The running server; call ``shutdown()`` to stop it. The
+            bound port is ``server.server_address[1]``.
+        :rtype: http.server.ThreadingHTTPServer
+        """
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        return server
@@ -0,0 +1,22 @@
+from http.server import ThreadingHTTPServer
+from typing import Any, Optional, Tuple
+
+from .instrumentation import CallTimer, Instrumentation
+
+CONTENT_TYPE: str
+CONFIDENCE_BUCKETS: Tuple[float, ...]
+PREFIX: str
+
+def _escape(value: Any) -> str: ...
+def _labels(**labels: Any) -> str: ...
+def _number(value: float) -> str: ...
+
+class ConjugatorMetrics:
+    instrumentation: Instrumentation
+    def __init__(self, instrumentation: Optional[Instrumentation] = ...) -> None: ...
+    def attach(self, conjugator: Any) -> Any: ...
+    def _observe(self, timer: CallTimer) -> None: ...
+    def fallback_ratio(self, language: str) -> Optional[float]: ...
+    def render(self) -> str: ...
+    def __call__(self) -> str: ...
+    def start_http_server(self, port: int = ..., host: str = ...) -> ThreadingHTTPServer: ...
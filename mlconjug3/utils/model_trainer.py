@@ -6,15 +6,134 @@ It supports:
 - Dataset splitting
 - Model training via mlconjug3 pipeline
 - Evaluation against ground truth templates
-- Serialization of trained models
+- Vectorized metrics and form-level evaluation reports
+- Stratified k-fold cross-validation
+- Incremental updates with new verbs and templates
+- Post-training pruning of unused features
+- Budgeted training with warm starts and convergence curves
+- Serialization and packaging of trained models
 """
 
+import io
+import os
+import copy
 import multiprocessing
 import mlconjug3
 import pickle
+import tempfile
+import joblib
 import numpy as np
 from functools import partial
 from time import time
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import log_loss
+
+from mlconjug3.models.hierarchical import HierarchicalClassifier
+from .feature_cache import FeatureCache
+
+
+def _share_matrix(matrix, folder):
+    """
+    Dump a feature matrix to disk and reopen it memory-mapped.
+
+    joblib passes memory-mapped arrays to worker processes by reference,
+    so every worker reads the same pages instead of receiving a pickled copy.
+
+    :param matrix: Feature matrix to share.
+    :type matrix: scipy.sparse.csr_matrix
+    :param folder: Directory holding the memory-mapped file.
+    :type folder: str
+    :return: Read-only memory-mapped copy of the matrix.
+    :rtype: scipy.sparse.csr_matrix
+    """
+    path = os.path.join(folder, "features.joblib")
+    joblib.dump(matrix, path)
+    return joblib.load(path, mmap_mode="r")
+
+
+def _fit_fold(classifier, features, labels, train_indices, test_indices):
+    """
+    Train a fresh copy of a classifier on one fold and score it.
+
+    :return: Accuracy, training time and fold sizes.
+    :rtype: dict
+    """
+    estimator = clone(classifier)
+
+    start = time()
+    estimator.fit(features[train_indices], labels[train_indices])
+    fit_time = time() - start
+
+    if len(test_indices):
+        predictions = estimator.predict(features[test_indices])
+        accuracy = float(np.mean(predictions == labels[test_indices]))
+    else:
+        accuracy = float("nan")
+
+    return {
+        "accuracy": accuracy,
+        "fit_time": fit_time,
+        "n_train": len(train_indices),
+        "n_test": len(test_indices),
+    }
+
+
+def _classification_metrics(y_true, y_pred):
+    """
+    Compute accuracy and per-class metrics with bincount.
+
+    :return: Accuracy, macro F1 over the labels found in ``y_true`` or
+        ``y_pred``, and per-class support, precision, recall and F1 arrays
+        aligned with the returned labels.
+    :rtype: dict
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+
+    labels, codes = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    true_codes, pred_codes = codes[:len(y_true)], codes[len(y_true):]
+    correct = true_codes == pred_codes
+
+    support = np.bincount(true_codes, minlength=len(labels))
+    predicted = np.bincount(pred_codes, minlength=len(labels))
+    hits = np.bincount(true_codes[correct], minlength=len(labels))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        recall = np.where(support > 0, hits / support, 0.0)
+        precision = np.where(predicted > 0, hits / predicted, 0.0)
+        f1 = np.where(
+            precision + recall > 0,
+            2 * precision * recall / (precision + recall),
+            0.0,
+        )
+
+    return {
+        "accuracy": float(correct.mean()) if len(correct) else float("nan"),
+        "macro_f1": float(f1.mean()) if len(f1) else float("nan"),
+        "labels": labels,
+        "support": support,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+    }
+
+
+def _flatten_forms(conjug_info):
+    """
+    Map every (mood, tense, person) of a conjugation table to its form.
+    """
+    forms = {}
+    for mood, tenses in conjug_info.items():
+        for tense, persons in tenses.items():
+            if isinstance(persons, dict):
+                for person, form in persons.items():
+                    forms[mood, tense, person] = form
+            else:
+                forms[mood, tense, None] = persons
+    return forms
 
 
 class ConjugatorTrainer:
@@ -37,6 +156,12 @@ class ConjugatorTrainer:
     :type dataset: DataSet
     :param model: Machine learning model to train.
     :type model: Model
+    :param feature_cache: Optional feature cache (or its directory) reused
+        across training runs on the same verbs.
+    :type feature_cache: FeatureCache | str | None
+    :param n_jobs: Number of threads fitting the template classes in
+        parallel (see ``Model.n_jobs``). None keeps the model setting.
+    :type n_jobs: int | None
 
     :ivar lang: Language of the training pipeline.
     :vartype lang: str
@@ -52,12 +177,37 @@ class ConjugatorTrainer:
     :vartype conjugator: Conjugator
     """
 
-    def __init__(self, lang, output_folder, split_proportion, dataset, model):
+    def __init__(
+        self,
+        lang,
+        output_folder,
+        split_proportion,
+        dataset,
+        model,
+        feature_cache=None,
+        n_jobs=None,
+    ):
         self.lang = lang
         self.output_folder = output_folder
         self.split_proportion = split_proportion
         self.dataset = dataset
         self.model = model
+        self.updated_verbs = []
+
+        if feature_cache is not None:
+            if not isinstance(feature_cache, FeatureCache):
+                feature_cache = FeatureCache(feature_cache)
+            self.model.feature_cache = feature_cache
+
+        if n_jobs is not None:
+            self.model.n_jobs = n_jobs
+
+        # Hierarchical classifiers group the dataset templates by ending.
+        pipeline = getattr(self.model, "pipeline", None)
+        if pipeline is not None:
+            classifier = pipeline.steps[-1][1]
+            if isinstance(classifier, HierarchicalClassifier) and classifier.templates is None:
+                classifier.set_params(templates=list(self.dataset.templates))
 
         # Initialize Conjugator wrapper
         self.conjugator = mlconjug3.Conjugator(
@@ -65,7 +215,7 @@ class ConjugatorTrainer:
             model=self.model,
         )
 
-    def train(self):
+    def train(self, holdout=False):
         """
         Train the conjugation model using the provided dataset split.
 
@@ -73,6 +223,11 @@ class ConjugatorTrainer:
         - Splits dataset into train/test sets
         - Trains model on verb samples and template labels
         - Reports completion status
+
+        :param holdout: If True, train on the training split only so the
+            test split can be used for evaluation. Otherwise all verbs are
+            used.
+        :type holdout: bool
         """
         np.random.seed(42)
 
@@ -80,13 +235,179 @@ class ConjugatorTrainer:
         self.dataset.split_data(proportion=self.split_proportion)
 
         # Train model
-        self.conjugator.model.train(
-            self.dataset.verbs_list,
-            self.dataset.templates_list,
-        )
+        if holdout:
+            self.conjugator.model.train(
+                self.dataset.train_input,
+                self.dataset.train_labels,
+            )
+        else:
+            self.conjugator.model.train(
+                self.dataset.verbs_list,
+                self.dataset.templates_list,
+            )
 
         print(f"{self.lang} model successfully trained.")
 
+    def _pretrained_model(self):
+        """
+        Return a copy of the shipped pre-trained model, relabeled for the dataset.
+
+        The pre-trained models are trained on the default dataset of the
+        language, whose template ids may differ from those of ``dataset``.
+
+        :raises ValueError: If a pre-trained template is missing from the dataset.
+        """
+        model = copy.deepcopy(mlconjug3.Conjugator(self.lang).model)
+        templates = mlconjug3.DataSet(mlconjug3.Verbiste(self.lang).verbs).templates
+
+        missing = [t for t in templates if t not in self.dataset.template_ids]
+        if missing:
+            raise ValueError(
+                f"Cannot warm start: {len(missing)} pre-trained templates are "
+                f"missing from the dataset (e.g. {missing[0]!r})."
+            )
+
+        mapping = np.array([self.dataset.template_ids[t] for t in templates])
+        if not np.array_equal(mapping, np.arange(len(mapping))):
+            model.relabel(mapping)
+
+        return model
+
+    def train_with_budget(
+        self,
+        max_epochs=100,
+        time_budget=None,
+        warm_start=False,
+        patience=5,
+        tol=1e-4,
+    ):
+        """
+        Train epoch by epoch under a budget, monitoring convergence.
+
+        The model is trained with ``partial_fit`` on the training split, one
+        epoch at a time, and evaluated on the test split after each epoch.
+        Training stops when the epoch or time budget is spent, or when the
+        validation accuracy has not improved by more than ``tol`` for
+        ``patience`` epochs. The coefficients of the best epoch are kept.
+
+        :param max_epochs: Maximum number of epochs.
+        :type max_epochs: int
+        :param time_budget: Wall-clock budget in seconds, checked after
+            every epoch. None means no time limit.
+        :type time_budget: float | None
+        :param warm_start: Start from the shipped pre-trained model (True)
+            or from a given trained Model, instead of from scratch (False).
+            The starting model is copied, not modified.
+        :type warm_start: bool | Model
+        :param patience: Number of epochs without improvement before stopping.
+        :type patience: int
+        :param tol: Minimum improvement of the validation accuracy.
+        :type tol: float
+        :return: The trained model, which replaces ``self.model``, and the
+            training history: per-epoch ``epochs``, ``times`` (seconds since
+            start), ``train_loss``, ``train_accuracy`` and ``val_accuracy``,
+            plus ``best_epoch`` and ``stop_reason`` (``"plateau"``,
+            ``"time_budget"`` or ``"max_epochs"``).
+        :rtype: tuple
+        :raises ValueError: If ``max_epochs`` is lower than 1.
+
+        .. note::
+            Without a test split, the training accuracy is monitored instead.
+        """
+        if max_epochs < 1:
+            raise ValueError("max_epochs must be at least 1.")
+
+        start = time()
+        self.dataset.split_data(proportion=self.split_proportion)
+        train_verbs = self.dataset.train_input
+        train_labels = self.dataset.templates_list[self.dataset.train_indices]
+        val_verbs = self.dataset.test_input
+        val_labels = self.dataset.templates_list[self.dataset.test_indices]
+
+        if warm_start is True:
+            model = self._pretrained_model()
+        elif warm_start:
+            model = copy.deepcopy(warm_start)
+        else:
+            # A fresh estimator, so that a fitted self.model is neither
+            # continued nor modified.
+            model = copy.copy(self.model)
+            model.pipeline = clone(self.model.pipeline)
+
+        model.feature_cache = self.model.feature_cache
+
+        history = {
+            "epochs": [],
+            "times": [],
+            "train_loss": [],
+            "train_accuracy": [],
+            "val_accuracy": [],
+            "best_epoch": None,
+            "stop_reason": "max_epochs",
+        }
+
+        random_state = np.random.RandomState(42)
+        classifier = model.pipeline.steps[-1][1]
+        best_score = -np.inf
+        best_params = None
+        stale = 0
+
+        for epoch in range(1, max_epochs + 1):
+            if epoch == 1:
+                # Fits or extends the vocabulary and registers the classes.
+                model.partial_fit(train_verbs, train_labels)
+                vectorizer = model.pipeline.steps[0][1]
+                X_train = vectorizer.transform(train_verbs).tocsr()
+                X_val = vectorizer.transform(val_verbs) if len(val_labels) else None
+            else:
+                order = random_state.permutation(len(train_labels))
+                classifier.partial_fit(X_train[order], train_labels[order])
+
+            train_accuracy = float(np.mean(classifier.predict(X_train) == train_labels))
+            train_loss = None
+            if hasattr(classifier, "predict_proba"):
+                train_loss = float(log_loss(
+                    train_labels, classifier.predict_proba(X_train),
+                    labels=classifier.classes_,
+                ))
+
+            if X_val is not None:
+                val_accuracy = float(np.mean(classifier.predict(X_val) == val_labels))
+                score = val_accuracy
+            else:
+                val_accuracy = None
+                score = train_accuracy
+
+            history["epochs"].append(epoch)
+            history["times"].append(time() - start)
+            history["train_loss"].append(train_loss)
+            history["train_accuracy"].append(train_accuracy)
+            history["val_accuracy"].append(val_accuracy)
+
+            if score > best_score + tol:
+                best_score = score
+                history["best_epoch"] = epoch
+                best_params = (classifier.coef_.copy(), classifier.intercept_.copy())
+                stale = 0
+            else:
+                stale += 1
+
+            if stale >= patience:
+                history["stop_reason"] = "plateau"
+                break
+
+            if time_budget is not None and time() - start >= time_budget:
+                history["stop_reason"] = "time_budget"
+                break
+
+        if best_params is not None and history["best_epoch"] != epoch:
+            classifier.coef_, classifier.intercept_ = best_params
+
+        self.model = model
+        self.conjugator.set_model(model)
+
+        return model, history
+
     def predict(self):
         """
         Generate predictions for all verbs in the dataset.
@@ -96,6 +417,145 @@ class ConjugatorTrainer:
         """
         return self.model.predict(self.dataset.verbs_list)
 
+    def _predict_batches(self, verbs, batch_size):
+        """
+        Predict templates for ``verbs`` in batches of ``batch_size``.
+        """
+        if not len(verbs):
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate([
+            np.asarray(self.model.predict(verbs[start:start + batch_size]))
+            for start in range(0, len(verbs), batch_size)
+        ])
+
+    def _template_name(self, label):
+        templates = getattr(self.dataset, "templates", None)
+        if templates is None or isinstance(label, str):
+            return label
+        return templates[int(label)]
+
+    def _form_accuracy(self, verbs, y_true, y_pred):
+        """
+        Measure how many conjugated forms of the predicted templates are right.
+
+        The forms generated by two templates only differ through the last
+        characters of the verb (the longest template ending, plus one), so
+        each (gold, predicted, verb ending) group is conjugated only once.
+        Correctly predicted verbs have all their forms right.
+
+        :return: Fraction of correct forms, fraction of verbs with all forms
+            correct and number of template pairs expanded.
+        :rtype: dict
+        """
+        n_forms = {}
+
+        def count_forms(template):
+            if template not in n_forms:
+                verb = self.conjugator._build_verb("x" * 16, template, "pronoun")
+                n_forms[template] = 0 if verb is None else len(_flatten_forms(verb.conjug_info))
+            return n_forms[template]
+
+        errors = {}
+        total = 0
+
+        for label, count in zip(*np.unique(y_true, return_counts=True)):
+            total += count * count_forms(self._template_name(label))
+
+        correct = total
+        wrong_verbs = 0
+
+        for position in np.flatnonzero(y_true != y_pred):
+            verb = verbs[position]
+            gold = self._template_name(y_true[position])
+            predicted = self._template_name(y_pred[position])
+
+            length = max(len(template) - template.find(":") for template in (gold, predicted))
+            key = (gold, predicted, verb[-length:])
+
+            if key not in errors:
+                gold_verb = self.conjugator._build_verb(verb, gold, "pronoun")
+                predicted_verb = self.conjugator._build_verb(verb, predicted, "pronoun")
+                gold_forms = {} if gold_verb is None else _flatten_forms(gold_verb.conjug_info)
+                predicted_forms = (
+                    {} if predicted_verb is None else _flatten_forms(predicted_verb.conjug_info)
+                )
+                errors[key] = sum(
+                    form != predicted_forms.get(slot) for slot, form in gold_forms.items()
+                )
+
+            correct -= errors[key]
+            wrong_verbs += errors[key] > 0
+
+        return {
+            "accuracy": float(correct / total) if total else float("nan"),
+            "verb_accuracy": 1 - wrong_verbs / len(y_true) if len(y_true) else float("nan"),
+            "n_expanded": len(errors),
+        }
+
+    def evaluation_report(self, verbs=None, labels=None, batch_size=4096, forms=True):
+        """
+        Evaluate the model and return the results as data.
+
+        Predictions are made in batches and the metrics are computed with
+        numpy: accuracy, macro F1 and per-template support, precision,
+        recall and F1. Optionally, the forms conjugated with the predicted
+        templates are compared with those of the gold templates.
+
+        :param verbs: Verbs to evaluate. Defaults to all the dataset verbs.
+        :type verbs: sequence of str | None
+        :param labels: Gold template labels of ``verbs``.
+        :type labels: sequence of int | None
+        :param batch_size: Number of verbs predicted at once.
+        :type batch_size: int
+        :param forms: Also measure form-level correctness.
+        :type forms: bool
+        :return: ``n_samples``, ``accuracy``, ``macro_f1``, ``per_template``
+            (template name mapped to its metrics), ``forms`` (or None) and
+            the prediction and form evaluation times in seconds.
+        :rtype: dict
+        """
+        if verbs is None:
+            verbs, labels = self.dataset.verbs_list, self.dataset.templates_list
+
+        verbs = list(verbs)
+        y_true = np.asarray(labels)
+
+        start = time()
+        y_pred = self._predict_batches(verbs, batch_size)
+        predict_time = time() - start
+
+        metrics = _classification_metrics(y_true, y_pred)
+
+        per_template = {
+            self._template_name(label): {
+                "support": int(support),
+                "precision": float(precision),
+                "recall": float(recall),
+                "f1": float(f1),
+            }
+            for label, support, precision, recall, f1 in zip(
+                metrics["labels"], metrics["support"], metrics["precision"],
+                metrics["recall"], metrics["f1"],
+            )
+        }
+
+        report = {
+            "n_samples": len(verbs),
+            "accuracy": metrics["accuracy"],
+            "macro_f1": metrics["macro_f1"],
+            "per_template": per_template,
+            "forms": None,
+            "predict_time": predict_time,
+            "forms_time": None,
+        }
+
+        if forms:
+            start = time()
+            report["forms"] = self._form_accuracy(verbs, y_true, y_pred)
+            report["forms_time"] = time() - start
+
+        return report
+
     def evaluate(self):
         """
         Evaluate model accuracy against ground truth templates.
@@ -105,25 +565,257 @@ class ConjugatorTrainer:
         - Number of mismatches
         - Total number of samples
 
-        Prints evaluation summary.
+        Prints evaluation summary. See :meth:`evaluation_report` for
+        structured results.
         """
-        predictions = self.model.predict(self.dataset.verbs_list)
-
-        score = len(
-            [a == b for a, b in zip(predictions, self.dataset.templates_list) if a == b]
-        ) / len(predictions)
-
-        misses = len(
-            [a != b for a, b in zip(predictions, self.dataset.templates_list) if a != b]
-        )
+        labels = np.asarray(self.dataset.templates_list)
+        predictions = self._predict_batches(self.dataset.verbs_list, 4096)
 
         entries = len(predictions)
+        misses = int(np.count_nonzero(predictions != labels))
+        score = (entries - misses) / entries
 
         print(
             f"The score of the {self.lang} model is {score} "
             f"with {misses} misses out of {entries} entries."
         )
 
+    def cross_validate(self, n_splits=5, n_repeats=1, n_jobs=None, threshold=None):
+        """
+        Estimate model accuracy with stratified (repeated) k-fold cross-validation.
+
+        The verbs are vectorized once with a clone of the model's vectorizer.
+        The feature matrix is then memory-mapped and shared by the workers,
+        each fitting a fresh clone of the model's classifier on one fold.
+        The model itself is left unchanged.
+
+        :param n_splits: Number of folds.
+        :type n_splits: int
+        :param n_repeats: Number of repetitions with different shuffles.
+        :type n_repeats: int
+        :param n_jobs: Number of parallel workers (joblib semantics).
+        :type n_jobs: int | None
+        :param threshold: Templates with at most this many verbs are kept
+            in every training fold. Defaults to ``n_splits - 1``.
+        :type threshold: int | None
+        :return: Per-fold results and the mean and standard deviation of
+            the accuracy.
+        :rtype: dict
+
+        .. note::
+            The cloned vectorizer is fitted on all the verbs of the dataset,
+            as in :meth:`train`.
+        """
+        labels = np.asarray(self.dataset.templates_list)
+
+        # Fitting the model's own vectorizer would leave its vocabulary out
+        # of step with the fitted coefficients.
+        model = copy.copy(self.model)
+        model.pipeline = clone(self.model.pipeline)
+        features = model.fit_features(self.dataset.verbs_list).tocsr()
+        classifier = model.pipeline.steps[-1][1]
+
+        folds = list(
+            self.dataset.kfold_indices(n_splits, n_repeats, threshold)
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            shared = _share_matrix(features, folder)
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(_fit_fold)(classifier, shared, labels, train, test)
+                for train, test in folds
+            )
+            del shared
+
+        for number, result in enumerate(results):
+            result["repeat"], result["fold"] = divmod(number, n_splits)
+
+        scores = np.array([result["accuracy"] for result in results])
+
+        return {
+            "n_splits": n_splits,
+            "n_repeats": n_repeats,
+            "folds": results,
+            "mean": float(np.nanmean(scores)),
+            "std": float(np.nanstd(scores)),
+        }
+
+    def update(self, verbs, n_epochs=5, replay=4, extend_vocabulary=True):
+        """
+        Incrementally update the trained model with new verbs.
+
+        The new verbs are merged into the dataset and learned with
+        ``Model.partial_fit`` instead of a full retrain. New templates are
+        registered as new classes; since template ids are positions in the
+        sorted template list, the existing classes are renumbered first.
+
+        To limit forgetting, each update also replays a random sample of
+        the verbs already known to the model.
+
+        :param verbs: New verbs mapped to their metadata (as in
+            ``Verbiste.verbs``) or directly to their template name.
+        :type verbs: dict
+        :param n_epochs: Number of passes over the update samples.
+        :type n_epochs: int
+        :param replay: Number of known verbs replayed per new verb.
+        :type replay: int
+        :param extend_vocabulary: Add the unseen features of the new verbs
+            to the vocabulary. If False the vocabulary is frozen.
+        :type extend_vocabulary: bool
+        :return: Update summary: number of verbs, templates and features
+            added, replayed verbs and update time in seconds.
+        :rtype: dict
+
+        .. note::
+            New templates must also exist in the conjugation tables of the
+            language for the Conjugator to use them.
+        """
+        verbs = {
+            verb: info if isinstance(info, dict) else {"template": info}
+            for verb, info in verbs.items()
+        }
+        known = self.dataset
+        dataset = mlconjug3.DataSet({**known.verbs_dict, **verbs})
+
+        start = time()
+
+        # Relabeling drops the template constraint; it is set again below
+        # with the new template list.
+        constrained = self.model._ending_index is not None
+        classes = getattr(self.model.pipeline.steps[-1][1], "classes_", None)
+        n_classes = 0 if classes is None else len(classes)
+        mapping = np.array(
+            [dataset.template_ids[template] for template in known.templates],
+            dtype=np.intp,
+        )
+        if classes is not None and not np.array_equal(mapping, np.arange(len(mapping))):
+            self.model.relabel(mapping)
+
+        samples = list(verbs)
+        labels = np.array(
+            [dataset.template_ids[verbs[verb]["template"]] for verb in samples],
+            dtype=np.intp,
+        )
+
+        old = np.flatnonzero(~np.isin(known.verbs_list, samples))
+        replayed = np.random.RandomState(42).choice(
+            old, min(len(old), replay * len(samples)), replace=False
+        )
+        n_features = len(getattr(self.model.pipeline.steps[0][1], "vocabulary_", ()))
+
+        self.model.partial_fit(
+            samples + [known.verbs_list[i] for i in replayed],
+            np.concatenate([labels, mapping[known.templates_list[replayed]]]),
+            extend_vocabulary=extend_vocabulary,
+            n_epochs=n_epochs,
+        )
+        if constrained:
+            self.model.constrain_to_templates(dataset.templates)
+        update_time = time() - start
+
+        self.dataset = dataset
+        self.dataset.split_data(proportion=self.split_proportion)
+        self.updated_verbs = samples
+        self.conjugator.set_model(self.model)
+
+        classifier = self.model.pipeline.steps[-1][1]
+        vocabulary = getattr(self.model.pipeline.steps[0][1], "vocabulary_", ())
+
+        return {
+            "n_verbs": len(samples),
+            "n_replayed": len(replayed),
+            "n_new_templates": len(classifier.classes_) - n_classes,
+            "n_new_features": len(vocabulary) - n_features,
+            "update_time": update_time,
+        }
+
+    def compare_with_retrain(self):
+        """
+        Compare the current model with a model retrained from scratch.
+
+        A fresh model with the same (unfitted) vectorizer and classifier
+        settings is trained on all the verbs of the dataset. Both models are
+        scored on all the verbs and on the verbs added by the last
+        :meth:`update`.
+
+        :return: For ``"current"`` and ``"retrained"``: accuracy on the
+            dataset, accuracy on the updated verbs (None without update) and,
+            for the retrained model, its training time in seconds.
+        :rtype: dict
+        """
+        vectorizer, classifier = (step for _, step in self.model.pipeline.steps)
+        baseline = mlconjug3.Model(
+            vectorizer=clone(vectorizer),
+            classifier=clone(classifier),
+            language=self.model.language,
+        )
+
+        start = time()
+        baseline.train(self.dataset.verbs_list, self.dataset.templates_list)
+        train_time = time() - start
+
+        labels = self.dataset.templates_list
+        updated = self.updated_verbs
+        updated_labels = np.array(
+            [self.dataset.template_ids[self.dataset.verbs_dict[verb]["template"]]
+             for verb in updated],
+            dtype=np.intp,
+        )
+
+        def score(model):
+            result = {
+                "accuracy": float(np.mean(model.predict(self.dataset.verbs_list) == labels)),
+                "updated_accuracy": None,
+            }
+            if updated:
+                result["updated_accuracy"] = float(
+                    np.mean(model.predict(updated) == updated_labels)
+                )
+            return result
+
+        report = {"current": score(self.model), "retrained": score(baseline)}
+        report["retrained"]["train_time"] = train_time
+
+        return report
+
+    def prune(self, threshold=0.0):
+        """
+        Prune the features with negligible weight from the trained model.
+
+        The model is scored on all the verbs of the dataset before and after
+        pruning (see ``Model.prune``).
+
+        :param threshold: Features whose largest absolute weight over all
+            classes is at most this value are removed.
+        :type threshold: float
+        :return: Number of features, pickled size in bytes and accuracy
+            before and after pruning, with the accuracy delta and the
+            relative size reduction.
+        :rtype: dict
+        """
+        labels = self.dataset.templates_list
+
+        def measure():
+            predictions = self.model.predict(self.dataset.verbs_list)
+            return {
+                "n_features": self.model.pipeline.steps[-1][1].coef_.shape[1],
+                "size_bytes": len(pickle.dumps(self.model, pickle.HIGHEST_PROTOCOL)),
+                "accuracy": float(np.mean(predictions == labels)),
+            }
+
+        before = measure()
+        self.model.prune(threshold)
+        self.conjugator.set_model(self.model)
+        after = measure()
+
+        return {
+            "threshold": threshold,
+            "before": before,
+            "after": after,
+            "accuracy_delta": after["accuracy"] - before["accuracy"],
+            "size_reduction": 1 - after["size_bytes"] / before["size_bytes"],
+        }
+
     def save(self):
         """
         Save trained model to disk using pickle serialization.
@@ -135,3 +827,35 @@ class ConjugatorTrainer:
             f"{self.output_folder}/trained_model-{self.lang}.pickle", "wb"
         ) as file:
             pickle.dump(self.model, file)
+
+    def package(self):
+        """
+        Package the trained model like the bundled pre-trained models.
+
+        Output format:
+        trained_model-{lang}-final.zip containing trained_model-{lang}-final.pickle
+
+        The archive is written to a temporary file first and moved into
+        place, so an interrupted run never leaves a truncated archive.
+
+        :return: Path of the archive.
+        :rtype: str
+        """
+        os.makedirs(self.output_folder, exist_ok=True)
+        name = f"trained_model-{self.lang}-final"
+        zip_path = os.path.join(self.output_folder, f"{name}.zip")
+        buffer = io.BytesIO()
+        joblib.dump(self.model, buffer)
+
+        handle, tmp_path = tempfile.mkstemp(dir=self.output_folder, suffix=".zip")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                with ZipFile(file, "w", compression=ZIP_DEFLATED) as archive:
+                    archive.writestr(f"{name}.pickle", buffer.getvalue())
+            os.replace(tmp_path, zip_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return zip_path
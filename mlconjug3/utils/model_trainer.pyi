@@ -1,6 +1,7 @@
 import multiprocessing
 import mlconjug3
 from mlconjug3.dataset import DataSet
+from mlconjug3.utils.feature_cache import FeatureCache
 import pickle
 import numpy as np
 from functools import partial
@@ -19,17 +20,79 @@ from typing import (
     Any,
 )
 
+def _share_matrix(matrix: Any, folder: str) -> Any: ...
+def _fit_fold(
+    classifier: Any,
+    features: Any,
+    labels: np.ndarray,
+    train_indices: np.ndarray,
+    test_indices: np.ndarray,
+) -> Dict[str, Any]: ...
+
+def _classification_metrics(
+    y_true: Sequence[Any], y_pred: Sequence[Any]
+) -> Dict[str, Any]: ...
+def _flatten_forms(
+    conjug_info: Mapping[str, Any]
+) -> Dict[Tuple[str, str, Optional[str]], Optional[str]]: ...
+
 class ConjugatorTrainer:
+    lang: str
+    output_folder: str
+    split_proportion: float
+    dataset: DataSet
+    model: mlconjug3.models.Model
+    conjugator: mlconjug3.Conjugator
+    updated_verbs: Sequence[str]
     def __init__(
         self,
         lang: str,
         output_folder: str,
         split_proportion: float,
-        feature_extractor: Optional[Any],
-        DataSet: mlconjug3.dataset.DataSet,
-        Model: mlconjug3.models.Model,
+        dataset: DataSet,
+        model: mlconjug3.models.Model,
+        feature_cache: Optional[Union[FeatureCache, str]] = ...,
+        n_jobs: Optional[int] = ...,
     ) -> None: ...
-    def train(self) -> None: ...
+    def train(self, holdout: bool = ...) -> None: ...
+    def _pretrained_model(self) -> mlconjug3.models.Model: ...
+    def train_with_budget(
+        self,
+        max_epochs: int = ...,
+        time_budget: Optional[float] = ...,
+        warm_start: Union[bool, mlconjug3.models.Model] = ...,
+        patience: int = ...,
+        tol: float = ...,
+    ) -> Tuple[mlconjug3.models.Model, Dict[str, Any]]: ...
     def predict(self) -> Sequence[Text]: ...
+    def _predict_batches(self, verbs: Sequence[str], batch_size: int) -> np.ndarray: ...
+    def _template_name(self, label: Any) -> Any: ...
+    def _form_accuracy(
+        self, verbs: Sequence[str], y_true: np.ndarray, y_pred: np.ndarray
+    ) -> Dict[str, Any]: ...
+    def evaluation_report(
+        self,
+        verbs: Optional[Sequence[str]] = ...,
+        labels: Optional[Sequence[int]] = ...,
+        batch_size: int = ...,
+        forms: bool = ...,
+    ) -> Dict[str, Any]: ...
     def evaluate(self) -> None: ...
+    def cross_validate(
+        self,
+        n_splits: int = ...,
+        n_repeats: int = ...,
+        n_jobs: Optional[int] = ...,
+        threshold: Optional[int] = ...,
+    ) -> Dict[str, Any]: ...
+    def update(
+        self,
+        verbs: Mapping[str, Any],
+        n_epochs: int = ...,
+        replay: int = ...,
+        extend_vocabulary: bool = ...,
+    ) -> Dict[str, Any]: ...
+    def compare_with_retrain(self) -> Dict[str, Dict[str, Any]]: ...
+    def prune(self, threshold: float = ...) -> Dict[str, Any]: ...
     def save(self) -> None: ...
+    def package(self) -> str: ...
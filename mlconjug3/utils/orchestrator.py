@@ -0,0 +1,298 @@
+"""
+Multi-language training orchestration for mlconjug3.
+
+This module trains, evaluates and packages the models of several languages
+in parallel on top of :class:`ConjugatorTrainer`.
+
+It provides:
+- Resource-aware scheduling (CPU count and available memory)
+- Largest-language-first ordering to shorten the overall run
+- Per-language timing and peak memory reports
+- Resumable runs: languages already packaged in the output folder are skipped
+
+Packaged models use the same layout as ``PRE_TRAINED_MODEL_PATH``
+(``trained_model-{lang}-final.zip`` containing
+``trained_model-{lang}-final.pickle``), so they can replace the bundled
+models directly.
+"""
+
+import os
+import sys
+import json
+import multiprocessing
+from time import time
+from importlib import resources
+
+import numpy as np
+
+from mlconjug3.constants import *
+from mlconjug3.dataset import DataSet
+from mlconjug3.models import Model
+from mlconjug3.PyVerbiste import Verbiste
+from .model_trainer import ConjugatorTrainer
+from .logger import logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+#: Name of the JSON report written in the output folder.
+REPORT_FILE = "training_report.json"
+
+#: Default memory budget assumed for one training job, in bytes.
+DEFAULT_MEMORY_PER_JOB = 1024 ** 3
+
+
+def _peak_rss_mb():
+    """
+    Return the peak resident set size of the current process in MiB.
+
+    :return: Peak RSS, or None when the platform does not report it.
+    :rtype: float | None
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    if sys.platform == "darwin":
+        return peak / 1024 ** 2
+    return peak / 1024
+
+
+def _available_memory():
+    """
+    Return the physical memory currently available, in bytes.
+
+    :return: Available memory, or None if it cannot be determined.
+    :rtype: int | None
+    """
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _language_cost(lang):
+    """
+    Estimate the relative training cost of a language.
+
+    The size of the bundled verbs resource is used as a proxy for the
+    number of verbs, which drives both dataset size and template count.
+    """
+    path = VERBS_RESOURCE_PATH[lang].replace("json", "xml")
+    try:
+        with resources.files(RESOURCE_PACKAGE).joinpath(path).open("rb") as file:
+            return file.seek(0, os.SEEK_END)
+    except (FileNotFoundError, OSError):
+        return 0
+
+
+def plan_jobs(n_tasks, n_jobs=None, memory_per_job=DEFAULT_MEMORY_PER_JOB):
+    """
+    Choose the number of parallel training jobs.
+
+    :param n_tasks: Number of languages to train.
+    :type n_tasks: int
+    :param n_jobs: Requested number of jobs. None picks one automatically.
+    :type n_jobs: int | None
+    :param memory_per_job: Memory assumed for one job, in bytes.
+    :type memory_per_job: int | None
+    :return: Number of jobs, bounded by the tasks, the CPUs and the
+        available memory.
+    :rtype: int
+    """
+    if n_jobs is not None and n_jobs > 0:
+        return max(1, min(n_jobs, n_tasks))
+
+    jobs = min(n_tasks, os.cpu_count() or 1)
+
+    available = _available_memory()
+    if memory_per_job and available:
+        jobs = min(jobs, available // memory_per_job)
+
+    return max(1, jobs)
+
+
+def _train_language(lang, output_folder, split_proportion, feature_cache, n_features=None):
+    """
+    Build the dataset, evaluate a holdout model, then train on every verb and
+    package the model of one language.
+
+    Runs in a dedicated worker process so its peak memory can be reported.
+    With ``n_features``, the model hashes its features (see :class:`Model`).
+
+    :return: Per-language report.
+    :rtype: dict
+    """
+    report = {"language": lang, "status": "trained", "times": {}}
+    times = report["times"]
+    total = time()
+
+    try:
+        start = time()
+        dataset = DataSet(Verbiste(language=lang).verbs)
+        times["dataset"] = time() - start
+
+        trainer = ConjugatorTrainer(
+            lang,
+            output_folder,
+            split_proportion,
+            dataset,
+            Model(language=lang, n_features=n_features),
+            feature_cache=feature_cache,
+        )
+
+        start = time()
+        trainer.train(holdout=True)
+        times["train"] = time() - start
+
+        start = time()
+        labels = np.asarray(dataset.test_labels)
+        if len(labels):
+            predictions = trainer.model.predict(dataset.test_input)
+            report["accuracy"] = float(np.mean(predictions == labels))
+        else:
+            report["accuracy"] = None
+        times["evaluate"] = time() - start
+
+        # The holdout model only measures accuracy; the packaged model is
+        # refitted on every verb so it can replace the bundled one.
+        start = time()
+        trainer.train(holdout=False)
+        times["refit"] = time() - start
+
+        start = time()
+        report["path"] = trainer.package()
+        times["package"] = time() - start
+
+        report["n_train"] = len(dataset.train_indices)
+        report["n_test"] = len(dataset.test_indices)
+        report["n_templates"] = len(dataset.templates)
+
+    except Exception as error:
+        report["status"] = "failed"
+        report["error"] = repr(error)
+
+    times["total"] = time() - total
+    report["peak_rss_mb"] = _peak_rss_mb()
+
+    return report
+
+
+def _train_language_star(args):
+    return _train_language(*args)
+
+
+def _load_report(output_folder):
+    path = os.path.join(output_folder, REPORT_FILE)
+    if not os.path.isfile(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _write_report(output_folder, reports):
+    path = os.path.join(output_folder, REPORT_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(reports, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def train_languages(
+    languages=None,
+    output_folder="trained_models",
+    split_proportion=0.8,
+    n_jobs=None,
+    resume=True,
+    feature_cache=None,
+    memory_per_job=DEFAULT_MEMORY_PER_JOB,
+    n_features=None,
+):
+    """
+    Train, evaluate and package the models of several languages in parallel.
+
+    Each language is trained in its own worker process (one process per
+    language, so peak memory figures are not mixed up), largest languages
+    first. The JSON report in the output folder is updated as soon as a
+    language finishes, so an interrupted run can be resumed.
+
+    :param languages: Languages to train. Defaults to all supported languages.
+    :type languages: sequence of str | None
+    :param output_folder: Folder receiving the model archives and report.
+    :type output_folder: str
+    :param split_proportion: Fraction of each template used for training;
+        the rest is used for evaluation.
+    :type split_proportion: float
+    :param n_jobs: Number of parallel workers. None chooses from the CPU
+        count and available memory (see :func:`plan_jobs`).
+    :type n_jobs: int | None
+    :param resume: Skip languages whose archive already exists.
+    :type resume: bool
+    :param feature_cache: Feature cache directory shared by the workers.
+    :type feature_cache: str | None
+    :param memory_per_job: Memory assumed for one job, in bytes.
+    :type memory_per_job: int | None
+    :param n_features: Number of hashed features. If set, the models use
+        a HashingVectorizer instead of a vocabulary.
+    :type n_features: int | None
+    :return: Reports keyed by language, with status, accuracy, dataset
+        sizes, per-stage times in seconds and peak RSS in MiB.
+    :rtype: dict
+    :raises ValueError: If a language is not supported.
+    """
+    if languages is None:
+        languages = [lang for lang in LANGUAGES if lang != "default"]
+
+    for lang in languages:
+        if lang not in LANGUAGES or lang == "default":
+            raise ValueError(
+                _(
+                    "Unsupported language.\nThe allowed languages are fr, en, es, it, pt, ro."
+                )
+            )
+
+    if feature_cache is not None:
+        feature_cache = os.fspath(feature_cache)
+
+    os.makedirs(output_folder, exist_ok=True)
+    reports = _load_report(output_folder) if resume else {}
+
+    pending = []
+    for lang in languages:
+        archive = os.path.join(output_folder, f"trained_model-{lang}-final.zip")
+        if resume and os.path.isfile(archive):
+            report = reports.get(lang, {"language": lang})
+            report["status"] = "skipped"
+            reports[lang] = report
+        else:
+            pending.append(lang)
+
+    pending.sort(key=_language_cost, reverse=True)
+    tasks = [
+        (lang, output_folder, split_proportion, feature_cache, n_features)
+        for lang in pending
+    ]
+
+    if tasks:
+        jobs = plan_jobs(len(tasks), n_jobs, memory_per_job)
+        logger.info(f"Training {', '.join(pending)} with {jobs} worker(s).")
+
+        with multiprocessing.Pool(processes=jobs, maxtasksperchild=1) as pool:
+            for report in pool.imap_unordered(_train_language_star, tasks):
+                reports[report["language"]] = report
+                _write_report(output_folder, reports)
+
+                if report["status"] == "failed":
+                    logger.error(f"Training {report['language']} failed: {report['error']}")
+
+    _write_report(output_folder, reports)
+
+    return {lang: reports[lang] for lang in languages}
+
+
+if __name__ == "__main__":
+    pass
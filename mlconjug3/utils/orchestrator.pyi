@@ -0,0 +1,30 @@
+from typing import Any, Dict, Optional, Sequence
+
+REPORT_FILE: str
+DEFAULT_MEMORY_PER_JOB: int
+
+def _peak_rss_mb() -> Optional[float]: ...
+def _available_memory() -> Optional[int]: ...
+def _language_cost(lang: str) -> int: ...
+def plan_jobs(
+    n_tasks: int,
+    n_jobs: Optional[int] = ...,
+    memory_per_job: Optional[int] = ...,
+) -> int: ...
+def _train_language(
+    lang: str,
+    output_folder: str,
+    split_proportion: float,
+    feature_cache: Optional[str],
+    n_features: Optional[int] = ...,
+) -> Dict[str, Any]: ...
+def train_languages(
+    languages: Optional[Sequence[str]] = ...,
+    output_folder: str = ...,
+    split_proportion: float = ...,
+    n_jobs: Optional[int] = ...,
+    resume: bool = ...,
+    feature_cache: Optional[str] = ...,
+    memory_per_job: Optional[int] = ...,
+    n_features: Optional[int] = ...,
+) -> Dict[str, Dict[str, Any]]: ...
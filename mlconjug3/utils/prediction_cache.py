@@ -0,0 +1,246 @@
+"""
+Persistent cache of the templates predicted for unknown verbs.
+
+The model fallback of the Conjugator is its slowest path, and batch jobs
+tend to query the same long tail of unknown verbs on every run. This
+module stores the predicted template and confidence score of each verb in
+a SQLite database, shared by every process and thread using the same file.
+
+Entries are keyed by the language, the verb and a hash of the model and of
+the template list its class labels index, so they are ignored as soon as
+a different model is loaded. The database uses write-ahead logging, so
+readers in other processes are never blocked by a writer. The number of
+entries is capped; the least recently used entries are evicted first.
+
+Example::
+
+    cache = PredictionCache("~/.cache/mlconjug3/predictions.sqlite3")
+    conjugator = Conjugator("fr", prediction_cache=cache)
+"""
+
+import os
+import sqlite3
+import threading
+from time import time
+
+import joblib
+
+from .logger import logger
+
+#: Default maximum number of entries of a :class:`PredictionCache`.
+DEFAULT_MAX_ENTRIES = 100000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS predictions (
+    model TEXT NOT NULL,
+    language TEXT NOT NULL,
+    verb TEXT NOT NULL,
+    template TEXT,
+    confidence REAL,
+    used REAL NOT NULL,
+    PRIMARY KEY (model, language, verb)
+);
+CREATE INDEX IF NOT EXISTS predictions_used ON predictions (used);
+"""
+
+# SQLite limits the number of parameters of a statement.
+_CHUNK_SIZE = 500
+
+
+class PredictionCache:
+    """
+    SQLite cache of ``verb -> (template, confidence score)`` predictions.
+
+    Each thread and process opens its own connection, so an instance can
+    be shared by threads and inherited by forked or spawned workers. A
+    cache failure (e.g. a corrupted or read-only file) is logged and
+    treated as a miss; it never fails a conjugation.
+
+    :param path: Database file. Its folder is created if missing.
+    :type path: str
+    :param max_entries: Maximum number of entries. When it is exceeded, the
+        least recently used tenth of the entries is evicted.
+    :type max_entries: int
+    :param timeout: Seconds to wait for a write lock held by another
+        connection.
+    :type timeout: float
+    :param touch_interval: Minimum number of seconds between two updates
+        of the last use time of an entry. Reads only write to the database
+        when an entry has not been used for that long.
+    :type touch_interval: float
+
+    :ivar hits: Number of predictions read from the cache by this process.
+    :vartype hits: int
+    :ivar misses: Number of predictions missing from the cache.
+    :vartype misses: int
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES, timeout=30.0, touch_interval=3600.0):
+        if max_entries < 1:
+            raise ValueError("The prediction cache must hold at least one entry.")
+
+        self.path = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def __repr__(self):
+        return (
+            f"{__name__}.{self.__class__.__name__}"
+            f"(path={self.path!r}, max_entries={self.max_entries})"
+        )
+
+    def __getstate__(self):
+        # Connections cannot be pickled; workers open their own.
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    @staticmethod
+    def model_hash(model, templates=None):
+        """
+        Compute the hash identifying the predictions of a model.
+
+        :param model: The model, hashed with ``joblib.hash``.
+        :param templates: Template names indexed by the integer class labels
+            of the model (e.g. ``ConjugManager.templates``).
+        :type templates: sequence of str | None
+        :return: Hexadecimal digest.
+        :rtype: str
+        """
+        return joblib.hash((model, list(templates or ())))
+
+    def _connection(self):
+        """
+        Return the connection of the current thread, opening it if needed.
+        """
+        local = self._local
+        # A connection inherited through fork must not be used by the child.
+        if getattr(local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            local.connection = connection
+            local.pid = os.getpid()
+        return local.connection
+
+    def get_many(self, model_hash, language, verbs):
+        """
+        Look up the predictions of several verbs.
+
+        :param model_hash: Hash of the model from :meth:`model_hash`.
+        :type model_hash: str
+        :param language: Language of the model.
+        :type language: str
+        :param verbs: Verbs to look up.
+        :type verbs: sequence of str
+        :return: ``(template, confidence score)`` of each cached verb.
+        :rtype: dict
+        """
+        verbs = list(dict.fromkeys(verbs))
+        found = {}
+        stale = []
+
+        try:
+            connection = self._connection()
+            now = time()
+
+            for start in range(0, len(verbs), _CHUNK_SIZE):
+                chunk = verbs[start:start + _CHUNK_SIZE]
+                rows = connection.execute(
+                    "SELECT verb, template, confidence, used FROM predictions "
+                    "WHERE model = ? AND language = ? "
+                    f"AND verb IN ({', '.join('?' * len(chunk))})",
+                    [model_hash, language, *chunk],
+                )
+                for verb, template, confidence, used in rows:
+                    found[verb] = (template, confidence)
+                    if now - used >= self.touch_interval:
+                        stale.append(verb)
+
+            if stale:
+                with connection:
+                    connection.executemany(
+                        "UPDATE predictions SET used = ? "
+                        "WHERE model = ? AND language = ? AND verb = ?",
+                        [(now, model_hash, language, verb) for verb in stale],
+                    )
+
+        except sqlite3.Error as error:
+            logger.warning(f"Prediction cache {self.path!r} unavailable: {error}")
+
+        self.hits += len(found)
+        self.misses += len(verbs) - len(found)
+        return found
+
+    def put_many(self, model_hash, language, predictions):
+        """
+        Store predictions, evicting the least recently used entries if the
+        cache is full.
+
+        :param model_hash: Hash of the model from :meth:`model_hash`.
+        :type model_hash: str
+        :param language: Language of the model.
+        :type language: str
+        :param predictions: ``(verb, template, confidence score)`` triples.
+        :type predictions: iterable of tuple
+        """
+        now = time()
+        rows = [
+            (model_hash, language, verb, template, confidence, now)
+            for verb, template, confidence in predictions
+        ]
+        if not rows:
+            return
+
+        try:
+            connection = self._connection()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO predictions "
+                    "(model, language, verb, template, confidence, used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                (count,) = connection.execute("SELECT COUNT(*) FROM predictions").fetchone()
+                if count > self.max_entries:
+                    # Evict a tenth of the entries at once rather than a few
+                    # entries on every insertion.
+                    connection.execute(
+                        "DELETE FROM predictions WHERE rowid IN "
+                        "(SELECT rowid FROM predictions ORDER BY used, rowid LIMIT ?)",
+                        (count - self.max_entries + self.max_entries // 10,),
+                    )
+
+        except sqlite3.Error as error:
+            logger.warning(f"Prediction cache {self.path!r} unavailable: {error}")
+
+    def __len__(self):
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM predictions").fetchone()
+        return count
+
+    def clear(self):
+        """
+        Remove every entry.
+        """
+        with self._connection() as connection:
+            connection.execute("DELETE FROM predictions")
+
+    def close(self):
+        """
+        Close the connection of the current thread.
+        """
+        local = self._local
+        if getattr(local, "pid", None) == os.getpid():
+            local.connection.close()
+        local.__dict__.clear()
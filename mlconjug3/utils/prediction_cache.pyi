@@ -0,0 +1,40 @@
+import sqlite3
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+DEFAULT_MAX_ENTRIES: int
+_SCHEMA: str
+_CHUNK_SIZE: int
+
+class PredictionCache:
+    path: str
+    max_entries: int
+    timeout: float
+    touch_interval: float
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = ...,
+        timeout: float = ...,
+        touch_interval: float = ...,
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    def __getstate__(self) -> dict: ...
+    def __setstate__(self, state: dict) -> None: ...
+    @staticmethod
+    def model_hash(model: Any, templates: Optional[Sequence[str]] = ...) -> str: ...
+    def _connection(self) -> sqlite3.Connection: ...
+    def get_many(
+        self, model_hash: str, language: str, verbs: Sequence[str]
+    ) -> Dict[str, Tuple[Optional[str], Optional[float]]]: ...
+    def put_many(
+        self,
+        model_hash: str,
+        language: str,
+        predictions: Iterable[Tuple[str, Optional[str], Optional[float]]],
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def clear(self) -> None: ...
+    def close(self) -> None: ...
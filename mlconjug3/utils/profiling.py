@@ -0,0 +1,306 @@
+"""
+Slow-call log and profilers for Conjugator calls.
+
+This module helps investigating intermittent latency spikes of
+``Conjugator.conjugate``. It provides:
+- A slow-call log recording the verb, language, path, per-stage timings
+  and calling stack of every call slower than a threshold, through the
+  mlconjug3 logger
+- A profiler capturing windows of calls, either with cProfile or with a
+  statistical sampler, and writing each window to disk for offline
+  analysis
+
+Both are callbacks of :class:`~mlconjug3.utils.instrumentation.Instrumentation`
+and are enabled on a Conjugator with their ``attach`` method::
+
+    SlowCallLog(threshold=0.05).attach(conjugator)
+    CallProfiler("profiles", window=1000).attach(conjugator)
+
+cProfile windows are written as ``.prof`` files readable by
+:mod:`pstats` or snakeviz. Sampling windows are written as ``.folded``
+files in the collapsed-stack format read by flamegraph.pl and speedscope.
+"""
+
+import os
+import sys
+import cProfile
+import threading
+import traceback
+from collections import Counter, deque
+from time import strftime
+
+from .instrumentation import Instrumentation
+from .logger import logger as default_logger
+
+#: Profiling modes supported by :class:`CallProfiler`.
+PROFILER_MODES = ("cprofile", "sampling")
+
+
+def _instrumentation(conjugator):
+    """
+    Return the instrumentation of a Conjugator, enabling it if needed.
+    """
+    if conjugator.instrumentation is None:
+        conjugator.instrumentation = Instrumentation()
+    return conjugator.instrumentation
+
+
+class SlowCallLog:
+    """
+    Log the Conjugator calls slower than a threshold.
+
+    Parameters
+    ----------
+    threshold : float, default=0.1
+        Duration above which a call is logged, in seconds.
+    max_entries : int, default=100
+        Number of recent slow calls kept in :attr:`entries`.
+    stack_limit : int or None, default=20
+        Number of innermost frames of the calling stack recorded. None
+        records the whole stack, 0 disables stack capture.
+    logger : logging.Logger, optional
+        Logger receiving a warning per slow call. Defaults to the mlconjug3
+        logger.
+
+    Attributes
+    ----------
+    entries : collections.deque of dict
+        Recent slow calls, with their verb, language, path, cache hit,
+        duration, stage durations and stack.
+    count : int
+        Number of slow calls seen.
+    """
+
+    def __init__(self, threshold=0.1, max_entries=100, stack_limit=20, logger=None):
+        self.threshold = threshold
+        self.stack_limit = stack_limit
+        self.logger = logger if logger is not None else default_logger
+        self.entries = deque(maxlen=max_entries)
+        self.count = 0
+
+    def attach(self, conjugator):
+        """
+        Log the slow calls of a Conjugator, enabling its instrumentation.
+
+        :return: The instrumentation of the conjugator.
+        :rtype: Instrumentation
+        """
+        instrumentation = _instrumentation(conjugator)
+        instrumentation.add_callback(on_end=self)
+        return instrumentation
+
+    def _stack(self):
+        if self.stack_limit == 0:
+            return []
+        # Drop the frames of this method, of the callback and of Instrumentation.stop.
+        stack = traceback.format_stack()[:-3]
+        if self.stack_limit is not None:
+            stack = stack[-self.stack_limit:]
+        return stack
+
+    def __call__(self, timer):
+        if timer.duration < self.threshold:
+            return
+
+        entry = {
+            "verb": timer.verb,
+            "language": timer.language,
+            "path": timer.path,
+            "cache_hit": timer.cache_hit,
+            "duration": timer.duration,
+            "stages": dict(timer.stages),
+            "stack": self._stack(),
+        }
+        self.entries.append(entry)
+        self.count += 1
+
+        stages = ", ".join(
+            f"{stage}={duration * 1000:.2f}ms" for stage, duration in entry["stages"].items()
+        )
+        self.logger.warning(
+            f"Slow conjugation of {timer.verb!r} ({timer.language}, {timer.path}): "
+            f"{timer.duration * 1000:.2f}ms [{stages}]\n" + "".join(entry["stack"])
+        )
+
+
+class CallProfiler:
+    """
+    Profile windows of Conjugator calls and write them to disk.
+
+    A window covers ``window`` consecutive calls. Only the time spent inside
+    the calls is profiled. Calls made by other threads while a thread is
+    profiled with cProfile are not profiled; the sampler samples every
+    thread inside a call.
+
+    Parameters
+    ----------
+    output_dir : str
+        Directory receiving one file per window, created if needed.
+    window : int, default=100
+        Number of calls per window.
+    mode : str, default="cprofile"
+        "cprofile" for deterministic profiles (``.prof`` files), or
+        "sampling" for statistical profiles (``.folded`` files) with a
+        lower overhead.
+    interval : float, default=0.001
+        Sampling interval, in seconds, in "sampling" mode.
+    max_windows : int or None, default=None
+        Stop profiling after this many windows.
+
+    Attributes
+    ----------
+    files : list of str
+        Paths of the written profiles.
+    """
+
+    def __init__(self, output_dir, window=100, mode="cprofile", interval=0.001, max_windows=None):
+        if mode not in PROFILER_MODES:
+            raise ValueError(
+                f"Unsupported profiler mode {mode!r}, expected one of {', '.join(PROFILER_MODES)}."
+            )
+        if window < 1:
+            raise ValueError("The profiling window must contain at least one call.")
+
+        self.output_dir = os.fspath(output_dir)
+        self.window = window
+        self.mode = mode
+        self.interval = interval
+        self.max_windows = max_windows
+        self.files = []
+
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._profile = None
+        self._profiled_thread = None
+        self._threads = set()
+        self._samples = Counter()
+        self._sampler = None
+        self._stop_sampling = threading.Event()
+
+    @property
+    def active(self):
+        """
+        Whether windows are still being profiled.
+        """
+        return self.max_windows is None or len(self.files) < self.max_windows
+
+    def attach(self, conjugator):
+        """
+        Profile the calls of a Conjugator, enabling its instrumentation.
+
+        :return: The instrumentation of the conjugator.
+        :rtype: Instrumentation
+        """
+        instrumentation = _instrumentation(conjugator)
+        instrumentation.add_callback(on_start=self.on_start, on_end=self.on_end)
+        return instrumentation
+
+    def on_start(self, timer):
+        if not self.active:
+            return
+
+        thread = threading.get_ident()
+
+        with self._lock:
+            if self.mode == "sampling":
+                self._threads.add(thread)
+                if self._sampler is None:
+                    self._start_sampler()
+                return
+
+            if self._profiled_thread is not None:
+                return
+            if self._profile is None:
+                self._profile = cProfile.Profile()
+            self._profiled_thread = thread
+
+        self._profile.enable()
+
+    def on_end(self, timer):
+        thread = threading.get_ident()
+
+        with self._lock:
+            if self.mode == "sampling":
+                if thread not in self._threads:
+                    return
+                self._threads.discard(thread)
+            else:
+                if self._profiled_thread != thread:
+                    return
+                self._profile.disable()
+                self._profiled_thread = None
+
+            self._calls += 1
+            if self._calls >= self.window:
+                self._dump()
+
+    def flush(self):
+        """
+        Write the current window to disk, even if it is not complete.
+
+        :return: Path of the written profile, or None if the window is empty.
+        :rtype: str | None
+        """
+        with self._lock:
+            if not self._calls:
+                return None
+            return self._dump()
+
+    def _path(self, extension):
+        os.makedirs(self.output_dir, exist_ok=True)
+        name = f"conjugate-{strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{len(self.files):04d}"
+        return os.path.join(self.output_dir, f"{name}.{extension}")
+
+    def _dump(self):
+        """
+        Write the current window and start a new one. Called under the lock.
+        """
+        if self.mode == "sampling":
+            self._stop_sampler()
+            path = self._path("folded")
+            with open(path, "w", encoding="utf-8") as file:
+                for stack, count in self._samples.most_common():
+                    file.write(f"{stack} {count}\n")
+            self._samples = Counter()
+            if self._threads and self.active:
+                self._start_sampler()
+        else:
+            path = self._path("prof")
+            self._profile.dump_stats(path)
+            self._profile = None
+
+        self._calls = 0
+        self.files.append(path)
+        return path
+
+    def _start_sampler(self):
+        self._stop_sampling = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._sample, args=(self._stop_sampling,), daemon=True
+        )
+        self._sampler.start()
+
+    def _stop_sampler(self):
+        self._stop_sampling.set()
+        self._sampler = None
+
+    def _sample(self, stop):
+        own = threading.get_ident()
+
+        while not stop.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                if stop.is_set():
+                    return
+                for thread in self._threads:
+                    frame = frames.get(thread)
+                    if frame is None or thread == own:
+                        continue
+                    stack = []
+                    while frame is not None:
+                        code = frame.f_code
+                        stack.append(
+                            f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                        )
+                        frame = frame.f_back
+                    self._samples[";".join(reversed(stack))] += 1
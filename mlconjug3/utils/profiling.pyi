@@ -0,0 +1,53 @@
+import logging
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from .instrumentation import CallTimer, Instrumentation
+
+PROFILER_MODES: Tuple[str, ...]
+
+def _instrumentation(conjugator: Any) -> Instrumentation: ...
+
+class SlowCallLog:
+    threshold: float
+    stack_limit: Optional[int]
+    logger: logging.Logger
+    entries: deque
+    count: int
+    def __init__(
+        self,
+        threshold: float = ...,
+        max_entries: int = ...,
+        stack_limit: Optional[int] = ...,
+        logger: Optional[logging.Logger] = ...,
+    ) -> None: ...
+    def attach(self, conjugator: Any) -> Instrumentation: ...
+    def _stack(self) -> List[str]: ...
+    def __call__(self, timer: CallTimer) -> None: ...
+
+class CallProfiler:
+    output_dir: str
+    window: int
+    mode: str
+    interval: float
+    max_windows: Optional[int]
+    files: List[str]
+    def __init__(
+        self,
+        output_dir: str,
+        window: int = ...,
+        mode: str = ...,
+        interval: float = ...,
+        max_windows: Optional[int] = ...,
+    ) -> None: ...
+    @property
+    def active(self) -> bool: ...
+    def attach(self, conjugator: Any) -> Instrumentation: ...
+    def on_start(self, timer: CallTimer) -> None: ...
+    def on_end(self, timer: CallTimer) -> None: ...
+    def flush(self) -> Optional[str]: ...
+    def _path(self, extension: str) -> str: ...
+    def _dump(self) -> str: ...
+    def _start_sampler(self) -> None: ...
+    def _stop_sampler(self) -> None: ...
+    def _sample(self, stop: Any) -> None: ...
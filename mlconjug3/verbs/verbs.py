@@ -126,6 +126,9 @@ class Verb(metaclass=VerbMeta):
     :vartype predicted: bool
     :ivar confidence_score: Model confidence score if available.
     :vartype confidence_score: float | None
+    :ivar source: Conjugation path that produced the verb
+        ('dictionary', 'suffix' or 'model'), if known.
+    :vartype source: str | None
     """
 
     __slots__ = (
@@ -136,6 +139,7 @@ class Verb(metaclass=VerbMeta):
         "subject",
         "predicted",
         "confidence_score",
+        "source",
     )
 
     language = "default"
@@ -148,6 +152,7 @@ class Verb(metaclass=VerbMeta):
         self.subject = subject
         self.predicted = predicted
         self.confidence_score = None
+        self.source = None
 
         if subject == "pronoun":
             self._load_conjug(subject)
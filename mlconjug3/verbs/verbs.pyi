@@ -44,6 +44,7 @@ class Verb:
     subject: str = ...
     predicted: bool = ...
     confidence_score: Optional[float] = ...
+    source: Optional[str] = ...
     def __init__(
         self,
         verb_info: VerbInfo,
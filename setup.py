@@ -67,7 +67,10 @@ setup(
     packages=find_packages(include=['mlconjug3']),
     entry_points={
         'console_scripts': [
-            'mlconjug3=mlconjug3.cli:main'
+            'mlconjug3=mlconjug3.cli:main',
+            'mlconjug3-train=mlconjug3.cli:train',
+            'mlconjug3-serve=mlconjug3.cli:serve',
+            'mlconjug3-coprocess=mlconjug3.cli:coprocess',
         ]
     },
     package_data={'conjug_manager': ['mlconjug3/data/conjug_manager/*'],
@@ -4,9 +4,22 @@
 import pytest
 import warnings
 import numpy as np
+import scipy.sparse
 import os
 import tempfile
 import pickle
+import pstats
+import io
+import json
+import urllib.request
+import http.client
+import socket
+import subprocess
+import sys
+import threading
+import time
+import joblib
+from zipfile import ZipFile
 
 from sklearn.exceptions import ConvergenceWarning
 from click.testing import CliRunner
@@ -17,11 +30,32 @@ from mlconjug3 import (
     ConjugManager, cli
 )
 
-from mlconjug3.utils import ConjugatorTrainer
-from mlconjug3.utils.error_analysis import analyze_errors
+from mlconjug3.utils import (
+    ConjugatorTrainer,
+    FeatureCache,
+    Instrumentation,
+    instrument,
+    ConjugatorMetrics,
+    SlowCallLog,
+    CallProfiler,
+    PredictionCache,
+)
+from mlconjug3.utils.instrumentation import Histogram
+from mlconjug3.utils.orchestrator import plan_jobs, train_languages, _train_language
+from mlconjug3.utils.error_analysis import (
+    analyze_errors,
+    confusion_matrix,
+    error_report,
+    export_error_report,
+)
 from mlconjug3.feature_extractor.feature_extractor import extract_verb_features
 
 from mlconjug3.verbs import VerbInfo
+from mlconjug3.models import HierarchicalClassifier
+from mlconjug3.server import ConjugationService, ConjugationServer, MAX_FAILED_STARTS
+from mlconjug3.coprocess import Coprocess
+from mlconjug3.lexicon import Lexicon, VerbTrie, FuzzyIndex, edit_distance
+from benchmarks.common import compare
 from collections import OrderedDict
 
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -41,6 +75,29 @@ class TestCLI:
         result = runner.invoke(cli.main, ['aller'])
         assert result.exit_code == 0
 
+    def test_cli_with_options(self):
+        runner = CliRunner()
+        result = runner.invoke(cli.main, ['-l', 'en', 'have'])
+        assert result.exit_code == 0
+        assert "Have" in result.output
+
+    def test_cli_conjugates_command_names(self):
+        runner = CliRunner()
+        for name in ('train', 'serve', 'coprocess'):
+            result = runner.invoke(cli.main, [name, '-l', 'fr'])
+            assert result.exit_code == 0
+            assert f"Conjugation table for '{name.capitalize()}'" in result.output
+
+    def test_cli_help_lists_conjugation_options(self):
+        result = CliRunner().invoke(cli.main, ['-h'])
+        assert result.exit_code == 0
+        assert "--subject" in result.output and "--file_format" in result.output
+
+    def test_cli_train_rejects_unknown_language(self, tmp_path):
+        runner = CliRunner()
+        result = runner.invoke(cli.train, ['-l', 'xx', '-o', str(tmp_path)])
+        assert result.exit_code == 2
+
 
 class TestErrorAnalysis:
     def test_full_analysis(self, capsys):
@@ -53,6 +110,34 @@ class TestErrorAnalysis:
         out = capsys.readouterr().out
         assert "Accuracy" in out
 
+    def test_sparse_confusion_matrix(self):
+        labels, matrix = confusion_matrix(["er", "ir", "ir", "re"], ["er", "er", "ir", "er"])
+        assert list(labels) == ["er", "ir", "re"]
+        assert matrix.nnz == 4
+        assert matrix.toarray().tolist() == [[1, 0, 0], [1, 1, 0], [1, 0, 0]]
+
+    def test_error_report(self):
+        y_true = [0, 1, 1, 1, 2, 2]
+        y_pred = [0, 0, 0, 1, 0, 2]
+        inputs = ["a", "b", "c", "d", "e", "f"]
+        report = error_report(y_true, y_pred, inputs, top_k=1, n_examples=1)
+        assert report["accuracy"] == pytest.approx(0.5)
+        assert report["n_errors"] == 3
+        assert len(report["top_pairs"]) == 1
+        pair = report["top_pairs"][0]
+        assert (pair["true"], pair["predicted"], pair["count"]) == (1, 0, 2)
+        assert len(pair["examples"]) == 1 and pair["examples"][0] in ("b", "c")
+        assert report["per_class"][1]["error_rate"] == pytest.approx(2 / 3)
+        assert report["per_class"][0]["false_positives"] == 3
+
+    def test_export_error_report(self, tmp_path):
+        report = error_report(["er", "ir"], ["er", "er"], ["aimer", "finir"])
+        paths = export_error_report(report, tmp_path / "errors")
+        assert (scipy.sparse.load_npz(paths["confusion.npz"]) != report["confusion"]).nnz == 0
+        with open(paths["summary.json"], encoding="utf-8") as file:
+            summary = json.load(file)
+        assert summary["top_pairs"][0]["examples"] == ["finir"]
+
 
 class TestFeatureExtractor:
     def test_basic(self):
@@ -112,6 +197,35 @@ class TestDataSetCoverage:
         ds = DataSet(self.make_dataset())
         assert "DataSet" in ds.__repr__()
 
+    def test_label_encoding_and_index_split(self):
+        data = {f"verb{i}": {"template": "A:1" if i % 3 else "B:2"} for i in range(30)}
+        ds = DataSet(data)
+
+        assert ds.template_ids == {"A:1": 0, "B:2": 1}
+        assert [ds.templates[label] for label in ds.templates_list] == [
+            data[verb]["template"] for verb in ds.verbs_list
+        ]
+
+        ds.split_data(threshold=2, proportion=0.5)
+        assert len(ds.train_indices) + len(ds.test_indices) == 30
+        assert not set(ds.train_indices) & set(ds.test_indices)
+        assert ds.train_input == [ds.verbs_list[i] for i in ds.train_indices]
+        assert list(ds.test_labels) == [ds.templates_list[i] for i in ds.test_indices]
+        assert sorted(ds.dict_conjug) == ["A:1", "B:2"]
+
+    def test_split_views_are_plain_attributes(self):
+        ds = DataSet(self.make_dataset())
+        ds.split_data(threshold=1, proportion=0.5)
+
+        assert ds.train_input is ds.train_input
+        assert type(ds.train_labels) is list and type(ds.test_labels) is list
+        assert all(type(label) is int for label in ds.train_labels + ds.test_labels)
+        assert ds.dict_conjug["A:1"] == ["aimer"]
+
+        ds.train_input = ["aimer"]
+        ds.train_labels = [0]
+        assert (ds.train_input, ds.train_labels) == (["aimer"], [0])
+
 
 class DummyModel:
     def predict(self, x):
@@ -168,6 +282,143 @@ class TestConjugManagerCoverage:
             cm._load_cache(str(fake_file))
 
 
+class TestLexicon:
+
+    def make_lexicon(self):
+        return Lexicon(["faire", "refaire", "défaire", "recoller", "recommencer", "aller"])
+
+    def test_membership_and_autocomplete(self):
+        lexicon = self.make_lexicon()
+        assert "refaire" in lexicon
+        assert "ref" not in lexicon
+        assert lexicon.complete("reco") == ["recoller", "recommencer"]
+        assert lexicon.complete("reco", limit=1) == ["recoller"]
+        assert lexicon.complete("zz") == []
+
+    def test_suffix_queries(self):
+        lexicon = self.make_lexicon()
+        assert lexicon.longest_known_suffix("redéfaire") == "défaire"
+        assert lexicon.longest_known_suffix("surfaire", min_length=6) is None
+        assert lexicon.has_ending("ire")
+        assert lexicon.count_suffix("faire") == 3
+        assert lexicon.endings(2) == {"re", "er"}
+
+    def test_trie_pickle_roundtrip(self):
+        trie = VerbTrie(["b", "ab", "abc"])
+        clone = pickle.loads(pickle.dumps(trie))
+        assert clone.complete("a") == ["ab", "abc"]
+        assert "abc" in clone
+
+    def test_conjug_manager_lexicon(self):
+        cm = ConjugManager(language="fr")
+        assert len(cm.lexicon) == len(cm.verbs)
+        assert all(verb.startswith("reco") for verb in cm.autocomplete("reco", 5))
+        assert cm.longest_known_suffix("redéfaire") == "redéfaire"
+        assert cm.is_valid_verb("parler")
+
+    @pytest.mark.parametrize("language", ["fr", "en", "es", "it", "pt", "ro"])
+    def test_allowed_endings_use_first_word(self, language, monkeypatch):
+        # Only the verbs are needed; not every conjugation file is shipped.
+        monkeypatch.setattr(ConjugManager, "_load_conjugations", lambda self, path: None)
+        cm = ConjugManager(language=language)
+
+        expected = set()
+        if language != "en":
+            expected = {verb.split(" ")[0][-2:] for verb in cm.verbs if len(verb) >= 2}
+        assert cm._detect_allowed_endings() == expected
+        assert "c)" not in cm._detect_allowed_endings()
+
+
+class TestFuzzyLookup:
+
+    def test_edit_distance(self):
+        assert edit_distance("kitten", "sitting") == 3
+        assert edit_distance("parelr", "parler") == 1
+        assert edit_distance("abcdef", "a", max_distance=2) == 3
+
+    def test_index_matches_brute_force(self):
+        words = ["aller", "parler", "manger", "mander", "finir", "être"]
+        index = FuzzyIndex(words, max_distance=2)
+        for query in ["manjer", "etre", "aler", "xyz"]:
+            expected = sorted(
+                (w, edit_distance(query, w)) for w in words if edit_distance(query, w) <= 2
+            )
+            assert sorted(index.lookup(query, limit=None)) == expected
+
+    def test_batch_and_distance_bound(self):
+        index = FuzzyIndex(["aller", "finir"], max_distance=1)
+        assert index.lookup_batch(["aler", "fnir", "zzzzz"]) == [
+            [("aller", 1)], [("finir", 1)], []
+        ]
+        with pytest.raises(ValueError):
+            index.lookup("aler", max_distance=2)
+        assert pickle.loads(pickle.dumps(index)).lookup("aler") == [("aller", 1)]
+
+    def test_conjugator_suggest(self):
+        suggestions = TestConjugator.conjugator.suggest("Manjer", max_distance=1)
+        assert ("manger", 1) in suggestions
+        assert len(TestConjugator.conjugator.suggest(["etre", "aler"], limit=3)) == 2
+
+
+class TestNormalization:
+
+    def test_normalize_verb(self):
+        from mlconjug3.lexicon import normalize_verb
+        assert normalize_verb("E\u0302tre") == "être"
+        assert normalize_verb("Être", strip_accents=True) == "etre"
+
+    def test_resolve_normalized(self):
+        cm = ConjugManager(language="fr")
+        assert cm.resolve_normalized("ÊTRE") == ("être",)
+        assert "être" in cm.resolve_normalized("etre", strip_accents=True)
+
+    def test_conjugator_policies(self):
+        class M:
+            def predict(self, x):
+                raise AssertionError("model must not be queried")
+
+        casefold = Conjugator(language="fr", model=M(), normalization="casefold")
+        assert casefold.conjugate("E\u0302tre").name == "être"
+        assert casefold.conjugate("Être").source == "dictionary"
+
+        accents = Conjugator(language="fr", model=M(), normalization="accents")
+        assert accents.conjugate("etre").name == "être"
+
+        with pytest.raises(ValueError):
+            Conjugator(language="fr", normalization="phonetic")
+
+
+class TestSuffixResolution:
+
+    def test_prefixed_verb_reuses_known_template(self):
+        class M:
+            def predict(self, x):
+                raise AssertionError("model must not be queried")
+
+        c = Conjugator(language="fr", model=M(), suffix_resolution=True)
+        c.conjug_manager.verbs.pop("redéfaire", None)
+
+        result = c.conjugate("redéfaire")
+        assert result.source == "suffix"
+        assert result.verb_info.template == c.conjug_manager.verbs["défaire"]["template"]
+        assert "redéfais" in result
+
+    def test_short_suffix_falls_back_to_model(self):
+        class M:
+            def predict(self, x):
+                return ["A:1"]
+
+        c = Conjugator(language="fr", model=M(), suffix_resolution=True, min_suffix_length=20)
+        c.conjug_manager.conjugations["A:1"] = {"indicative": {"present": []}}
+
+        result = c.conjugate("cacater")
+        assert result.source == "model"
+        assert result.predicted
+
+    def test_dictionary_source(self):
+        assert TestConjugator.conjugator.conjugate("aller").source == "dictionary"
+
+
 class TestConjugatorMLBranches:
 
     def test_int_prediction_branch(self):
@@ -219,6 +470,500 @@ class TestConjugatorMLBranches:
         result = c.conjugate("aller")
         assert result is not None
 
+    def test_conjugate_batch_matches_conjugate(self):
+        c = Conjugator(language="fr")
+        verbs = ["parler", "blorpiner", "zatrouver", "choubidoubir", "aller"]
+
+        batch = c.conjugate_batch(verbs)
+
+        assert [verb.name for verb in batch] == verbs
+        for verb, conjugated in zip(verbs, batch):
+            expected = c._conjugate(verb)
+            assert conjugated.verb_info == expected.verb_info
+            assert conjugated.confidence_score == expected.confidence_score
+            assert conjugated.conjug_info == expected.conjug_info
+
+
+    def test_conjugate_batch_caches_and_reports_predictions(self, monkeypatch):
+        c = Conjugator(language="fr")
+        metrics = ConjugatorMetrics()
+        metrics.attach(c)
+        calls = []
+        predict = Model.predict
+
+        def counting_predict(self, verbs):
+            calls.append(list(verbs))
+            return predict(self, verbs)
+
+        monkeypatch.setattr(Model, "predict", counting_predict)
+
+        results = c.conjugate_batch(["manger", "blorpiser", "zzfiner", "finir", "blorpiser"])
+        assert [verb.source for verb in results] == ["dictionary", "model", "model", "dictionary", "model"]
+        assert calls == [["blorpiser", "zzfiner"]]
+
+        c.conjugate_batch(["blorpiser"] * 50)
+        assert len(calls) == 1
+
+        assert metrics.fallback_ratio("fr") == 53 / 55
+        assert "mlconjug3_confidence_score_count{language=\"fr\"} 53" in metrics.render()
+
+
+class TestInstrumentation:
+    def test_records_stages_paths_and_cache_hits(self):
+        conjugator = Conjugator("fr")
+        ended = []
+
+        with instrument(conjugator, Instrumentation(on_end=ended.append)) as instrumentation:
+            conjugator.conjugate("manger")
+            conjugator.conjugate("manger")
+            conjugator.conjugate("blorpiner")
+
+        assert conjugator.instrumentation is None
+        summary = instrumentation.summary()
+        assert summary["calls"] == 3
+        assert summary["paths"] == {"dictionary": 2, "model": 1}
+        assert summary["cache_hits"] == 1
+        assert {"resolve", "lookup", "conjug_info", "predict", "verb"} <= set(summary["stages"])
+        assert [timer.path for timer in ended] == ["dictionary", "dictionary", "model"]
+        assert ended[0].stages and not ended[1].stages
+
+    def test_cache_hits_of_other_threads(self, monkeypatch):
+        conjugator = Conjugator("fr")
+        predicting, release = threading.Event(), threading.Event()
+        predict = Model.predict
+
+        def blocking_predict(self, verbs):
+            predicting.set()
+            release.wait(10)
+            return predict(self, verbs)
+
+        monkeypatch.setattr(Model, "predict", blocking_predict)
+        ended = []
+
+        with instrument(conjugator, Instrumentation(on_end=ended.append)) as instrumentation:
+            conjugator.conjugate("manger")
+            miss = threading.Thread(target=conjugator.conjugate, args=("blorpiner",))
+            miss.start()
+            assert predicting.wait(10)
+
+            # Cache hits of this thread while the other one is predicting.
+            hits = threading.Thread(target=lambda: [conjugator.conjugate("manger") for _ in range(3)])
+            hits.start()
+            hits.join()
+            release.set()
+            miss.join()
+
+        assert instrumentation.summary()["cache_hits"] == 3
+        assert [(timer.verb, timer.cache_hit) for timer in ended] == [
+            ("manger", False), ("manger", True), ("manger", True), ("manger", True), ("blorpiner", False)
+        ]
+
+    def test_histogram(self):
+        histogram = Histogram(buckets=(1, 10, 100))
+        for value in (0.5, 5, 50, 500):
+            histogram.observe(value)
+        assert histogram.counts == [1, 1, 1, 1]
+        assert histogram.quantile(0.5) == 10
+        assert histogram.summary()["max"] == 500
+
+
+class TestMetrics:
+    def test_render_and_endpoint(self):
+        metrics = ConjugatorMetrics()
+        conjugator = metrics.attach(Conjugator("fr"))
+        conjugator.conjugate("parler")
+        conjugator.conjugate("blorpiner")
+
+        assert metrics.fallback_ratio("fr") == pytest.approx(0.5)
+        text = metrics.render()
+        assert 'mlconjug3_conjugations_total{language="fr",path="model"} 1' in text
+        assert 'mlconjug3_cache_misses_total{language="fr"} 2' in text
+        assert 'mlconjug3_confidence_score_count{language="fr"} 1' in text
+        assert 'mlconjug3_model_load_seconds{language="fr"}' in text
+        assert "mlconjug3_queue_depth 0" in text
+
+        server = metrics.start_http_server(port=0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert b"mlconjug3_model_fallback_ratio" in response.read()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestProfiling:
+    def test_slow_call_log(self, caplog):
+        conjugator = Conjugator("fr")
+        slow_log = SlowCallLog(threshold=0.0, stack_limit=5)
+        slow_log.attach(conjugator)
+
+        with caplog.at_level("WARNING"):
+            conjugator.conjugate("blorpiner")
+
+        entry = slow_log.entries[-1]
+        assert (entry["verb"], entry["path"]) == ("blorpiner", "model")
+        assert "predict" in entry["stages"] and 0 < len(entry["stack"]) <= 5
+        assert "Slow conjugation of 'blorpiner'" in caplog.text
+
+    def test_cprofile_windows(self, tmp_path):
+        conjugator = Conjugator("fr")
+        profiler = CallProfiler(tmp_path, window=2, max_windows=1)
+        profiler.attach(conjugator)
+
+        for verb in ("parler", "blorpiner", "finir"):
+            conjugator.conjugate(verb)
+
+        assert len(profiler.files) == 1
+        assert pstats.Stats(profiler.files[0]).total_calls > 0
+
+    def test_sampling_window(self, tmp_path):
+        conjugator = Conjugator("fr")
+        profiler = CallProfiler(tmp_path, window=5, mode="sampling", interval=0.0005)
+        profiler.attach(conjugator)
+
+        conjugator.conjugate("blorpiner")
+        path = profiler.flush()
+        assert path.endswith(".folded") and os.path.isfile(path)
+
+        with pytest.raises(ValueError):
+            CallProfiler(tmp_path, mode="perf")
+
+
+@pytest.fixture(scope="module")
+def server():
+    service = ConjugationService(["fr", "en"], max_batch=3)
+    server = ConjugationServer(("127.0.0.1", 0), service, threads=2, max_body=512)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestServer:
+    def request(self, connection, method, path, document=None):
+        body = None if document is None else json.dumps(document)
+        connection.request(method, path, body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_endpoints_over_keepalive(self, server):
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+
+        assert self.request(connection, "GET", "/healthz") == (200, {"status": "ok"})
+        status, ready = self.request(connection, "GET", "/readyz")
+        assert status == 200 and ready["languages"] == ["fr", "en"]
+
+        status, result = self.request(connection, "GET", "/v1/conjugate?verb=manger")
+        assert status == 200 and result["source"] == "dictionary"
+
+        status, result = self.request(
+            connection, "POST", "/v1/conjugate", {"verb": "walk", "language": "en"}
+        )
+        assert status == 200 and result["infinitive"] == "walk"
+
+        status, result = self.request(
+            connection,
+            "POST",
+            "/v1/conjugate/batch",
+            {"verbs": ["parler", "blorpiner"], "language": "fr"},
+        )
+        assert status == 200
+        assert [item["source"] for item in result["results"]] == ["dictionary", "model"]
+
+        assert self.request(connection, "GET", "/v1/conjugate?verb=manger&language=xx")[0] == 400
+        assert self.request(connection, "POST", "/v1/conjugate/batch", {"verbs": ["a"] * 4})[0] == 413
+        assert self.request(connection, "GET", "/missing")[0] == 404
+        connection.close()
+
+    def test_idle_keepalive_connections_do_not_hold_threads(self):
+        service = ConjugationService(["fr"])
+        server = ConjugationServer(("127.0.0.1", 0), service, threads=2, keepalive=5)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_address[1]
+        try:
+            idle = []
+            for _client in range(4):
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                assert self.request(connection, "GET", "/healthz")[0] == 200
+                idle.append(connection)
+
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            start = time.perf_counter()
+            status, result = self.request(connection, "GET", "/v1/conjugate?verb=manger")
+            assert status == 200 and result["source"] == "dictionary"
+            assert time.perf_counter() - start < 2
+
+            # The idle connections are still usable.
+            for connection in idle:
+                assert self.request(connection, "GET", "/healthz")[0] == 200
+                connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_pipelined_requests(self, server):
+        with socket.create_connection(("127.0.0.1", server.server_address[1]), timeout=30) as client:
+            client.sendall(
+                b"GET /healthz HTTP/1.1\r\nHost: x\r\n\r\n"
+                b"GET /v1/conjugate?verb=finir HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+            )
+            data = b""
+            while chunk := client.recv(65536):
+                data += chunk
+
+        assert data.count(b"HTTP/1.1 200") == 2
+        assert b'"finir"' in data
+
+    def test_request_size_limit(self, server):
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+        status, error = self.request(
+            connection, "POST", "/v1/conjugate/batch", {"verbs": ["x" * 1000]}
+        )
+        assert status == 413 and "too large" in error["error"]
+        connection.close()
+
+    def test_field_types(self, server):
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+        for path, document in [
+            ("/v1/conjugate/batch", {"verbs": ["manger"], "language": 1}),
+            ("/v1/conjugate/batch", {"verbs": ["manger"], "language": ["fr"]}),
+            ("/v1/conjugate/batch", {"verbs": ["manger"], "subject": ["abbrev"]}),
+            ("/v1/conjugate", {"verb": "manger", "language": {"fr": 1}}),
+        ]:
+            status, error = self.request(connection, "POST", path, document)
+            assert status == 400 and "must be a string" in error["error"]
+        connection.close()
+
+    def test_cli_serve_rejects_unknown_language(self):
+        runner = CliRunner()
+        result = runner.invoke(cli.serve, ['-l', 'xx'])
+        assert result.exit_code == 2
+
+    def test_preforked_workers(self):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        process = subprocess.Popen(
+            [
+                sys.executable, "-c", "from mlconjug3.cli import serve; serve()",
+                "-l", "en", "-w", "2", "-p", str(port),
+            ]
+        )
+        try:
+            url = f"http://127.0.0.1:{port}"
+            for _attempt in range(120):
+                try:
+                    with urllib.request.urlopen(f"{url}/readyz", timeout=5) as response:
+                        assert response.status == 200
+                        break
+                except OSError:
+                    time.sleep(0.5)
+            else:
+                pytest.fail("The server did not become ready.")
+
+            with urllib.request.urlopen(f"{url}/v1/conjugate?verb=have&language=en") as response:
+                assert json.loads(response.read())["infinitive"] == "have"
+        finally:
+            process.terminate()
+            assert process.wait(timeout=30) == 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_preforked_workers_failing_at_start(self):
+        code = (
+            "import os, mlconjug3.server as server\n"
+            "def crash(server):\n"
+            "    print('start', flush=True)\n"
+            "    raise RuntimeError('boom')\n"
+            "server._run_worker = crash\n"
+            "try:\n"
+            "    server.serve(['en'], port=0, workers=2)\n"
+            "except RuntimeError:\n"
+            "    os._exit(3)\n"
+        )
+        process = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=120
+        )
+
+        assert process.returncode == 3
+        # Two initial workers and one restart per failure before the last;
+        # the last restarted worker may be stopped before it starts.
+        assert MAX_FAILED_STARTS <= process.stdout.count("start") <= MAX_FAILED_STARTS + 1
+
+
+class TestBenchmarkComparison:
+
+    def test_compare_skips_counts_and_noisy_statistics(self):
+        baseline = {
+            "fr": {
+                "construction_time": {"median": 0.2, "mean": 0.2},
+                "extraction_throughput": 1000.0,
+                "accuracy": 0.9,
+                "n_verbs": 100,
+                "size_bytes": 10,
+            },
+            "environment": {"cpu_count": 4},
+        }
+        results = {
+            "fr": {
+                "construction_time": {"median": 2.0, "mean": 2.0},
+                "extraction_throughput": 100.0,
+                "accuracy": 0.89,
+                "n_verbs": 1000,
+                "size_bytes": 100,
+            },
+            "environment": {"cpu_count": 8},
+        }
+
+        comparison = {entry["metric"]: entry for entry in compare(results, baseline)}
+
+        assert sorted(comparison) == [
+            "fr.accuracy", "fr.construction_time.median", "fr.extraction_throughput",
+        ]
+        assert comparison["fr.construction_time.median"]["regression"]
+        assert comparison["fr.extraction_throughput"]["regression"]
+        assert not comparison["fr.accuracy"]["regression"]
+
+
+class TestPredictionCache:
+
+    def test_conjugator_reuses_cached_predictions(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache" / "predictions.sqlite3"
+        verbs = ["blorpiner", "zatrouver"]
+
+        first = Conjugator("fr", prediction_cache=PredictionCache(path))
+        expected = first.conjugate_batch(verbs)
+
+        def predict(self, verbs):
+            raise AssertionError("the model must not be called")
+
+        second = Conjugator("fr", prediction_cache=PredictionCache(path))
+        monkeypatch.setattr(Model, "predict", predict)
+
+        assert second.prediction_cache.hits == 0
+        result = second.conjugate("blorpiner")
+        assert result.source == "model"
+        assert result.conjug_info == expected[0].conjug_info
+        assert result.confidence_score == expected[0].confidence_score
+        assert second.conjugate_batch(verbs)[1].conjug_info == expected[1].conjug_info
+        # "blorpiner" is then served from the in-memory predictions.
+        assert second.prediction_cache.hits == 2
+
+    def test_keyed_by_model_and_language(self, tmp_path):
+        cache = PredictionCache(tmp_path / "predictions.sqlite3")
+        cache.put_many("model-a", "fr", [("blorpiner", "aim:er", 0.9), ("zorp", None, None)])
+
+        assert cache.get_many("model-a", "fr", ["blorpiner", "zorp", "x"]) == {
+            "blorpiner": ("aim:er", 0.9),
+            "zorp": (None, None),
+        }
+        assert cache.get_many("model-b", "fr", ["blorpiner"]) == {}
+        assert cache.get_many("model-a", "en", ["blorpiner"]) == {}
+        assert cache.misses == 3
+
+        model = Model(language="fr")
+        assert PredictionCache.model_hash(model, ["a"]) != PredictionCache.model_hash(model, ["b"])
+
+    def test_rekeyed_when_model_changes_in_place(self, tmp_path):
+        m = Model(language="fr")
+        m.train(["aimer", "parler", "finir", "choisir", "vendre", "rendre"], [0, 0, 1, 1, 2, 2])
+        conjugator = Conjugator("fr", model=m, prediction_cache=PredictionCache(tmp_path / "p.sqlite3"))
+
+        conjugator.conjugate("blorpiner")
+        model_hash = conjugator._model_hash
+        m.version += 1
+        assert PredictionCache.model_hash(m, conjugator.conjug_manager.templates) == model_hash
+
+        m.partial_fit(["blorpiner"], [2], n_epochs=20)
+        conjugator.conjugate("blorpiner")
+        assert conjugator._model_hash != model_hash
+        assert conjugator.prediction_cache.misses == 2
+
+    def test_model_hashed_once_per_version(self, tmp_path, monkeypatch):
+        m = Model(language="fr")
+        m.train(["aimer", "parler", "finir", "choisir", "vendre", "rendre"], [0, 0, 1, 1, 2, 2])
+        model_hash = PredictionCache.model_hash
+        hashed = []
+
+        def counting_hash(model, templates=None):
+            hashed.append(model)
+            return model_hash(model, templates)
+
+        monkeypatch.setattr(PredictionCache, "model_hash", staticmethod(counting_hash))
+        cache = PredictionCache(tmp_path / "p.sqlite3")
+        first = Conjugator("fr", model=m, prediction_cache=cache)
+        second = Conjugator("fr", model=m, prediction_cache=cache)
+        first.conjugate_batch(["blorpiner", "zatrouver"])
+        second.conjugate_batch(["zorpir"])
+        pickle.loads(pickle.dumps(second)).conjugate("blorpiner")
+        assert len(hashed) == 1
+
+        m.partial_fit(["blorpiner"], [2])
+        first.conjugate("zorpir")
+        second.conjugate("zorpir")
+        assert len(hashed) == 2
+        assert first._model_hash == second._model_hash
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = PredictionCache(tmp_path / "predictions.sqlite3", max_entries=10, touch_interval=0)
+        cache.put_many("m", "fr", [(f"verb{i}", "aim:er", 1.0) for i in range(10)])
+        cache.get_many("m", "fr", ["verb0"])
+
+        cache.put_many("m", "fr", [("verb10", "aim:er", 1.0)])
+
+        assert len(cache) == 9
+        remaining = cache.get_many("m", "fr", [f"verb{i}" for i in range(11)])
+        assert sorted(remaining) == sorted(["verb0", "verb10"] + [f"verb{i}" for i in range(3, 10)])
+
+    def test_shared_across_processes(self, tmp_path):
+        cache = PredictionCache(tmp_path / "predictions.sqlite3")
+        cache.put_many("m", "fr", [("blorpiner", "aim:er", 0.5)])
+
+        copy = pickle.loads(pickle.dumps(cache))
+        assert copy.get_many("m", "fr", ["blorpiner"]) == {"blorpiner": ("aim:er", 0.5)}
+
+        code = (
+            "import sys; from mlconjug3.utils import PredictionCache; "
+            "PredictionCache(sys.argv[1]).put_many('m', 'fr', [('zatrouver', 'aim:er', 0.7)])"
+        )
+        subprocess.run([sys.executable, "-c", code, cache.path], check=True)
+
+        assert cache.get_many("m", "fr", ["zatrouver"]) == {"zatrouver": ("aim:er", 0.7)}
+
+
+class TestCoprocess:
+    def test_handle_groups_and_errors(self, server):
+        coprocess = Coprocess(server.service)
+        responses = coprocess.handle([
+            b'{"id": 1, "verb": "parler", "language": "fr"}',
+            b'{"id": 2, "verb": "blorpiner", "language": "fr", "options": {"conjugations": false}}',
+            b'{"id": 3, "verbs": ["walk"], "language": "en"}',
+            b'not json',
+            b'{"id": 5, "op": "ping"}',
+            b'{"id": 6, "verb": "walk", "language": "xx"}',
+        ])
+
+        assert [response["id"] for response in responses] == [1, 2, 3, None, 5, 6]
+        assert responses[0]["result"]["source"] == "dictionary"
+        assert responses[1]["result"]["source"] == "model"
+        assert "conjugations" not in responses[1]["result"]
+        assert responses[2]["results"][0]["infinitive"] == "walk"
+        assert responses[3]["status"] == 400
+        assert responses[4]["languages"] == ["fr", "en"]
+        assert responses[5]["status"] == 400
+
+    def test_run_over_streams(self, server):
+        requests = b'{"id": "a", "verb": "finir"}\n\n{"id": "b", "op": "ping"}\n'
+        output = io.BytesIO()
+        Coprocess(server.service, io.BytesIO(requests), output).run()
+
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert lines[0] == {"event": "ready", "languages": ["fr", "en"]}
+        assert [line["id"] for line in lines[1:]] == ["a", "b"]
+
 
 class TestModelCoverage:
 
@@ -277,6 +1022,147 @@ class TestModelCoverage:
         with pytest.raises(AttributeError):
             m.predict_proba(["aller"])
 
+    def test_constrained_prediction_respects_endings(self):
+        templates = ["aim:er", "fin:ir", "v:endre"]
+        m = Model(language="fr")
+        m.train(["aimer", "parler", "finir", "choisir", "vendre", "rendre"], [0, 0, 1, 1, 2, 2])
+        m.constrain_to_templates(templates)
+
+        assert list(m.predict(["grandir", "tendre", "xyz"]))[:2] == [1, 2]
+        proba = m.predict_proba(["grandir"])
+        assert proba.shape == (1, 3)
+        assert proba[0, 0] == 0 and proba[0, 2] == 0
+        assert abs(proba.sum() - 1) < 1e-9
+
+        m.constrain_to_templates(None)
+        assert len(m.predict(["grandir"])) == 1
+
+    def test_constrained_binary_classifier(self):
+        m = Model(language="fr")
+        m.train(["aimer", "parler", "finir", "choisir"], [0, 0, 1, 1])
+        verbs = ["grandir", "chanter", "xyz", "zorp"]
+        expected = m.predict_proba(verbs)
+
+        m.constrain_to_templates(["aim:er", "fin:ir"])
+
+        assert list(m.predict(verbs))[:2] == [1, 0]
+        assert list(m.predict(verbs[2:])) == list(m.pipeline.predict(verbs[2:]))
+        proba = m.predict_proba(verbs)
+        assert proba[:2].tolist() == [[0, 1], [1, 0]]
+        assert np.allclose(proba[2:], expected[2:])
+
+    def test_constrained_conjugator_leaves_shared_model_unchanged(self):
+        m = Model(language="fr")
+        m.train(["aimer", "parler", "finir", "choisir"], [0, 0, 1, 1])
+
+        constrained = Conjugator("fr", model=m, constrained_prediction=True)
+        plain = Conjugator("fr", model=m)
+
+        assert constrained.model is not m
+        assert constrained.model._ending_index is not None
+        assert m._ending_index is None
+        assert plain.model is m
+        assert constrained.model.pipeline is m.pipeline
+
+    def test_constrained_requires_linear_classifier(self):
+        with pytest.raises(ValueError):
+            Model(language="fr").constrain_to_templates(["aim:er"])
+
+    def test_partial_fit_registers_new_classes_and_features(self):
+        m = Model(language="fr")
+        m.train(["aimer", "parler", "finir", "choisir"], [0, 0, 2, 2])
+        n_features = len(m.pipeline.named_steps["vectorizer"].vocabulary_)
+
+        m.partial_fit(["vendre", "rendre", "tendre"], [1, 1, 1], n_epochs=20)
+        classifier = m.pipeline.named_steps["classifier"]
+
+        assert list(classifier.classes_) == [0, 1, 2]
+        assert classifier.coef_.shape == (3, len(m.pipeline.named_steps["vectorizer"].vocabulary_))
+        assert len(m.pipeline.named_steps["vectorizer"].vocabulary_) > n_features
+        assert list(m.predict(["vendre"])) == [1]
+
+    def test_partial_fit_frozen_vocabulary(self):
+        m = Model(language="fr")
+        m.train(["aimer", "parler", "finir", "choisir"], [0, 0, 1, 1])
+        vocabulary = dict(m.pipeline.named_steps["vectorizer"].vocabulary_)
+
+        m.partial_fit(["vendre"], [1], extend_vocabulary=False)
+        assert m.pipeline.named_steps["vectorizer"].vocabulary_ == vocabulary
+
+        with pytest.raises(ValueError):
+            m.partial_fit(["vendre"], [1], n_epochs=0)
+
+    def test_partial_fit_untrained_model(self):
+        m = Model(language="fr")
+        m.partial_fit(["aimer", "finir", "vendre"], [0, 1, 2], n_epochs=5)
+        assert len(m.predict(["parler"])) == 1
+
+    def test_relabel_keeps_predictions(self):
+        m = Model(language="fr")
+        X = ["aimer", "parler", "finir", "choisir", "vendre", "rendre"]
+        m.train(X, [0, 0, 1, 1, 2, 2])
+        before = m.predict(X)
+
+        m.relabel([3, 0, 1])
+        assert list(m.pipeline.named_steps["classifier"].classes_) == [0, 1, 3]
+        assert list(m.predict(X)) == [[3, 0, 1][label] for label in before]
+
+    def test_hashing_mode(self):
+        m = Model(language="fr", n_features=2 ** 10)
+        X = ["aimer", "parler", "finir", "choisir", "vendre", "rendre"]
+        m.train(X, [0, 0, 1, 1, 2, 2])
+
+        assert not hasattr(m.pipeline.named_steps["vectorizer"], "vocabulary_")
+        assert m.pipeline.named_steps["classifier"].coef_.shape == (3, 2 ** 10)
+        assert len(m.predict(["grandir"])) == 1
+
+        m.partial_fit(["battre"], [3], n_epochs=5)
+        assert m.pipeline.named_steps["classifier"].coef_.shape == (4, 2 ** 10)
+
+    def test_prune_keeps_predictions(self):
+        m = Model(language="fr")
+        X = ["aimer", "parler", "finir", "choisir", "vendre", "rendre"]
+        m.train(X, [0, 0, 1, 1, 2, 2])
+        before = m.predict(X + ["grandir", "tendre"])
+        n_features = m.pipeline.named_steps["classifier"].coef_.shape[1]
+
+        m.prune(threshold=0.0)
+        assert list(m.predict(X + ["grandir", "tendre"])) == list(before)
+
+        weights = np.abs(m.pipeline.named_steps["classifier"].coef_).max(axis=0)
+        m.prune(threshold=np.median(weights))
+        vocabulary = m.pipeline.named_steps["vectorizer"].vocabulary_
+        coef = m.pipeline.named_steps["classifier"].coef_
+
+        assert coef.shape[1] == len(vocabulary) < n_features
+        assert sorted(vocabulary.values()) == list(range(len(vocabulary)))
+
+    def test_prune_requires_vocabulary(self):
+        m = Model(language="fr", n_features=2 ** 8)
+        m.train(["aimer", "finir"], [0, 1])
+        with pytest.raises(ValueError):
+            m.prune()
+
+    def test_parallel_training_matches_serial(self):
+        X = ["aimer", "parler", "finir", "choisir", "vendre", "rendre"]
+        y = [0, 0, 1, 1, 2, 2]
+        serial = Model(language="fr").train(X, y)
+        parallel = Model(language="fr", n_jobs=2).train(X, y)
+
+        assert parallel.n_jobs == 2
+        assert np.array_equal(
+            serial.pipeline.named_steps["classifier"].coef_,
+            parallel.pipeline.named_steps["classifier"].coef_,
+        )
+
+    def test_n_jobs_requires_support(self):
+        from sklearn.naive_bayes import MultinomialNB
+
+        m = Model(language="fr", classifier=MultinomialNB())
+        assert m.n_jobs is None
+        with pytest.raises(ValueError):
+            m.n_jobs = 2
+
     def test_language_none_branch(self):
         m = Model(language=None)
 
@@ -397,6 +1283,97 @@ class DummyTrainModel:
         return [0 for _ in X]
 
 
+class TestCrossValidation:
+
+    def make_dataset(self):
+        endings = {"er": "aim:er", "ir": "fin:ir", "re": "vend:re"}
+        stems = ["ch", "bl", "pr", "tr", "gl", "fl", "cr", "dr"]
+        return DataSet({
+            f"{stem}a{ending}": {"template": template}
+            for ending, template in endings.items()
+            for stem in stems
+        } | {"aller": {"template": ":aller"}})
+
+    def test_kfold_indices_are_stratified(self):
+        ds = self.make_dataset()
+        folds = list(ds.kfold_indices(n_splits=4, n_repeats=2))
+        assert len(folds) == 8
+
+        aller = ds.verbs_list.index("aller")
+        for train, test in folds[:4]:
+            assert aller in train and aller not in test
+            assert sorted(np.bincount(ds.templates_list[test], minlength=4)[1:]) == [2, 2, 2]
+
+        tested = np.concatenate([test for _, test in folds[:4]])
+        assert sorted(tested) == sorted(set(range(len(ds.verbs_list))) - {aller})
+
+    def test_kfold_invalid(self):
+        with pytest.raises(ValueError):
+            next(self.make_dataset().kfold_indices(n_splits=1))
+
+    def test_cross_validate_parallel(self, tmp_path):
+        trainer = ConjugatorTrainer(
+            lang="fr",
+            output_folder=str(tmp_path),
+            split_proportion=0.5,
+            dataset=self.make_dataset(),
+            model=Model(language="fr"),
+        )
+        report = trainer.cross_validate(n_splits=4, n_jobs=2)
+
+        assert len(report["folds"]) == 4
+        assert report["folds"][3]["fold"] == 3
+        assert 0.0 <= report["mean"] <= 1.0
+
+    def test_cross_validate_leaves_model_unchanged(self, tmp_path):
+        trainer = ConjugatorTrainer(
+            lang="fr",
+            output_folder=str(tmp_path),
+            split_proportion=0.5,
+            dataset=self.make_dataset(),
+            model=Model(language="fr"),
+        )
+        trainer.train()
+        coef = trainer.model.pipeline.steps[-1][1].coef_
+        trainer.prune(threshold=float(np.median(np.abs(coef).max(axis=0))))
+        vectorizer = trainer.model.pipeline.steps[0][1]
+        vocabulary = dict(vectorizer.vocabulary_)
+        predictions = list(trainer.model.predict(trainer.dataset.verbs_list))
+
+        trainer.cross_validate(n_splits=4)
+
+        assert vectorizer.vocabulary_ == vocabulary
+        assert list(trainer.model.predict(trainer.dataset.verbs_list)) == predictions
+
+
+class TestFeatureCache:
+
+    def test_train_reuses_cached_matrix(self, tmp_path):
+        X = ["aimer", "parler", "finir", "choisir"]
+        y = [0, 0, 1, 1]
+        cache = FeatureCache(tmp_path / "features")
+
+        first = Model(language="fr", feature_cache=cache).train(X, y)
+        key = cache.key(X, "fr", first.pipeline.steps[0][1])
+        assert key in cache
+
+        second = Model(language="fr", feature_cache=cache)
+        second.pipeline.steps[0][1].fit_transform = None  # must not be called
+        second.train(X, y)
+
+        assert second.pipeline.steps[0][1].vocabulary_ == first.pipeline.steps[0][1].vocabulary_
+        assert list(second.predict(["grandir"])) == list(first.predict(["grandir"]))
+
+    def test_key_depends_on_language_and_samples(self, tmp_path):
+        cache = FeatureCache(tmp_path)
+        vectorizer = Model(language="fr").pipeline.steps[0][1]
+        key = cache.key(["aimer"], "fr", vectorizer)
+
+        assert key == cache.key(["aimer"], "fr", Model(language="fr").pipeline.steps[0][1])
+        assert key != cache.key(["aimer"], "it", vectorizer)
+        assert key != cache.key(["aimer", "finir"], "fr", vectorizer)
+
+
 class TestConjugatorTrainerCoverage:
 
     def make_trainer(self, tmp_path):
@@ -439,3 +1416,257 @@ class TestConjugatorTrainerCoverage:
             obj = pickle.load(f)
 
         assert obj is not None
+
+    def test_package(self, tmp_path):
+        trainer, _, _ = self.make_trainer(tmp_path / "models")
+        path = trainer.package()
+
+        assert path == os.path.join(tmp_path, "models", "trained_model-fr-final.zip")
+        with ZipFile(path) as archive:
+            assert archive.namelist() == ["trained_model-fr-final.pickle"]
+
+
+class TestIncrementalUpdate:
+
+    def test_update_with_new_template(self, tmp_path):
+        verbs = {
+            "aimer": {"template": "aim:er"}, "parler": {"template": "aim:er"},
+            "chanter": {"template": "aim:er"}, "finir": {"template": "fin:ir"},
+            "choisir": {"template": "fin:ir"}, "grandir": {"template": "fin:ir"},
+        }
+        dataset = DataSet(verbs)
+        trainer = ConjugatorTrainer("fr", str(tmp_path), 0.5, dataset, Model(language="fr"))
+        trainer.train()
+
+        summary = trainer.update(
+            {"battre": "b:attre", "abattre": "b:attre", "combattre": "b:attre"},
+            n_epochs=20,
+        )
+
+        assert summary["n_verbs"] == 3
+        assert summary["n_new_templates"] == 1
+        assert trainer.dataset.templates == ["aim:er", "b:attre", "fin:ir"]
+        assert list(trainer.model.predict(["finir", "battre"])) == [2, 1]
+
+        report = trainer.compare_with_retrain()
+        assert report["current"]["updated_accuracy"] == 1.0
+        assert 0 <= report["retrained"]["accuracy"] <= 1
+
+    def test_update_keeps_constraint_and_refreshes_conjugator(self, tmp_path):
+        verbs = {
+            "aimer": {"template": "aim:er"}, "parler": {"template": "aim:er"},
+            "finir": {"template": "fin:ir"}, "choisir": {"template": "fin:ir"},
+            "vendre": {"template": "v:endre"}, "rendre": {"template": "v:endre"},
+        }
+        trainer = ConjugatorTrainer("fr", str(tmp_path), 0.5, DataSet(verbs), Model(language="fr"))
+        trainer.train()
+        trainer.model.constrain_to_templates(trainer.dataset.templates)
+        trainer.conjugator.conjugate("zzgrandir")
+        assert Conjugator._conjugate.cache_info().currsize > 0
+
+        trainer.update({"battre": "b:attre", "combattre": "b:attre"}, n_epochs=20)
+
+        assert trainer.model._templates == ["aim:er", "b:attre", "fin:ir", "v:endre"]
+        assert trainer.model._ending_index is not None
+        assert trainer.conjugator.model is trainer.model
+        assert Conjugator._conjugate.cache_info().currsize == 0
+
+
+class TestEvaluationReport:
+
+    def test_metrics_and_forms(self, tmp_path):
+        from sklearn.metrics import f1_score
+
+        verbs = {
+            "aimer": {"template": "aim:er"}, "parler": {"template": "aim:er"},
+            "manger": {"template": "man:ger"}, "ranger": {"template": "man:ger"},
+            "finir": {"template": "fin:ir"},
+        }
+        dataset = DataSet(verbs)
+        trainer = ConjugatorTrainer("fr", str(tmp_path), 0.5, dataset, DummyTrainModel())
+
+        report = trainer.evaluation_report(batch_size=2)
+        labels = dataset.templates_list
+        predictions = np.zeros(len(labels), dtype=int)
+
+        assert report["n_samples"] == 5
+        assert report["accuracy"] == np.mean(labels == 0)
+        assert report["macro_f1"] == pytest.approx(f1_score(labels, predictions, average="macro"))
+        assert report["per_template"]["aim:er"]["recall"] == 1.0
+        assert report["per_template"]["fin:ir"]["support"] == 1
+
+        forms = report["forms"]
+        assert 0 < forms["accuracy"] < 1
+        assert forms["verb_accuracy"] == report["accuracy"]
+        # manger and ranger share the same template pair and ending.
+        assert forms["n_expanded"] == 2
+
+        assert trainer.evaluation_report(forms=False)["forms"] is None
+
+
+class TestBudgetedTraining:
+    verbs = {
+        "aimer": {"template": "aim:er"}, "parler": {"template": "aim:er"},
+        "chanter": {"template": "aim:er"}, "danser": {"template": "aim:er"},
+        "finir": {"template": "fin:ir"}, "choisir": {"template": "fin:ir"},
+        "grandir": {"template": "fin:ir"}, "bâtir": {"template": "fin:ir"},
+    }
+
+    def make_trainer(self, tmp_path):
+        return ConjugatorTrainer("fr", str(tmp_path), 0.5, DataSet(self.verbs), Model(language="fr"))
+
+    def test_history_and_plateau(self, tmp_path):
+        trainer = self.make_trainer(tmp_path)
+        model, history = trainer.train_with_budget(max_epochs=50, patience=3)
+
+        assert trainer.model is model
+        n_epochs = len(history["epochs"])
+        assert n_epochs == len(history["train_loss"]) == len(history["val_accuracy"])
+        assert history["stop_reason"] in ("plateau", "max_epochs")
+        assert 1 <= history["best_epoch"] <= n_epochs
+        assert history["times"] == sorted(history["times"])
+
+    def test_time_budget_and_warm_start(self, tmp_path):
+        trainer = self.make_trainer(tmp_path)
+        first, _ = trainer.train_with_budget(max_epochs=3)
+        coef = first.pipeline.named_steps["classifier"].coef_.copy()
+
+        model, history = trainer.train_with_budget(warm_start=first, time_budget=0)
+        assert history["stop_reason"] == "time_budget"
+        assert len(history["epochs"]) == 1
+        assert model is not first
+        assert np.array_equal(first.pipeline.named_steps["classifier"].coef_, coef)
+
+    def test_cold_start_leaves_trained_model(self, tmp_path):
+        trainer = self.make_trainer(tmp_path)
+        trainer.train()
+        trained = trainer.model
+        coef = trained.pipeline.named_steps["classifier"].coef_.copy()
+
+        model, _ = trainer.train_with_budget(max_epochs=1)
+        classifier = model.pipeline.named_steps["classifier"]
+
+        assert trainer.model is model and model is not trained
+        assert classifier.t_ == len(trainer.dataset.train_indices) + 1
+        assert np.array_equal(trained.pipeline.named_steps["classifier"].coef_, coef)
+
+    def test_invalid_budget(self, tmp_path):
+        trainer = self.make_trainer(tmp_path)
+        with pytest.raises(ValueError):
+            trainer.train_with_budget(max_epochs=0)
+
+    def test_warm_start_needs_pretrained_templates(self, tmp_path):
+        trainer = self.make_trainer(tmp_path)
+        with pytest.raises(ValueError):
+            trainer.train_with_budget(warm_start=True)
+
+
+class TestPruning:
+
+    def test_trainer_prune_report(self, tmp_path):
+        verbs = {
+            "aimer": {"template": "aim:er"}, "parler": {"template": "aim:er"},
+            "finir": {"template": "fin:ir"}, "choisir": {"template": "fin:ir"},
+            "vendre": {"template": "v:endre"}, "rendre": {"template": "v:endre"},
+        }
+        trainer = ConjugatorTrainer("fr", str(tmp_path), 0.5, DataSet(verbs), Model(language="fr"))
+        trainer.train()
+
+        report = trainer.prune()
+        assert report["after"]["n_features"] <= report["before"]["n_features"]
+        assert report["accuracy_delta"] == 0
+
+        weights = np.abs(trainer.model.pipeline.named_steps["classifier"].coef_).max(axis=0)
+        report = trainer.prune(threshold=np.median(weights))
+        assert report["after"]["n_features"] < report["before"]["n_features"]
+        assert 0 < report["size_reduction"] < 1
+
+        with pytest.raises(ValueError):
+            trainer.prune(threshold=np.inf)
+
+
+class TestHierarchicalClassifier:
+    verbs = {
+        "aimer": {"template": "aim:er"}, "parler": {"template": "aim:er"},
+        "chanter": {"template": "aim:er"}, "manger": {"template": "man:ger"},
+        "ranger": {"template": "man:ger"}, "nager": {"template": "man:ger"},
+        "finir": {"template": "fin:ir"}, "choisir": {"template": "fin:ir"},
+        "grandir": {"template": "fin:ir"}, "venir": {"template": "ven:ir"},
+        "tenir": {"template": "ven:ir"}, "devenir": {"template": "ven:ir"},
+    }
+
+    def test_groups_by_ending(self):
+        dataset = DataSet(self.verbs)
+        classifier = HierarchicalClassifier(dataset.templates, ending_length=2)
+        model = Model(language="fr", classifier=classifier)
+        model.train(dataset.verbs_list, dataset.templates_list)
+
+        assert list(classifier.group_names_) == ["er", "ir"]
+        assert list(model.predict(dataset.verbs_list)) == list(dataset.templates_list)
+
+        proba = model.predict_proba(["rechanter", "obtenir"])
+        assert proba.shape == (2, len(dataset.templates))
+        assert np.allclose(proba.sum(axis=1), 1)
+
+    def test_string_labels_and_single_family(self):
+        model = Model(language="fr", classifier=HierarchicalClassifier())
+        model.train(["aimer", "parler", "finir"], ["aim:er", "aim:er", "aim:er"])
+        assert list(model.predict(["chanter"])) == ["aim:er"]
+        assert model.predict_proba(["chanter"])[0, 0] == 1
+
+    def test_integer_labels_need_templates(self):
+        model = Model(language="fr", classifier=HierarchicalClassifier())
+        with pytest.raises(ValueError):
+            model.train(["aimer", "finir"], [0, 1])
+
+    def test_trainer_fills_templates(self, tmp_path):
+        dataset = DataSet(self.verbs)
+        model = Model(language="fr", classifier=HierarchicalClassifier())
+        trainer = ConjugatorTrainer("fr", str(tmp_path), 0.5, dataset, model)
+        trainer.train()
+
+        assert model.pipeline.named_steps["classifier"].templates == dataset.templates
+        assert list(trainer.predict()) == list(dataset.templates_list)
+
+
+class TestTrainingOrchestrator:
+
+    def test_plan_jobs(self):
+        assert plan_jobs(3, n_jobs=8) == 3
+        assert plan_jobs(3, n_jobs=2) == 2
+        assert 1 <= plan_jobs(6) <= 6
+        assert plan_jobs(6, memory_per_job=2 ** 62) == 1
+
+    def test_resume_skips_packaged_languages(self, tmp_path):
+        (tmp_path / "trained_model-en-final.zip").write_bytes(b"")
+        reports = train_languages(["en"], output_folder=str(tmp_path))
+
+        assert reports["en"]["status"] == "skipped"
+        assert (tmp_path / "training_report.json").exists()
+
+    def test_unknown_language(self, tmp_path):
+        with pytest.raises(ValueError):
+            train_languages(["xx"], output_folder=str(tmp_path))
+
+    def test_train_language(self, tmp_path):
+        report = _train_language("en", str(tmp_path), 0.8, None)
+
+        assert report["status"] == "trained"
+        assert 0.5 < report["accuracy"] <= 1.0
+        assert set(report["times"]) >= {"dataset", "train", "evaluate", "package"}
+
+        with ZipFile(report["path"]) as archive:
+            model = joblib.load(archive.open("trained_model-en-final.pickle"))
+        assert Conjugator("en", model=model).conjugate("blorp")
+
+    def test_train_language_packages_full_model(self, tmp_path):
+        report = _train_language("en", str(tmp_path), 0.8, None)
+        assert report["n_test"] > 0
+
+        with ZipFile(report["path"]) as archive:
+            model = joblib.load(archive.open("trained_model-en-final.pickle"))
+        classifier = model.pipeline.named_steps["classifier"]
+        dataset = DataSet(Verbiste(language="en").verbs)
+
+        assert list(classifier.classes_) == list(range(len(dataset.templates)))
+        assert classifier.t_ == classifier.n_iter_ * len(dataset.verbs_list) + 1
@@ -5,9 +5,9 @@ from joblib import Parallel, delayed
 import joblib
 from zipfile import ZipFile, ZIP_DEFLATED
 from pathlib import Path
-from collections import Counter, defaultdict
+from sklearn.metrics import accuracy_score
 
-from sklearn.metrics import accuracy_score, confusion_matrix
+from mlconjug3.utils.error_analysis import analyze_errors, error_report, export_error_report
 
 np.random.seed(42)
 
@@ -103,40 +103,17 @@ print("\n[6/6] ERROR ANALYSIS (RO + IT)\n")
 
 
 def error_analysis(lang):
-    print("\n==============================")
-    print(f" ERROR ANALYSIS: {lang.upper()}")
-    print("==============================\n")
-
     ds = datasets[lang]
     model = models[lang]
 
     y_true = ds.test_labels
     y_pred = model.predict(ds.test_input)
 
-    acc = accuracy_score(y_true, y_pred)
-    print(f"Accuracy: {acc:.4f}\n")
-
-    # confusion pairs
-    conf = Counter()
-    for t, p in zip(y_true, y_pred):
-        if t != p:
-            conf[(t, p)] += 1
-
-    print("Top confusion pairs:\n")
-    for (t, p), c in conf.most_common(15):
-        print(f"{t} ? {p} : {c}")
-
-    # examples
-    print("\nSample misclassified verbs:\n")
-
-    grouped = defaultdict(list)
-    for verb, t, p in zip(ds.test_input, y_true, y_pred):
-        if t != p:
-            grouped[(t, p)].append(verb)
-
-    for (t, p), verbs in list(grouped.items())[:5]:
-        print(f"\n{t} ? {p} ({len(verbs)} cases)")
-        print("Examples:", verbs[:10])
+    analyze_errors(lang, y_true, y_pred, ds.test_input)
+    export_error_report(
+        error_report(y_true, y_pred, ds.test_input, top_k=None),
+        OUTPUT_DIR / f"error_analysis-{lang}",
+    )
 
 
 error_analysis("ro")